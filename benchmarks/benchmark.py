@@ -0,0 +1,381 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark suite of etacad elements construction and drawing methods.
+
+Each case is measured across scaled parameters (number of bars, slab size, stirrup count, etc.) and reports the best
+time of the repetitions, the peak of allocated memory and the number of entities added to the document.
+
+Usage (from the repository root):
+
+    python -m benchmarks.benchmark
+    python -m benchmarks.benchmark --filter slab --repeat 5
+    python -m benchmarks.benchmark --save baseline.json
+    python -m benchmarks.benchmark --compare baseline.json --threshold 0.2
+"""
+
+# Imports.
+# Local imports.
+from etacad.bar import Bar
+from etacad.beam import Beam
+from etacad.cadtable import CADTable
+from etacad.column import Column
+from etacad.concrete import Concrete
+from etacad.globals import Direction, Orientation
+from etacad.project import Project
+from etacad.slab import Slab
+from etacad.spaced_bars import SpacedBars
+from etacad.stirrup import Stirrup
+
+# External imports.
+import argparse
+import ezdxf
+import json
+import os
+import re
+import sys
+import time
+import tracemalloc
+
+from math import cos, pi, sin
+
+# Cases faster than this time (seconds) are not reported as regressions, their measurements are mostly noise.
+MIN_REGRESSION_TIME = 0.001
+
+
+# Elements builders, one for each element and scale parameter.
+def build_bar(length: float) -> Bar:
+    return Bar(reinforcement_length=length,
+               diameter=0.016,
+               left_anchor=0.3,
+               right_anchor=0.3,
+               mandrel_radius=0.05,
+               bend_longitud=length / 2,
+               bend_angle=45,
+               bend_height=0.3,
+               denomination="1Ø16")
+
+
+def build_spaced_bars(quantity: int) -> SpacedBars:
+    return SpacedBars(reinforcement_length=(quantity - 1) * 0.1,
+                      length=6,
+                      diameter=0.012,
+                      spacing=0.1,
+                      left_anchor=0.2,
+                      right_anchor=0.2,
+                      mandrel_radius=0.02,
+                      description="Ø12/0.10")
+
+
+def build_stirrup(quantity: int) -> Stirrup:
+    return Stirrup(width=0.2,
+                   height=0.4,
+                   diameter=0.008,
+                   reinforcement_length=(quantity - 1) * 0.1,
+                   spacing=0.1,
+                   mandrel_radius_top=0.02,
+                   mandrel_radius_bottom=0.02,
+                   anchor=0.1)
+
+
+def build_concrete(vertices: int) -> Concrete:
+    return Concrete(vertices=[(cos(2 * pi * i / vertices), sin(2 * pi * i / vertices)) for i in range(vertices)],
+                    length=4)
+
+
+def build_beam(length: float) -> Beam:
+    return Beam(width=0.2,
+                height=0.4,
+                length=length,
+                as_sup={0.012: 3},
+                as_right={0.008: 2},
+                as_inf={0.016: 3},
+                as_left={0.008: 2},
+                anchor_sup=0.15,
+                anchor_inf=0.15,
+                cover=0.03,
+                stirrups_db=0.006,
+                stirrups_sep=0.15,
+                stirrups_anchor=0.1,
+                columns=[[0.2, 0.4], [0.2, 0.4]],
+                columns_pos=[0, length - 0.2],
+                nomenclature="B")
+
+
+def build_column(height: float) -> Column:
+    return Column(width=0.2,
+                  depth=0.3,
+                  height=height,
+                  cover=0.03,
+                  as_sup={0.016: 2, 0.012: 2},
+                  as_right={0.012: 2},
+                  as_inf={0.016: 2, 0.012: 2},
+                  as_left={0.012: 2},
+                  stirrups_db=[0.006],
+                  stirrups_anchor=[0.1],
+                  stirrups_sep=[0.1],
+                  stirrups_length=[height - 0.6],
+                  stirrups_x=[0.1],
+                  beams=[[0.2, 0.4]],
+                  beams_pos=[height - 0.4],
+                  beams_symbol=["B1"])
+
+
+def build_slab(size: float) -> Slab:
+    return Slab(length_x=size,
+                length_y=size,
+                thickness=0.18,
+                direction=Direction.HORIZONTAL,
+                orientation=Orientation.BOTTOM,
+                as_sup_x_db=0.008,
+                as_sup_y_db=0.008,
+                as_inf_x_db=0.012,
+                as_inf_y_db=0.012,
+                as_sup_x_sp=0.15,
+                as_sup_y_sp=0.15,
+                as_inf_x_sp=0.15,
+                as_inf_y_sp=0.15,
+                cover=0.025,
+                nomenclature="S",
+                description="SLAB")
+
+
+def build_cadtable(rows: int) -> CADTable:
+    return CADTable(data=[[str(i), "12", "0.15", "10", "4.00", "40.00", "35.52"] for i in range(rows)],
+                    labels=["POSITION", "DIAMETER", "SPACING", "QUANTITY", "LENGTH", "TOTAL LENGTH", "WEIGHT"])
+
+
+def build_project(beams: int) -> Project:
+    project = Project()
+    for i in range(beams):
+        beam = build_beam(length=6)
+        project.add(beam, x=0, y=i * 3)
+        project.add(beam, x=8, y=i * 3, view="draw_transverse", x_section=2)
+
+    return project
+
+
+# Benchmark cases: (name, scale parameter name, scales, builder, action). Actions with None are construction cases.
+CASES = [
+    ("bar.construction", "length", [4, 12], build_bar, None),
+    ("bar.draw_longitudinal", "length", [4, 12], build_bar,
+     lambda element, doc: element.draw_longitudinal(document=doc, x=0, y=0)),
+    ("bar.draw_transverse", "length", [4, 12], build_bar,
+     lambda element, doc: element.draw_transverse(document=doc, x=0, y=0)),
+    ("spaced_bars.construction", "bars", [10, 100, 1000], build_spaced_bars, None),
+    ("spaced_bars.draw_longitudinal", "bars", [10, 100, 1000], build_spaced_bars,
+     lambda element, doc: element.draw_longitudinal(document=doc, x=0, y=0)),
+    ("spaced_bars.draw_longitudinal_batch", "bars", [10, 100, 1000], build_spaced_bars,
+     lambda element, doc: element.draw_longitudinal(document=doc, x=0, y=0, batch=True)),
+    ("spaced_bars.draw_longitudinal_blocks", "bars", [10, 100, 1000], build_spaced_bars,
+     lambda element, doc: element.draw_longitudinal(document=doc, x=0, y=0, as_blocks=True)),
+    ("spaced_bars.draw_transverse", "bars", [10, 100, 1000], build_spaced_bars,
+     lambda element, doc: element.draw_transverse(document=doc, x=0, y=0)),
+    ("spaced_bars.draw_transverse_batch", "bars", [10, 100, 1000], build_spaced_bars,
+     lambda element, doc: element.draw_transverse(document=doc, x=0, y=0, batch=True)),
+    ("stirrup.construction", "stirrups", [10, 100, 1000], build_stirrup, None),
+    ("stirrup.draw_longitudinal", "stirrups", [10, 100, 1000], build_stirrup,
+     lambda element, doc: element.draw_longitudinal(document=doc, x=0, y=0)),
+    ("stirrup.draw_longitudinal_compact", "stirrups", [10, 100, 1000], build_stirrup,
+     lambda element, doc: element.draw_longitudinal(document=doc, x=0, y=0, compact=True)),
+    ("stirrup.draw_transverse", "stirrups", [10, 100, 1000], build_stirrup,
+     lambda element, doc: element.draw_transverse(document=doc, x=0, y=0)),
+    ("concrete.construction", "vertices", [4, 64], build_concrete, None),
+    ("concrete.draw_longitudinal", "vertices", [4, 64], build_concrete,
+     lambda element, doc: element.draw_longitudinal(document=doc, x=0, y=0)),
+    ("concrete.draw_transverse", "vertices", [4, 64], build_concrete,
+     lambda element, doc: element.draw_transverse(document=doc, x=0, y=0)),
+    ("beam.construction", "length", [6, 24], build_beam, None),
+    ("beam.draw_longitudinal", "length", [6, 24], build_beam,
+     lambda element, doc: element.draw_longitudinal(document=doc, x=0, y=0)),
+    ("beam.draw_transverse", "length", [6, 24], build_beam,
+     lambda element, doc: element.draw_transverse(document=doc, x=0, y=0)),
+    ("beam.draw_longitudinal_rebar_detailing", "length", [6, 24], build_beam,
+     lambda element, doc: element.draw_longitudinal_rebar_detailing(document=doc, x=0, y=0)),
+    ("beam.draw_transverse_rebar_detailing", "length", [6, 24], build_beam,
+     lambda element, doc: element.draw_transverse_rebar_detailing(document=doc, x=0, y=0)),
+    ("beam.draw_table_rebar_detailing", "length", [6, 24], build_beam,
+     lambda element, doc: element.draw_table_rebar_detailing(document=doc, x=0, y=0)),
+    ("column.construction", "height", [3, 12], build_column, None),
+    ("column.draw_longitudinal", "height", [3, 12], build_column,
+     lambda element, doc: element.draw_longitudinal(document=doc, x=0, y=0)),
+    ("column.draw_transverse", "height", [3, 12], build_column,
+     lambda element, doc: element.draw_transverse(document=doc, x=0, y=0)),
+    ("column.draw_longitudinal_rebar_detailing", "height", [3, 12], build_column,
+     lambda element, doc: element.draw_longitudinal_rebar_detailing(document=doc, x=0, y=0)),
+    ("column.draw_transverse_rebar_detailing", "height", [3, 12], build_column,
+     lambda element, doc: element.draw_transverse_rebar_detailing(document=doc, x=0, y=0)),
+    ("column.draw_table_rebar_detailing", "height", [3, 12], build_column,
+     lambda element, doc: element.draw_table_rebar_detailing(document=doc, x=0, y=0)),
+    ("slab.construction", "size", [5, 20], build_slab, None),
+    ("slab.draw_longitudinal", "size", [5, 20], build_slab,
+     lambda element, doc: element.draw_longitudinal(document=doc, x=0, y=0)),
+    ("slab.draw_longitudinal_blocks", "size", [5, 20], build_slab,
+     lambda element, doc: element.draw_longitudinal(document=doc, x=0, y=0, as_blocks=True)),
+    ("slab.draw_transverse", "size", [5, 20], build_slab,
+     lambda element, doc: element.draw_transverse(document=doc, x=0, y=0)),
+    ("slab.draw_longitudinal_rebar_detailing", "size", [5, 20], build_slab,
+     lambda element, doc: element.draw_longitudinal_rebar_detailing(document=doc, x=0, y=0)),
+    ("slab.draw_table_rebar_detailing", "size", [5, 20], build_slab,
+     lambda element, doc: element.draw_table_rebar_detailing(document=doc, x=0, y=0)),
+    ("cadtable.construction", "rows", [10, 100, 1000], build_cadtable, None),
+    ("cadtable.draw_table", "rows", [10, 100, 1000], build_cadtable,
+     lambda element, doc: element.draw_table(document=doc, x=0, y=0)),
+    ("project.draw", "beams", [10, 100], build_project,
+     lambda element, doc: element.draw(document=doc)),
+    ("project.draw_processes", "beams", [10, 100], build_project,
+     lambda element, doc: element.draw(document=doc, processes=4)),
+    ("project.write", "beams", [10, 100], build_project,
+     lambda element, doc: element.write(stream=os.devnull, document=doc)),
+]
+
+
+def measure(builder, scale, action=None, repeat: int = 3) -> dict:
+    """
+    Measures a benchmark case. The construction of the element is measured when no action is given, otherwise the
+    element is built beforehand and only the action is measured, on a new document in every repetition.
+
+    :param builder: Function that builds the element from the scale parameter.
+    :type builder: callable
+    :param scale: Scale parameter of the element.
+    :type scale: int or float
+    :param action: Function that draws the element in a document, receives the element and the document.
+    :type action: callable, optional
+    :param repeat: Number of repetitions, the best time is reported.
+    :type repeat: int
+    :return: Dict with best time in seconds, peak of allocated memory in bytes and entities count.
+    :rtype: dict
+    """
+    times = []
+    entities = 0
+    for _ in range(repeat):
+        doc = ezdxf.new(dxfversion="R2010", setup=True)
+        msp = doc.modelspace()
+        initial_entities = len(msp)
+        element = builder(scale) if action is not None else None
+
+        start = time.perf_counter()
+        if action is None:
+            builder(scale)
+        else:
+            action(element, doc)
+        times.append(time.perf_counter() - start)
+
+        entities = len(msp) - initial_entities
+
+    # Memory is measured in a separate run, tracing slows down the execution.
+    doc = ezdxf.new(dxfversion="R2010", setup=True)
+    element = builder(scale) if action is not None else None
+    tracemalloc.start()
+    if action is None:
+        builder(scale)
+    else:
+        action(element, doc)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"time": min(times), "memory": peak, "entities": entities}
+
+
+def run(pattern: str = None, repeat: int = 3) -> dict:
+    """
+    Runs the benchmark cases whose name matches the pattern.
+
+    :param pattern: Regular expression to filter the cases by name, defaults to all cases.
+    :type pattern: str, optional
+    :param repeat: Number of repetitions of each case.
+    :type repeat: int
+    :return: Dict of results keyed by "<case>[<parameter>=<scale>]".
+    :rtype: dict
+    """
+    results = {}
+    for name, parameter, scales, builder, action in CASES:
+        if pattern and not re.search(pattern, name):
+            continue
+
+        for scale in scales:
+            key = f"{name}[{parameter}={scale}]"
+            results[key] = measure(builder=builder, scale=scale, action=action, repeat=repeat)
+            print_result(key, results[key])
+
+    return results
+
+
+def print_result(key: str, result: dict, baseline: dict = None) -> None:
+    """
+    Prints a result line, with the time ratio against the baseline if given.
+
+    :param key: Name of the case.
+    :type key: str
+    :param result: Result of the case.
+    :type result: dict
+    :param baseline: Baseline result of the case.
+    :type baseline: dict, optional
+    """
+    line = "{:<60} {:>10.2f} ms {:>10.1f} KiB {:>8d} entities".format(key,
+                                                                       result["time"] * 1000,
+                                                                       result["memory"] / 1024,
+                                                                       result["entities"])
+    if baseline:
+        line += " {:>7.2f}x".format(result["time"] / baseline["time"] if baseline["time"] else float("inf"))
+    print(line)
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """
+    Compares results against a baseline.
+
+    :param results: Current results.
+    :type results: dict
+    :param baseline: Baseline results.
+    :type baseline: dict
+    :param threshold: Relative time increase considered a regression (0.2 is 20% slower).
+    :type threshold: float
+    :return: List of names of the cases with regressions.
+    :rtype: list
+    """
+    print("\nComparison against baseline (time ratio current/baseline):")
+    regressions = []
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+
+        print_result(key, result, baseline[key])
+        if result["time"] > max(baseline[key]["time"] * (1 + threshold), MIN_REGRESSION_TIME):
+            regressions.append(key)
+        elif result["entities"] != baseline[key]["entities"]:
+            print(f"  entities count changed: {baseline[key]['entities']} -> {result['entities']}")
+
+    return regressions
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description="etacad benchmark suite.")
+    parser.add_argument("--filter", default=None, help="Regular expression to filter cases by name.")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions of each case, the best time is reported.")
+    parser.add_argument("--save", default=None, help="Saves the results as JSON, to be used as baseline.")
+    parser.add_argument("--compare", default=None, help="Baseline JSON file to compare the results against.")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Relative time increase reported as regression.")
+    args = parser.parse_args(argv)
+
+    results = run(pattern=args.filter, repeat=args.repeat)
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump(results, file, indent=2)
+
+    if args.compare:
+        with open(args.compare, "r") as file:
+            baseline = json.load(file)
+
+        regressions = compare(results=results, baseline=baseline, threshold=args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}:")
+            for key in regressions:
+                print(f"  {key}")
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,6 +9,9 @@ from .beam import Beam
 from .cadtable import CADTable
 from .column import Column
 from .concrete import Concrete
+from .dxf_writer import DXFStreamWriter
+from .project import Project
+from .schedule import BarSchedule
 from .slab import Slab
 from .spaced_bars import SpacedBars
 from .stirrup import Stirrup
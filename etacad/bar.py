@@ -2,14 +2,58 @@
 
 # Imports.
 # Local imports.
-from etacad.drawing_utils import circle, curve, line, mirror, rads, rect, rotate, text, translate
+from etacad.converters import to_interned
+from etacad.drawing_utils import (EntityRecorder, circle, count_entities, curve, line, matrix_x_mirror, matrix_y_mirror,
+                                  rads, rect, text, transform, translate)
 from etacad.globals import Direction, ElementTypes, Orientation, STEEL_WEIGHT, BAR_SET_LONG, BAR_SET_TRANSVERSE
 
 # External imports.
-from attrs import define, field
+import numpy as np
+
+from attrs import define, field, setters
+from collections import OrderedDict
+from collections.abc import Sequence
 from ezdxf.document import Drawing
+from ezdxf.math import Matrix44
+from hashlib import sha1
 from math import cos, sin, tan, pi
 
+# Columns of BarArray, defining parameters of the bars and their types.
+BAR_ARRAY_COLUMNS = {"reinforcement_length": np.float64,
+                     "diameter": np.float64,
+                     "x": np.float64,
+                     "y": np.float64,
+                     "left_anchor": np.float64,
+                     "right_anchor": np.float64,
+                     "mandrel_radius": np.float64,
+                     "bend_longitud": np.float64,
+                     "bend_angle": np.float64,
+                     "bend_height": np.float64,
+                     "direction": np.int8,
+                     "orientation": np.int8,
+                     "quantity": np.int64}
+
+# Geometry cache of longitudinal drawings, keyed by bar shape signature. Least recently used shapes are discarded
+# beyond its size.
+_GEOMETRY_CACHE_SIZE = 256
+_geometry_cache = OrderedDict()
+
+
+# Function that discards the cached derived attributes of a bar when a defining attribute is set.
+def _reset_derived(instance, attribute, value):
+    instance.clear_derived()
+    return value
+
+
+_DERIVED_ON_SETATTR = setters.pipe(setters.convert, setters.validate, _reset_derived)
+
+
+def clear_geometry_cache() -> None:
+    """
+    Empties the geometry cache of bar longitudinal drawings.
+    """
+    _geometry_cache.clear()
+
 
 @define
 class Bar:
@@ -67,10 +111,8 @@ class Bar:
     :ivar denomination: Optional denomination for the bar element.
     """
     # Geometric attributes.
-    reinforcement_length: float
-    diameter: float
-    radius: float = field(init=False)
-    length: float = field(init=False)
+    reinforcement_length: float = field(on_setattr=_DERIVED_ON_SETATTR)
+    diameter: float = field(on_setattr=_DERIVED_ON_SETATTR)
     x: float = field(default=0)
     y: float = field(default=0)
     direction: Direction = field(default=Direction.HORIZONTAL)
@@ -78,53 +120,77 @@ class Bar:
     transverse_center: tuple = field(default=None)
 
     # Anchor attributes.
-    left_anchor: float = field(default=0)
-    right_anchor: float = field(default=0)
-    mandrel_radius: float = field(default=0)
-    mandrel_radius_ext: float = field(init=False)
+    left_anchor: float = field(default=0, on_setattr=_DERIVED_ON_SETATTR)
+    right_anchor: float = field(default=0, on_setattr=_DERIVED_ON_SETATTR)
+    mandrel_radius: float = field(default=0, on_setattr=_DERIVED_ON_SETATTR)
 
     # Bending attributes.
     bend_longitud: float = field(default=0)
-    bend_angle: float = field(default=0)
-    bend_height: float = field(default=0)
-    bending_proyection: float = field(init=False)
-
-    # Boxing attributes.
-    box_width: float = field(init=False)
-    box_height: float = field(init=False)
-
-    # Physics attributes.
-    weight: float = field(init=False)
+    bend_angle: float = field(default=0, on_setattr=_DERIVED_ON_SETATTR)
+    bend_height: float = field(default=0, on_setattr=_DERIVED_ON_SETATTR)
 
     # Others.
     element_type: ElementTypes = field(default=ElementTypes.BAR)
-    denomination: str = field(default=None)
-    position: str = field(default=None)
+    denomination: str = field(default=None, converter=to_interned)
+    position: str = field(default=None, converter=to_interned)
     quantity: int = field(default=None)
 
-    def __attrs_post_init__(self):
-        # Bending attributes.
-        self.bending_proyection = self.bend_height / tan(rads(self.bend_angle)) if self.bend_angle else 0
-
-        # Geometric attributes.
-        self.radius = self.diameter / 2
-        self.length = (self.reinforcement_length + (1 / cos(rads(self.bend_angle)) - 1) * self.bending_proyection * 2
-                       + self.left_anchor + self.right_anchor)
-
-        # Mandrel attributes.
-        self.mandrel_radius_ext = self.diameter + self.mandrel_radius
-
-        # Boxing attributes.
-        self.box_width = self.reinforcement_length
-        if self.left_anchor or self.right_anchor or self.bend_height:
-            max_anchor = max([self.left_anchor, self.right_anchor])  # Maximum anchor.
-
-            self.box_height = max([self.mandrel_radius_ext + max_anchor, self.diameter * 2 + self.bend_height])
-        else:
-            self.box_height = self.diameter
-
-        # Physics attributes.
-        self.weight = ((self.diameter ** 2) * pi / 4) * self.length * STEEL_WEIGHT
+    # Derived attributes computed on first access (length, box_height, weight, etc.).
+    _derived: dict = field(init=False, default=None, repr=False, eq=False)
+
+    @property
+    def radius(self) -> float:
+        return self.diameter / 2
+
+    @property
+    def mandrel_radius_ext(self) -> float:
+        return self.diameter + self.mandrel_radius
+
+    @property
+    def bending_proyection(self) -> float:
+        if not self.bend_angle:  # Straight bars skip the bending math.
+            return 0
+        return self.__derived("bending_proyection", lambda: self.bend_height / tan(rads(self.bend_angle)))
+
+    @property
+    def length(self) -> float:
+        if not self.bend_angle:
+            return self.reinforcement_length + self.left_anchor + self.right_anchor
+        return self.__derived("length", lambda: (self.reinforcement_length
+                                                 + (1 / cos(rads(self.bend_angle)) - 1) * self.bending_proyection * 2
+                                                 + self.left_anchor + self.right_anchor))
+
+    @property
+    def box_width(self) -> float:
+        return self.reinforcement_length
+
+    @property
+    def box_height(self) -> float:
+        if not (self.left_anchor or self.right_anchor or self.bend_height):
+            return self.diameter
+        return self.__derived("box_height", lambda: max(self.mandrel_radius_ext + max(self.left_anchor,
+                                                                                      self.right_anchor),
+                                                        self.diameter * 2 + self.bend_height))
+
+    @property
+    def weight(self) -> float:
+        return self.__derived("weight", lambda: ((self.diameter ** 2) * pi / 4) * self.length * STEEL_WEIGHT)
+
+    def __derived(self, name: str, compute) -> float:
+        # Cached value of a derived attribute, computed on first access.
+        if self._derived is None:
+            self._derived = {}
+        value = self._derived.get(name)
+        if value is None:
+            value = self._derived[name] = compute()
+        return value
+
+    def clear_derived(self) -> None:
+        """
+        Discards the cached derived attributes of the bar, they are computed again from the defining attributes on next
+        access. Called when a defining attribute (lengths, diameter, anchors, bending) is assigned.
+        """
+        self._derived = None
 
     # Drawing longitudinal function.
     def draw_longitudinal(self,
@@ -134,7 +200,9 @@ class Bar:
                           unifilar: bool = False,
                           dimensions: bool = True,
                           denomination: bool = True,
-                          settings: dict = BAR_SET_LONG) -> dict:
+                          settings: dict = BAR_SET_LONG,
+                          cache: bool = False,
+                          collect: bool = True) -> dict:
         """
         Draws the longitudinal view of the bar in a DXF document.
 
@@ -152,6 +220,12 @@ class Bar:
         :type denomination: bool, optional
         :param settings: Dictionary of settings for dimensioning. Defaults to `BAR_SET_LONG`.
         :type settings: dict, optional
+        :param cache: Whether to reuse the drawing of bars with the same shape, defaults to False. The outline is
+            computed once in local coordinates and each drawing copies it with a translation.
+        :type cache: bool, optional
+        :param collect: Whether to return the entities grouped, defaults to True. If False, only the number of
+            entities drawn is returned ({"count": n}).
+        :type collect: bool, optional
         :return: Dict of drawing entities for the longitudinal view.
         :rtype: dict
         """
@@ -160,6 +234,16 @@ class Bar:
         if y is None:
             y = self.y
 
+        if cache:
+            return self.__draw_longitudinal_cached(document=document,
+                                                   x=x,
+                                                   y=y,
+                                                   unifilar=unifilar,
+                                                   dimensions=dimensions,
+                                                   denomination=denomination,
+                                                   settings=settings,
+                                                   collect=collect)
+
         # Setting variables for simplifying code.
         diameter = self.diameter
         mandrel_radius_ext = self.mandrel_radius_ext
@@ -408,6 +492,20 @@ class Bar:
                                           rotation=0,
                                           attr={"halign": 4, "valign": 0})
 
+        # Orienting the bar (direction and orientation), all the transformations are composed in one matrix and
+        # applied in a single pass.
+        matrix = self.__direc_orient_matrix(x=x, y=y, unifilar=unifilar)
+
+        transform(steel_elements, matrix)
+        for group in [dimension_elements, denomination_elements]:
+            if self.orientation == Orientation.TOP:
+                self.__direct_orient_text(group, matrix)
+            else:
+                transform(group, matrix)
+
+        if not collect:
+            return {"count": count_entities(steel_elements, dimension_elements, denomination_elements)}
+
         # Setting groups of elements in dictionary.
         elements["steel_elements"] = steel_elements
         elements["dimension_elements"] = dimension_elements
@@ -418,18 +516,148 @@ class Bar:
                                     elements["dimension_elements"] +
                                     elements["denomination_elements"])
 
-        if unifilar:
-            translate(objects=elements["all_elements"],
-                      vector=(0, -self.mandrel_radius_ext))
+        return elements
 
-        # Orienting the bar (direction and orientation).
-        self.__direc_orient(elements["all_elements"],
-                            x=x,
-                            y=y,
-                            unifilar=unifilar)
+    # Drawing longitudinal function, from geometry cache.
+    def __draw_longitudinal_cached(self,
+                                   document: Drawing,
+                                   x: float,
+                                   y: float,
+                                   unifilar: bool,
+                                   dimensions: bool,
+                                   denomination: bool,
+                                   settings: dict,
+                                   collect: bool = True) -> dict:
+        """
+        Draws the longitudinal view of the bar by copying the cached drawing of its shape, computed at the origin,
+        and translating it to the given point. The cache keeps the `_GEOMETRY_CACHE_SIZE` most recently used shapes.
 
-        if self.orientation == Orientation.TOP:
-            self.__direct_orient_text(elements["text_elements"])
+        :param document: The DXF document to draw on.
+        :type document: Drawing
+        :param x: X coordinate for the drawing.
+        :type x: float
+        :param y: Y coordinate for the drawing.
+        :type y: float
+        :param unifilar: Whether to draw a unifilar representation (simplified view).
+        :type unifilar: bool
+        :param dimensions: Whether to include dimensions in the drawing.
+        :type dimensions: bool
+        :param denomination: Whether to include the denomination label.
+        :type denomination: bool
+        :param settings: Dictionary of settings for dimensioning.
+        :type settings: dict
+        :param collect: Whether to return the entities grouped. If False, only the number of entities drawn is
+            returned.
+        :type collect: bool
+        :return: Dict of drawing entities for the longitudinal view.
+        :rtype: dict
+        """
+        key = self.__drawing_key(unifilar=unifilar, dimensions=dimensions, denomination=denomination,
+                                 settings=settings)
+
+        template = _geometry_cache.get(key)
+        if template is None:
+            recorder = EntityRecorder(doc=document.doc if isinstance(document, EntityRecorder) else document)
+            template = self.draw_longitudinal(document=recorder,
+                                              x=0,
+                                              y=0,
+                                              unifilar=unifilar,
+                                              dimensions=dimensions,
+                                              denomination=denomination,
+                                              settings=settings)
+            _geometry_cache[key] = template
+            if len(_geometry_cache) > _GEOMETRY_CACHE_SIZE:
+                _geometry_cache.popitem(last=False)
+        else:
+            _geometry_cache.move_to_end(key)
+        layout = document.modelspace()
+
+        elements = {}
+        for group in ["steel_elements", "dimension_elements", "denomination_elements"]:
+            elements[group] = [entitie.copy() for entitie in template[group]]
+            translate(elements[group], vector=(x, y))
+            for entitie in elements[group]:
+                layout.add_entity(entitie)
+
+        if not collect:
+            return {"count": count_entities(*elements.values())}
+
+        # Setting groups of elements in dictionary.
+        elements["text_elements"] = (elements["dimension_elements"] +
+                                     elements["denomination_elements"])
+        elements["all_elements"] = (elements["steel_elements"] +
+                                    elements["dimension_elements"] +
+                                    elements["denomination_elements"])
+
+        return elements
+
+    # Drawing longitudinal function, as block reference.
+    def draw_longitudinal_block(self,
+                                document: Drawing,
+                                x: float = None,
+                                y: float = None,
+                                unifilar: bool = False,
+                                dimensions: bool = True,
+                                denomination: bool = True,
+                                settings: dict = BAR_SET_LONG,
+                                collect: bool = True) -> dict:
+        """
+        Draws the longitudinal view of the bar as a reference (INSERT) to a block definition of its shape. The block
+        is defined once per document for each distinct bar drawing, and reused by all bars with the same shape.
+
+        :param document: The DXF document to draw on.
+        :type document: Drawing
+        :param x: X coordinate for the drawing, defaults to self.x.
+        :type x: float, optional
+        :param y: Y coordinate for the drawing, defaults to self.y.
+        :type y: float, optional
+        :param unifilar: Whether to draw a unifilar representation (simplified view), defaults to False.
+        :type unifilar: bool, optional
+        :param dimensions: Whether to include dimensions in the drawing, defaults to True.
+        :type dimensions: bool, optional
+        :param denomination: Whether to include the denomination label, defaults to True.
+        :type denomination: bool, optional
+        :param settings: Dictionary of settings for dimensioning. Defaults to `BAR_SET_LONG`.
+        :type settings: dict, optional
+        :param collect: Whether to return the entities grouped, defaults to True. If False, only the number of
+            entities drawn is returned ({"count": n}).
+        :type collect: bool, optional
+        :return: Dict with the block reference of the longitudinal view.
+        :rtype: dict
+        """
+        if x is None:
+            x = self.x
+        if y is None:
+            y = self.y
+
+        key = self.__drawing_key(unifilar=unifilar, dimensions=dimensions, denomination=denomination,
+                                 settings=settings)
+        name = "BAR_" + sha1(repr(key).encode()).hexdigest()[:16].upper()
+
+        # Defining block.
+        doc = document.doc if isinstance(document, EntityRecorder) else document
+        if name not in doc.blocks:
+            block = doc.blocks.new(name=name)
+            recorder = EntityRecorder(doc=doc)
+            self.draw_longitudinal(document=recorder,
+                                   x=0,
+                                   y=0,
+                                   unifilar=unifilar,
+                                   dimensions=dimensions,
+                                   denomination=denomination,
+                                   settings=settings,
+                                   collect=False)
+            recorder.flush(layout=block)
+
+        block_reference = document.modelspace().add_blockref(name=name, insert=(x, y))
+        if not collect:
+            return {"count": 1}
+
+        elements = {}
+
+        # Setting groups of elements in dictionary.
+        elements["block_elements"] = [block_reference]
+        elements["all_elements"] = elements["block_elements"]
 
         return elements
 
@@ -438,7 +666,8 @@ class Bar:
                         document: Drawing,
                         x: float = None,
                         y: float = None,
-                        settings: dict = BAR_SET_TRANSVERSE) -> dict:
+                        settings: dict = BAR_SET_TRANSVERSE,
+                        collect: bool = True) -> dict:
         """
         Draws the transverse section of the bar in a DXF document.
 
@@ -450,6 +679,9 @@ class Bar:
         :type y: float, optional
         :param settings: Dictionary of settings for dimensioning. Defaults to `BAR_SET_TRANSVERSE`.
         :type settings: dict, optional
+        :param collect: Whether to return the entities grouped, defaults to True. If False, only the number of
+            entities drawn is returned ({"count": n}).
+        :type collect: bool, optional
         :return: Dict of drawing entities for the transverse section.
         :rtype: dict
         """
@@ -472,25 +704,29 @@ class Bar:
                                  center_point=(x + self.radius, y + self.radius),
                                  radius=self.radius)
 
+        if not collect:
+            return {"count": count_entities(steel_elements)}
+
         # Setting groups of elements in dictionary.
         elements["steel_elements"] = steel_elements
         elements["all_elements"] = elements["steel_elements"]
 
         return elements
 
-    # Function that orients drawing.
-    def __direc_orient(self, group: list, x: float = None, y: float = None, unifilar: bool = False) -> None:
+    # Function that composes the orientation matrix of the drawing.
+    def __direc_orient_matrix(self, x: float = None, y: float = None, unifilar: bool = False) -> Matrix44:
         """
-        Adjusts the orientation of the drawing based on the direction and orientation of the bar.
+        Composes the transformation matrix that orients the drawing based on the direction and orientation of the
+        bar, including the unifilar offsets.
 
-        :param group: List of drawing entities to be oriented.
-        :type group: list
         :param x: X coordinate for the orientation, defaults to self.x.
         :type x: float, optional
         :param y: Y coordinate for the orientation, defaults to self.y.
         :type y: float, optional
         :param unifilar: Whether to apply unifilar adjustments, defaults to False.
         :type unifilar: bool, optional
+        :return: Composed transformation matrix.
+        :rtype: Matrix44
         """
         if x is None:
             x = self.x
@@ -498,60 +734,92 @@ class Bar:
         if y is None:
             y = self.y
 
-        # Orienting the bar (direction and orientation).
+        matrices = []
+
+        if unifilar:
+            matrices.append(Matrix44.translate(0, -self.mandrel_radius_ext, 0))
+
         # Direction.
         if self.direction == Direction.VERTICAL:
             pivot_point = (x, y + self.box_height)
             vector_translate = (x - (pivot_point[0] * cos(pi / 2) - pivot_point[1] * sin(pi / 2)),
                                 y - (pivot_point[0] * sin(pi / 2) + pivot_point[1] * cos(pi / 2)))
 
-            rotate(group, pi / 2)
-            translate(group, vector=vector_translate)
+            matrices.append(Matrix44.z_rotate(pi / 2))
+            matrices.append(Matrix44.translate(vector_translate[0], vector_translate[1], 0))
 
             if unifilar:
-                translate(group, vector=(-self.diameter, 0))
+                matrices.append(Matrix44.translate(-self.diameter, 0, 0))
 
         # Orientation.
         if self.orientation == Orientation.TOP:
-            mirror(objects=group, mirror_type="x")
+            matrices.append(matrix_x_mirror)
             if self.direction == Direction.VERTICAL:
-                translate(group, vector=(0, self.box_width + y * 2))
+                matrices.append(Matrix44.translate(0, self.box_width + y * 2, 0))
             else:
-                translate(group, vector=(0, self.box_height + y * 2))
+                matrices.append(Matrix44.translate(0, self.box_height + y * 2, 0))
                 if unifilar:
-                    translate(group, vector=(0, -self.mandrel_radius_ext))
+                    matrices.append(Matrix44.translate(0, -self.mandrel_radius_ext, 0))
 
         elif self.orientation == Orientation.RIGHT:
-            if self.direction == Direction.VERTICAL:
-                if unifilar:
-                    translate(group, vector=(-self.mandrel_radius_ext, 0))
-            else:
-                pass
+            if self.direction == Direction.VERTICAL and unifilar:
+                matrices.append(Matrix44.translate(-self.mandrel_radius_ext, 0, 0))
 
         elif self.orientation == Orientation.LEFT:
-            mirror(objects=group, mirror_type="y")
+            matrices.append(matrix_y_mirror)
 
             if self.direction == Direction.VERTICAL:
-                translate(group, vector=(self.box_height + x * 2, 0))
+                matrices.append(Matrix44.translate(self.box_height + x * 2, 0, 0))
             else:
-                translate(group, vector=(self.box_width + x * 2, 0))
+                matrices.append(Matrix44.translate(self.box_width + x * 2, 0, 0))
+
+        return Matrix44.chain(*matrices) if matrices else Matrix44()
 
-    def __direct_orient_text(self, group: list, x: float = None, y: float = None):
+    def __direct_orient_text(self, group: list, matrix: Matrix44) -> None:
         """
-        Adjusts the text orientation in the drawing.
+        Orients the texts of a top oriented bar, keeping them readable. The mirror on X axis of the orientation is
+        undone in the same pass and the placement of the texts is reflected.
 
-        :param group: List of drawing entities to be adjusted.
+        :param group: List of text entities to be oriented.
         :type group: list
-        :param x: X coordinate for the text adjustment, defaults to self.x.
-        :type x: float, optional
-        :param y: Y coordinate for the text adjustment, defaults to self.y.
-        :type y: float, optional
+        :param matrix: Orientation matrix of the bar.
+        :type matrix: Matrix44
         """
-        coordinates = [entitie.get_placement()[1] for entitie in group]
-        mirror(group, mirror_type="x")
+        transform(group, Matrix44.chain(matrix, matrix_x_mirror))
+
+        for entitie in group:
+            coordinates = entitie.get_placement()[1]
+            entitie.set_placement([coordinates[0], -coordinates[1], coordinates[2]])
 
-        for i, entitie in enumerate(group):
-            entitie.set_placement([-coordinates[i][0], coordinates[i][1], coordinates[i][2]])
+    def __drawing_key(self, unifilar: bool, dimensions: bool, denomination: bool, settings: dict) -> tuple:
+        """
+        Returns the key that identifies a longitudinal drawing of the bar, up to a translation.
+
+        :param unifilar: Whether the drawing is unifilar.
+        :type unifilar: bool
+        :param dimensions: Whether the drawing includes dimensions.
+        :type dimensions: bool
+        :param denomination: Whether the drawing includes the denomination label.
+        :type denomination: bool
+        :param settings: Dictionary of settings for dimensioning.
+        :type settings: dict
+        :return: Tuple of shape signature, drawing options and settings.
+        :rtype: tuple
+        """
+        return (self.shape_signature(), unifilar, dimensions, denomination and self.denomination,
+                tuple(sorted(settings.items())))
+
+    def shape_signature(self) -> tuple:
+        """
+        Returns the attributes that define the shape of the bar drawing. Bars with the same signature have the same
+        drawing, up to a translation.
+
+        :return: Tuple of reinforcement length, diameter, anchors, mandrel radius, bending attributes, direction and
+            orientation.
+        :rtype: tuple
+        """
+        return (self.reinforcement_length, self.diameter, self.left_anchor, self.right_anchor, self.mandrel_radius,
+                self.bend_longitud, self.bend_angle, self.bend_height, self.direction, self.orientation)
 
     def data(self) -> dict:
         """
@@ -590,3 +858,88 @@ class Bar:
                 data_required.append("-")
 
         return data_required
+
+
+@define
+class BarArray(Sequence):
+    """
+    Compact store of many bars as a struct of arrays. Only the defining parameters of the bars are kept, as typed
+    arrays (see `BAR_ARRAY_COLUMNS`), with their denominations and positions interned. Each bar is built on demand,
+    and the derived values used in bulk (length, weight) are computed for all the bars at once.
+
+    :param columns: Typed arrays of the defining parameters, by parameter name. Missing quantities are -1.
+    :type columns: dict[str, numpy.ndarray]
+    :param transverse_centers: Array (n, 2) of transverse centers, NaN for the bars without it.
+    :type transverse_centers: numpy.ndarray
+    :param denominations: Denomination of every bar.
+    :type denominations: list[str]
+    :param positions: Position of every bar.
+    :type positions: list[str]
+    """
+    columns: dict
+    transverse_centers: np.ndarray
+    denominations: list
+    positions: list
+
+    @classmethod
+    def from_bars(cls, bars: list[Bar]) -> "BarArray":
+        """
+        Creates the store of the bars given.
+
+        :param bars: Bars to store.
+        :type bars: list[Bar]
+        :return: The store of the bars.
+        :rtype: BarArray
+        """
+        columns = {name: np.array([getattr(bar, name) for bar in bars], dtype=dtype)
+                   for name, dtype in BAR_ARRAY_COLUMNS.items() if name not in ("direction", "orientation", "quantity")}
+        columns["direction"] = np.array([bar.direction.value for bar in bars], dtype=np.int8)
+        columns["orientation"] = np.array([bar.orientation.value for bar in bars], dtype=np.int8)
+        columns["quantity"] = np.array([-1 if bar.quantity is None else bar.quantity for bar in bars], dtype=np.int64)
+
+        transverse_centers = np.array([(np.nan, np.nan) if bar.transverse_center is None else bar.transverse_center
+                                       for bar in bars], dtype=np.float64).reshape(-1, 2)
+
+        return cls(columns=columns,
+                   transverse_centers=transverse_centers,
+                   denominations=[to_interned(bar.denomination) for bar in bars],
+                   positions=[to_interned(bar.position) for bar in bars])
+
+    def __len__(self) -> int:
+        return len(self.denominations)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Bar index out of range.")
+
+        columns = self.columns
+        transverse_center = self.transverse_centers[index]
+        quantity = int(columns["quantity"][index])
+        return Bar(**{name: float(columns[name][index]) for name in BAR_ARRAY_COLUMNS
+                      if name not in ("direction", "orientation", "quantity")},
+                   direction=Direction(int(columns["direction"][index])),
+                   orientation=Orientation(int(columns["orientation"][index])),
+                   transverse_center=None if np.isnan(transverse_center[0]) else tuple(transverse_center.tolist()),
+                   denomination=self.denominations[index],
+                   position=self.positions[index],
+                   quantity=None if quantity < 0 else quantity)
+
+    @property
+    def length(self) -> np.ndarray:
+        """Overall length of every bar, including bends and anchors."""
+        columns = self.columns
+        angle = np.radians(columns["bend_angle"])
+        bending_proyection = np.divide(columns["bend_height"], np.tan(angle),
+                                       out=np.zeros(len(self)), where=angle != 0)
+        return (columns["reinforcement_length"] + (1 / np.cos(angle) - 1) * bending_proyection * 2
+                + columns["left_anchor"] + columns["right_anchor"])
+
+    @property
+    def weight(self) -> np.ndarray:
+        """Weight of every bar, calculated using a steel density of 7850 kg/m³."""
+        return (self.columns["diameter"] ** 2) * pi / 4 * self.length * STEEL_WEIGHT
@@ -2,24 +2,27 @@
 
 # Imports.
 # Local imports.
-from etacad.drawing_utils import delimit_axe, dim_linear, rect, text
+from etacad.drawing_utils import count_entities, delimit_axe, dim_linear, rect, text
+from etacad.geometry import IntervalIndex
 from etacad.bar import Bar
 from etacad.cadtable import CADTable
 from etacad.concrete import Concrete
 from etacad.globals import (BEAM_SET_LONG, BEAM_SET_LONG_REBAR, BEAM_SET_TRANSVERSE, CONCRETE_WEIGHT, Direction,
                             ElementTypes, Orientation)
+from etacad.redraw import Redrawable
 from etacad.stirrup import Stirrup
-from etacad.utils import gen_symmetric_list, gen_position_bars
+from etacad.utils import gen_symmetric_list, gen_position_bars, gen_position_registry
 
 # External imports.
 from attrs import define, field
 from ezdxf.document import Drawing
 from ezdxf.gfxattribs import GfxAttribs
 from itertools import chain
+from typing import Iterator
 
 
 @define
-class Beam:
+class Beam(Redrawable):
     """
     Beam element, computes geometrics and physics props and manages dxf drawing methods (longitudinal, transversal,
     reinforcement detailing, etc.)
@@ -126,11 +129,46 @@ class Beam:
     :ivar all_bars: List of all reinforcement bars as entities.
     :ivar stirrups: List of stirrups as entities.
     :ivar all_elements: List of all elements/entities in the structure.
+    :ivar position_registry: Bars and stirrups aggregated by position (see `gen_position_registry`).
 
     :ivar nomenclature: Nomenclature prefix used for labeling elements.
     :ivar number_init: Initial number for labeling elements.
     :ivar element_type: Type of the structural element (e.g., BEAM).
     """
+    # Redrawing dependencies (see Redrawable).
+    _GROUPS = frozenset({"concrete", "columns", "bars", "stirrups"})
+    _DEPENDENCIES = {"as_sup": {"bars", "stirrups"},
+                     "as_right": {"bars", "stirrups"},
+                     "as_inf": {"bars", "stirrups"},
+                     "as_left": {"bars", "stirrups"},
+                     "anchor_sup": {"bars"},
+                     "anchor_right": {"bars"},
+                     "anchor_inf": {"bars"},
+                     "anchor_left": {"bars"},
+                     "number_init": {"bars", "stirrups"},
+                     "nomenclature": {"bars", "stirrups"},
+                     "stirrups_db": {"stirrups"},
+                     "stirrups_sep": {"stirrups"},
+                     "stirrups_length": {"stirrups"},
+                     "stirrups_anchor": {"stirrups"},
+                     "stirrups_x": {"stirrups"},
+                     "columns": {"columns"},
+                     "columns_pos": {"columns"},
+                     "columns_symbol": {"columns"},
+                     "concrete_specific_weight": set(),
+                     "denomination": set(),
+                     "element_type": set()}
+    _VIEWS = {"draw_longitudinal": {"concrete": ({"concrete"}, ("concrete_shape",)),
+                                    "middle_axe": ({"concrete"}, ("middle_axe",)),
+                                    "columns": ({"columns"}, ("columns", "columns_axes")),
+                                    "stirrups": ({"stirrups"}, ("stirrups",)),
+                                    "stirrups_dimensions": ({"stirrups"}, ("dim_stirrups",)),
+                                    "bars": ({"bars"}, ("bars",))},
+              "draw_transverse": {"section": ({"concrete", "bars", "stirrups"}, ())},
+              "draw_longitudinal_rebar_detailing": {"detailing": ({"bars", "columns"}, ())},
+              "draw_transverse_rebar_detailing": {"detailing": ({"concrete", "bars", "stirrups"}, ())},
+              "draw_table_rebar_detailing": {"table": ({"bars", "stirrups"}, ())}}
+
     # Geometric attributes.
     width: float = field(converter=float)
     height: float = field(converter=float)
@@ -189,16 +227,20 @@ class Beam:
     all_bars: list = field(init=False)
     stirrups: list = field(init=False)
     all_elements: list = field(init=False)
+    _section_indexes: dict = field(init=False, factory=dict, repr=False)
 
     # Position bar attributes.
     nomenclature: str = field(default="#")
     positions: dict = field(init=False)
+    position_registry: dict = field(init=False, repr=False)
 
     # Beam attributes.
     denomination: str = field(default=None)
     element_type: ElementTypes = field(default=ElementTypes.BEAM)
 
     def __attrs_post_init__(self):
+        self._record_inputs()
+
         # Longitudinal steel attributes.
         if self.number_init is None:
             self.number_init = 0
@@ -312,11 +354,20 @@ class Beam:
         self.all_bars = self.bars_as_sup + self.bars_as_right + self.bars_as_inf + self.bars_as_left
 
         self.all_elements = self.all_bars + self.stirrups
+        self.position_registry = gen_position_registry(elements=self.all_elements)
 
         # Beam attributes.
         if self.denomination is None:
             self.denomination = "Beam {0:.2f}x{1:.2f}".format(self.width, self.height)
 
+    def clear_section_index(self) -> None:
+        """
+        Discards the interval indexes used by section queries and rebuilds the position registry. Call it after moving,
+        resizing or relabeling elements of the beam in place, the indexes are rebuilt on the next section drawn.
+        """
+        self._section_indexes.clear()
+        self.position_registry = gen_position_registry(elements=self.all_elements)
+
     # Function that draws beam along longitudinal axe.
     def draw_longitudinal(self,
                           document: Drawing,
@@ -330,10 +381,13 @@ class Beam:
                           middle_axe: bool = True,
                           middle_axe_symbol: str = "A",
                           dim: bool = True,
+                          dim_stirrups: bool = True,
                           dim_style: str = "EZ_M_25_H25_CM",
                           unifilar_bars: bool = False,
                           unifilar_stirrups: bool = True,
-                          settings: dict = BEAM_SET_LONG) -> dict:
+                          compact_stirrups: bool = False,
+                          settings: dict = BEAM_SET_LONG,
+                          collect: bool = True) -> dict:
         """
         Draws the longitudinal section of the beam.
 
@@ -359,14 +413,20 @@ class Beam:
         :type middle_axe_symbol: str
         :param dim: If True, dimensions are drawn.
         :type dim: bool
+        :param dim_stirrups: If True, the dimensions of the stirrup zones are drawn (only with `dim`).
+        :type dim_stirrups: bool
         :param dim_style: The dimension style to be used.
         :type dim_style: str
         :param unifilar_bars: If True, the reinforcement bars are drawn as unifilar.
         :type unifilar_bars: bool
         :param unifilar_stirrups: If True, the stirrups are drawn as unifilar.
         :type unifilar_stirrups: bool
+        :param compact_stirrups: If True, each stirrup zone is drawn as one block array reference (MINSERT).
+        :type compact_stirrups: bool
         :param settings: Dictionary of drawing settings. Default is `BEAM_SET_LONG`.
         :type settings: dict
+        :param collect: If False, the entities are not grouped and only their number is returned ({"count": n}).
+        :type collect: bool
 
         :return: A list of graphical entities representing the longitudinal section of the beam.
         :rtype: list
@@ -395,7 +455,8 @@ class Beam:
                                                             y=y,
                                                             dimensions=dim,
                                                             dimensions_inner=False,
-                                                            settings=settings["concrete_settings"])
+                                                            settings=settings["concrete_settings"],
+                                                            collect=collect)
 
         # Drawing columns.
         if self.columns:
@@ -436,9 +497,11 @@ class Beam:
                     stirrup_dict_list.append(stirrup.draw_longitudinal(document=document,
                                                                        x=x + (stirrup.x - self.x),
                                                                        y=y + (stirrup.y - self.y),
-                                                                       unifilar=unifilar_stirrups))
+                                                                       unifilar=unifilar_stirrups,
+                                                                       compact=compact_stirrups,
+                                                                       collect=collect))
             # Drawing dimensions.
-            if dim:
+            if dim and dim_stirrups:
                 dim_y = y + self.height * 2
                 for stirrup in self.stirrups:
                     dim_elements += dim_linear(document=document,
@@ -461,7 +524,8 @@ class Beam:
                                                                                y=y_coord,
                                                                                unifilar=unifilar_bars,
                                                                                dimensions=False,
-                                                                               denomination=False))  # Only mayor bar.
+                                                                               denomination=False,
+                                                                               collect=collect))  # Only mayor bar.
                 if self.bars_as_inf:
                     x_coord = x + (self.bars_as_inf[0].x - self.x)
                     y_coord = y + (self.bars_as_inf[0].y - self.y)
@@ -472,7 +536,8 @@ class Beam:
                                                                                y=y_coord,
                                                                                unifilar=unifilar_bars,
                                                                                dimensions=False,
-                                                                               denomination=False))  # Only mayor bar.
+                                                                               denomination=False,
+                                                                               collect=collect))  # Only mayor bar.
                 for bar in self.bars_as_left:
                     x_coord = x + (bar.x - self.x)
                     y_coord = y + (bar.y - self.y)
@@ -483,7 +548,12 @@ class Beam:
                                                                y=y_coord,
                                                                unifilar=unifilar_bars,
                                                                dimensions=False,
-                                                               denomination=False))  # Only left bars.
+                                                               denomination=False,
+                                                               collect=collect))  # Only left bars.
+
+        if not collect:
+            return {"count": count_entities(concrete_dict, bar_dict_list, stirrup_dict_list, columns_elements,
+                                            columns_axes_elements, dim_elements, beam_axe_elements)}
 
         # Setting groups of elements in dictionary.
         elements["concrete"] = concrete_dict
@@ -493,7 +563,7 @@ class Beam:
         elements["columns_axes_elements"] = columns_axes_elements
         elements["dimensions_elements"] = dim_elements
         elements["beam_axe_elements"] = beam_axe_elements
-        elements["all_elements"] = (elements["concrete"]["all_elements"] +
+        elements["all_elements"] = ((elements["concrete"]["all_elements"] if elements["concrete"] else []) +
                                     list(chain(*[bar_dict["all_elements"] for bar_dict in elements["bars"]])) +
                                     list(chain(*[st_dict["all_elements"] for st_dict in elements["stirrups"]])) +
                                     columns_elements +
@@ -510,7 +580,8 @@ class Beam:
                         x_section: float = None,
                         unifilar: bool = False,
                         dimensions: bool = True,
-                        settings: dict = BEAM_SET_TRANSVERSE) -> dict:
+                        settings: dict = BEAM_SET_TRANSVERSE,
+                        collect: bool = True) -> dict:
         """
         Draws the transverse section of the beam at a given x-section.
 
@@ -528,6 +599,8 @@ class Beam:
         :type dimensions: bool
         :param settings: Dict with beam transverse drawing settings.
         :type settings: dict
+        :param collect: If False, the entities are not grouped and only their number is returned ({"count": n}).
+        :type collect: bool
 
         :return: A dict of graphical entities representing the transverse section of the beam.
         :rtype: dict
@@ -542,7 +615,7 @@ class Beam:
 
         # Checking if x given is in beam length.
         if not 0 <= x_section <= self.length:
-            return {}
+            return {} if collect else {"count": 0}
 
         elements = {}
         bar_dict_list = []
@@ -562,11 +635,12 @@ class Beam:
                                                       dimensions=dimensions,
                                                       dimensions_boxing=True,
                                                       dimensions_inner=False,
-                                                      settings=settings["concrete_settings"])
+                                                      settings=settings["concrete_settings"],
+                                                      collect=collect)
 
         # Drawing of bars.
         for bar in bars:
-            bar_dict_list.append(bar.draw_transverse(document=document, x=x, y=y))
+            bar_dict_list.append(bar.draw_transverse(document=document, x=x, y=y, collect=collect))
 
         # Drawing of stirrups.
         for stirrup in stirrups:
@@ -576,7 +650,11 @@ class Beam:
             stirrup_dict_list.append(stirrup.draw_transverse(document=document,
                                                              x=x + delta_x,
                                                              y=y + delta_y,
-                                                             unifilar=unifilar))
+                                                             unifilar=unifilar,
+                                                             collect=collect))
+
+        if not collect:
+            return {"count": count_entities(concrete_dict, bar_dict_list, stirrup_dict_list)}
 
         # Setting groups of elements in dictionary.
         elements["concrete"] = concrete_dict
@@ -597,7 +675,8 @@ class Beam:
                                           y: float = None,
                                           unifilar: bool = True,
                                           columns_axes: bool = True,
-                                          settings: dict = BEAM_SET_LONG_REBAR) -> dict:
+                                          settings: dict = BEAM_SET_LONG_REBAR,
+                                          collect: bool = True) -> dict:
         """
         Draws the longitudinal rebar detailing for the beam.
 
@@ -613,6 +692,8 @@ class Beam:
         :type columns_axes: bool
         :param settings: Dict with beam longitudinal rebar drawing settings.
         :type settings: dict
+        :param collect: If False, the entities are not grouped and only their number is returned ({"count": n}).
+        :type collect: bool
 
         :return: A list of graphical entities representing the longitudinal rebar detailing.
         :rtype: list
@@ -641,16 +722,17 @@ class Beam:
                                       height=settings["text_height"],
                                       point=(rebar_x - self.height * 2 * 0.8, rebar_y + self.height * 0.05 - spacing))
 
-            unique_bars_list = []
+            drawn_positions = set()
             for bar in bars:
-                if bar.denomination not in unique_bars_list:
+                if bar.position not in drawn_positions:
+                    drawn_positions.add(bar.position)
                     rebar_y -= spacing + bar.box_height
                     bars_elements.append(bar.draw_longitudinal(document=document,
                                                                x=rebar_x,
                                                                y=rebar_y,
                                                                unifilar=unifilar,
-                                                               dimensions=True))
-                    unique_bars_list.append(bar.denomination)
+                                                               dimensions=True,
+                                                               collect=collect))
             rebar_y -= spacing
 
             if barline:
@@ -737,6 +819,10 @@ class Beam:
                                                                  text_height=0.1,
                                                                  attr=GfxAttribs(linetype="CENTER"))
 
+        if not collect:
+            return {"count": count_entities(elements["text_elements"], elements["bars"], elements["barline_elements"],
+                                            elements["columns_axes_elements"])}
+
         # Setting groups of elements in dictionary.
         elements["all_elements"] = (elements["text_elements"] +
                                     list(chain(*[bar_dict["all_elements"] for bar_dict in elements["bars"]])) +
@@ -750,7 +836,8 @@ class Beam:
                                         y: float = None,
                                         x_section: float = None,
                                         unifilar: bool = False,
-                                        dimensions: bool = True) -> dict:
+                                        dimensions: bool = True,
+                                        collect: bool = True) -> dict:
         """
         Draws the transverse rebar detailing for the beam at a given x-section.
 
@@ -766,6 +853,8 @@ class Beam:
         :type unifilar: bool
         :param dimensions: If True, dimensions are drawn.
         :type dimensions: bool
+        :param collect: If False, the entities are not grouped and only their number is returned ({"count": n}).
+        :type collect: bool
 
         :return: A dict of graphical entities representing the transverse rebar detailing.
         :rtype: dict
@@ -777,7 +866,7 @@ class Beam:
 
         # Checking if x given is in beam length.
         if not 0 <= x_section <= self.length:
-            return elements
+            return elements if collect else {"count": 0}
 
         stirrups = self.__elements_section(elements=self.stirrups,
                                            x=x_section)
@@ -787,7 +876,11 @@ class Beam:
                                                                 x=x,
                                                                 y=y,
                                                                 unifilar=unifilar,
-                                                                dimensions=dimensions))
+                                                                dimensions=dimensions,
+                                                                collect=collect))
+
+        if not collect:
+            return {"count": count_entities(elements["stirrups"])}
 
         # Setting groups of elements in dictionary.
         elements["all_elements"] = list(chain(*[stirrup_dict["all_elements"] for stirrup_dict in elements["stirrups"]]))
@@ -918,12 +1011,25 @@ class Beam:
             x = self.x + self.length / 2  # Default value if is nothing entered.
 
         # Filtering elements by X coordinate.
-        entities = []
-        for element in elements:
-            if element.x <= self.x + x <= element.x + element.reinforcement_length:
-                entities.append(element)
+        return self.__section_index(elements=elements).query(self.x + x)
 
-        return entities
+    def __section_index(self, elements: list) -> IntervalIndex:
+        """
+        Returns the interval index of the elements given over their X span, building it if the group has no index yet
+        or if it has changed since the index was built.
+
+        :param elements: Group of entities (bars and stirrups).
+        :type elements: list
+        :return: Interval index of the group of entities.
+        :rtype: IntervalIndex
+        """
+        index = self._section_indexes.get(id(elements))
+        if index is None or index.items is not elements or len(index) != len(elements):
+            spans = [(element.x, element.x + element.reinforcement_length) for element in elements]
+            index = IntervalIndex(items=elements, spans=spans)
+            self._section_indexes[id(elements)] = index
+
+        return index
 
     def __list_to_stirrups(self) -> list:
         """
@@ -961,46 +1067,47 @@ class Beam:
 
         return entities
 
-    def __dict_to_position_bars(self):
-        positions = {}
-        for bar in self.all_bars:
-            if bar.denomination not in positions:
-                positions[bar.denomination] = {"denomination:": bar.denomination, "quantity": 1, "bar": bar}
-            else:
-                positions[bar.denomination]["quantity"] += 1
-
     def draw_table_rebar_detailing(self,
                                    document: Drawing,
                                    x: float = None,
-                                   y: float = None) -> dict:
+                                   y: float = None,
+                                   page_rows: int = None,
+                                   collect: bool = True) -> dict:
+        labels = ["POSITION", "DIAMETER", "SPACING", "QUANTITY", "LENGTH", "TOTAL LENGTH", "WEIGHT"]
+
+        # Drawing table in pages, rows are streamed from the data iterator.
+        if page_rows:
+            table = CADTable(rows=0, columns=len(labels), labels=labels)
+            return table.draw_pages(document=document, rows=self.iter_data(), x=x, y=y, page_rows=page_rows,
+                                    collect=collect)
+
         # Getting data.
         data = self.extract_data()
 
         # Creating table.
-        table = CADTable(data=data, labels=["POSITION", "DIAMETER", "SPACING", "QUANTITY", "LENGTH", "TOTAL LENGTH",
-                                            "WEIGHT"])
+        table = CADTable(data=data, labels=labels)
 
         # Drawing table.
-        elements = table.draw_table(document=document, x=x, y=y)
+        elements = table.draw_table(document=document, x=x, y=y, collect=collect)
 
         return elements
 
     def extract_data(self) -> list:
-        data = []
-        position_list = []
-        for element in (self.all_bars + self.stirrups):
-            if element.position not in position_list:
-                position = element.position
-                diameter = element.diameter
-                spacing = "{0}".format(element.spacing) if element.element_type == ElementTypes.STIRRUP else "-"
-                quantity = element.quantity if element.element_type == ElementTypes.STIRRUP else self.positions[element.position]["quantity"]
-                length = "{0:.2f}".format(float(element.length))
-                total_length = "{0:.2f}".format(element.quantity * element.length)
-
-                weight = "{0:.2f}".format(element.quantity * element.weight)
-                total_weight = 0
-
-                data.append([position, diameter, spacing, quantity, length, total_length, weight])
-                position_list.append(element.position)
-
-        return data
+        return list(self.iter_data())
+
+    def iter_data(self) -> Iterator[list]:
+        """
+        Yields the rows of `extract_data` one at a time, so long tables can be drawn without building every row first.
+        Rows are taken from the position registry, one per bar or stirrup position.
+
+        :return: Iterator over the rows [POSITION, DIAMETER, SPACING, QUANTITY, LENGTH, TOTAL LENGTH, WEIGHT].
+        :rtype: Iterator[list]
+        """
+        for position, entry in self.position_registry.items():
+            element = entry["bar"]
+            spacing = "{0}".format(element.spacing) if element.element_type == ElementTypes.STIRRUP else "-"
+            length = "{0:.2f}".format(float(element.length))
+            total_length = "{0:.2f}".format(entry["length"])
+            weight = "{0:.2f}".format(entry["weight"])
+
+            yield [position, element.diameter, spacing, entry["quantity"], length, total_length, weight]
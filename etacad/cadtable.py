@@ -2,13 +2,18 @@
 
 # Imports.
 # Local imports.
-from etacad.drawing_utils import mtext, rect
-from etacad.globals import CADTABLE_SET_DEFAULT, Aligment, ElementTypes
-from etacad.utils import max_per_position, text_width_estimation
+from etacad.drawing_utils import count_entities, lines, mtext
+from etacad.dxf_writer import DXFStreamWriter
+from etacad.globals import CADTABLE_SET_DEFAULT, Aligment, Direction, ElementTypes
+from etacad.utils import max_per_position, text_width_estimation, text_widths_estimation
 
 # External imports.
+import numpy as np
+
 from attrs import define, field
 from ezdxf.document import Drawing
+from itertools import chain, islice
+from typing import Iterable
 
 
 @define
@@ -29,52 +34,64 @@ class CADTable:
     rows_length: float = field(init=False)
     columns_height: float = field(init=False)
     column_width_labels: list = field(init=False)
+    table_column_widths: list = field(init=False, default=None)
+    _content_widths: np.ndarray = field(init=False, default=None, repr=False)
 
     def __attrs_post_init__(self):
         # Table dimensions content.
-        if self.settings["content_fit"] and self.data:
+        if self.data:
             self.rows = len(self.data)
             self.columns = len(self.data[0])
-            self.row_heights = [self.settings["content_row_height"]] * self.rows
-
-            column_widths = [0] * self.columns
-            for row in self.data:
-                for i, content in enumerate(row):
-                    width = text_width_estimation(content, self.settings["content_text_height"])
-                    if width > column_widths[i]:
-                        column_widths[i] = width
+        self.row_heights = [self.settings["content_row_height"]] * self.rows
 
-            self.column_widths = column_widths
-
-        elif self.data:
-            self.rows = len(self.data)
-            self.columns = len(self.data[0])
-            self.row_heights = [self.settings["content_row_height"]] * self.rows
+        if self.settings["content_fit"] and self.data:
+            self._content_widths = text_widths_estimation(self.data,
+                                                          self.settings["content_text_height"],
+                                                          font=self.settings.get("text_font"))
+            self.column_widths = self._content_widths.max(axis=0).tolist()
+        else:
             self.column_widths = [self.settings["content_row_height"]] * self.columns
 
+        # Table dimensions labels.
+        if self.settings["labels_fit"]:
+            self.column_width_labels = [text_width_estimation(label,
+                                                              self.settings["labels_text_height"],
+                                                              font=self.settings.get("text_font"))
+                                        for label in self.labels]
         else:
-            self.row_heights = [self.settings["content_row_height"]] * self.rows
-            self.column_widths = [self.settings["content_row_height"]] * self.columns
+            self.column_width_labels = self.settings["labels_column_width"]
+
+        self.__fit_table()
 
+    def __fit_table(self) -> None:
+        # Table dimensions, computed once and reused by every drawing method.
         self.rows_length = sum(self.column_widths)
         self.columns_height = sum(self.row_heights)
 
-        # Table dimensions labels.
-        if self.settings["labels_fit"]:
-            self.column_width_labels = [text_width_estimation(label, self.settings["labels_text_height"]) for label in self.labels]
+        if isinstance(self.column_width_labels, list) and len(self.column_width_labels) == len(self.column_widths):
+            self.table_column_widths = max_per_position(self.column_widths, self.column_width_labels)
         else:
-            self.column_width_labels = self.settings["labels_column_width"]
+            self.table_column_widths = None
 
     def cell_content_edit(self, row: int, column: int, text=str):
         self.data[row][column] = text
 
+        # Fitting the column to the new content.
+        if self._content_widths is not None:
+            self._content_widths[row, column] = text_width_estimation(text,
+                                                                      self.settings["content_text_height"],
+                                                                      font=self.settings.get("text_font"))
+            self.column_widths[column] = float(self._content_widths[:, column].max())
+            self.__fit_table()
+
     def draw_grid(self, document: Drawing,
                   rows: int = None,
                   columns: int = None,
                   x: float = None,
                   y: float = None,
                   row_heights: list = None,
-                  column_widths: list = None) -> dict:
+                  column_widths: list = None,
+                  collect: bool = True) -> dict:
         if rows is None:
             rows = self.rows
 
@@ -93,31 +110,25 @@ class CADTable:
         if column_widths is None:
             column_widths = self.column_widths
 
-        rows_length, columns_height = sum(column_widths), sum(row_heights)
-
-        grid_hz_lines = []
-        y_hz_line = y
-        for i in range(rows):
-            sides = [0, 0, 1, 0] if i < rows - 1 else [1, 0, 1, 0]
-            grid_hz_lines += rect(doc=document,
-                                  width=rows_length,
-                                  height=row_heights[i],
-                                  x=x,
-                                  y=y_hz_line,
-                                  sides=sides)
-            y_hz_line += row_heights[i]
-
-        grid_vt_lines = []
-        x_vt_lines = x
-        for i in range(columns):
-            sides = [0, 0, 0, 1] if i < columns - 1 else [0, 1, 0, 1]
-            grid_vt_lines += rect(doc=document,
-                                  width=column_widths[i],
-                                  height=columns_height,
-                                  x=x_vt_lines,
-                                  y=y,
-                                  sides=sides)
-            x_vt_lines += column_widths[i]
+        rows_length = self.rows_length if column_widths is self.column_widths else sum(column_widths)
+        columns_height = self.columns_height if row_heights is self.row_heights else sum(row_heights)
+
+        # Grid lines coordinates, every line is drawn from side to side of the grid (last row and column borders are
+        # ordered outer side first). Without rows or columns, no lines are drawn in that direction.
+        grid_hz_lines, grid_vt_lines = [], []
+        if rows > 0:
+            y_hz_lines = np.cumsum([y, *row_heights[:rows]])[[*range(rows - 1), rows, rows - 1]]
+            grid_hz_lines = lines(doc=document,
+                                  start_points=np.column_stack((np.full(rows + 1, x), y_hz_lines)),
+                                  end_points=np.column_stack((np.full(rows + 1, x + rows_length), y_hz_lines)))
+        if columns > 0:
+            x_vt_lines = np.cumsum([x, *column_widths[:columns]])[[*range(columns - 1), columns, columns - 1]]
+            grid_vt_lines = lines(doc=document,
+                                  start_points=np.column_stack((x_vt_lines, np.full(columns + 1, y))),
+                                  end_points=np.column_stack((x_vt_lines, np.full(columns + 1, y + columns_height))))
+
+        if not collect:
+            return {"count": count_entities(grid_hz_lines, grid_vt_lines)}
 
         # Setting groups of elements in dictionary.
         elements = {"grid_hz_lines": grid_hz_lines,
@@ -130,7 +141,8 @@ class CADTable:
                     x: float = None,
                     y: float = None,
                     row_height: float = None,
-                    column_widths: list = None) -> dict:
+                    column_widths: list = None,
+                    collect: bool = True) -> dict:
         if x is None:
             x = self.x
 
@@ -149,7 +161,8 @@ class CADTable:
                                   rows=1,
                                   columns=len(column_widths),
                                   row_heights=row_height,
-                                  column_widths=column_widths)
+                                  column_widths=column_widths,
+                                  collect=collect)
 
         texts, x_mtext = [], x
         for i, label in enumerate(self.labels):
@@ -163,6 +176,10 @@ class CADTable:
                            rotation=0,
                            aligment=Aligment.MTEXT_MIDDLE_CENTER.value)
             x_mtext += column_widths[i] / 2
+
+        if not collect:
+            return {"count": count_entities(elements, texts)}
+
         elements["texts"] = texts
 
         # Setting groups of elements in dictionary.
@@ -174,7 +191,8 @@ class CADTable:
                      x: float = None,
                      y: float = None,
                      row_height: float = None,
-                     column_widths: list = None) -> dict:
+                     column_widths: list = None,
+                     collect: bool = True) -> dict:
         if x is None:
             x = self.x
 
@@ -193,26 +211,34 @@ class CADTable:
                                   rows=self.rows,
                                   columns=self.columns,
                                   row_heights=row_height,
-                                  column_widths=column_widths)
+                                  column_widths=column_widths,
+                                  collect=collect)
+
+        # Column centers, shared by every row.
+        x_mtexts, x_mtext = [], x
+        for column_width in column_widths:
+            x_mtexts.append(x_mtext + column_width / 2)
+            x_mtext += column_width
 
         y_mtext = y
-        reversed_data = self.data.copy()
-        reversed_data.reverse()
-        for j, row in enumerate(reversed_data):
+        for j, row in enumerate(reversed(self.data or [])):
             y_mtext += row_height[j] / 2
-            texts, x_mtext = [], x
+            texts = []
             for i, text in enumerate(row):
-                x_mtext += column_widths[i] / 2
                 texts += mtext(document=document,
                                textstr=text,
                                height=self.settings["content_text_height"],
-                               x=x_mtext,
+                               x=x_mtexts[i],
                                y=y_mtext,
                                width=column_widths[i],
                                rotation=0,
                                aligment=Aligment.MTEXT_MIDDLE_CENTER.value)
-                x_mtext += column_widths[i] / 2
             y_mtext += row_height[j] / 2
+
+            if not collect:
+                elements["count"] += len(texts)
+                continue
+
             elements["texts_row" + str(j)] = texts
             elements["all_elements"] += texts
 
@@ -222,7 +248,8 @@ class CADTable:
                    x: float = None,
                    y: float = None,
                    row_height: float = None,
-                   column_widths: list = None) -> dict:
+                   column_widths: list = None,
+                   collect: bool = True) -> dict:
         if x is None:
             x = self.x
 
@@ -233,18 +260,88 @@ class CADTable:
             row_height = self.row_heights
 
         if column_widths is None:
-            column_widths = max_per_position(self.column_widths, self.column_width_labels)
+            column_widths = self.table_column_widths
+            if column_widths is None:
+                column_widths = max_per_position(self.column_widths, self.column_width_labels)
 
         elements = {"labels": self.draw_labels(document=document,
                                                x=x,
                                                y=y + self.columns_height,
-                                               column_widths=column_widths),
+                                               column_widths=column_widths,
+                                               collect=collect),
                     "content": self.draw_content(document=document,
                                                  x=x,
                                                  y=y,
                                                  row_height=row_height,
-                                                 column_widths=column_widths)}
+                                                 column_widths=column_widths,
+                                                 collect=collect)}
+
+        if not collect:
+            return {"count": count_entities(elements["labels"], elements["content"])}
+
         # Setting groups of elements in dictionary.
         elements["all_elements"] = elements["labels"]["all_elements"] + elements["content"]["all_elements"]
 
         return elements
+
+    # Function that draws rows given in pages of a fixed number of rows, placed side by side (HORIZONTAL) or one
+    # under another (VERTICAL). Rows are taken from the iterator page by page, so only a page is kept in memory; with a
+    # stream writer the entities of every page are written to disk once drawn (see DXFStreamWriter).
+    def draw_pages(self, document: Drawing,
+                   rows: Iterable[list] = None,
+                   x: float = None,
+                   y: float = None,
+                   page_rows: int = 40,
+                   page_spacing: float = 0.5,
+                   direction: Direction = Direction.HORIZONTAL,
+                   column_widths: list = None,
+                   writer: DXFStreamWriter = None,
+                   collect: bool = True) -> dict:
+        if x is None:
+            x = self.x
+
+        if y is None:
+            y = self.y
+
+        # Pages share the widths of the whole table when its data is known, otherwise every page fits its rows.
+        if column_widths is None and rows is None:
+            column_widths = self.table_column_widths
+
+        if rows is None:
+            rows = self.data
+
+        page_height = page_rows * self.settings["content_row_height"] + self.settings["labels_row_height"]
+
+        elements, count = {"pages": []}, 0
+        rows = iter(rows)
+        x_page, y_page = x, y
+        while page_data := list(islice(rows, page_rows)):
+            page = CADTable(data=page_data, labels=self.labels, settings=self.settings)
+            page_widths = column_widths if column_widths is not None else page.table_column_widths
+
+            # Pages are aligned by their top side.
+            page_elements = page.draw_table(document=document,
+                                            x=x_page,
+                                            y=y_page + (page_rows - page.rows) * self.settings["content_row_height"],
+                                            column_widths=page_widths,
+                                            collect=collect)
+            if writer is not None:
+                writer.flush()
+
+            if collect:
+                elements["pages"].append(page_elements)
+            else:
+                count += page_elements["count"]
+
+            if direction == Direction.HORIZONTAL:
+                x_page += sum(page_widths) + page_spacing
+            else:
+                y_page -= page_height + page_spacing
+
+        if not collect:
+            return {"count": count}
+
+        # Setting groups of elements in dictionary.
+        elements["all_elements"] = list(chain(*[page["all_elements"] for page in elements["pages"]]))
+
+        return elements
@@ -5,21 +5,24 @@ from etacad.bar import Bar
 from etacad.cadtable import CADTable
 from etacad.concrete import Concrete
 from etacad.converters import to_list
-from etacad.drawing_utils import delimit_axe, dim_linear, rect, text
+from etacad.drawing_utils import count_entities, delimit_axe, dim_linear, rect, text
+from etacad.geometry import IntervalIndex
 from etacad.globals import (COLUMN_SET_TRANSVERSE, COLUMN_SET_LONG_REBAR, ColumnTypes, Direction, ElementTypes,
                             Orientation, CONCRETE_WEIGHT, COLUMN_SET_LONG, COLUMN_SET_TRANSVERSE_REBAR)
+from etacad.redraw import Redrawable
 from etacad.stirrup import Stirrup
-from etacad.utils import gen_symmetric_list, gen_position_bars
+from etacad.utils import gen_symmetric_list, gen_position_bars, gen_position_registry
 
 # External imports.
 from attrs import define, field
 from ezdxf.document import Drawing
 from ezdxf.gfxattribs import GfxAttribs
 from itertools import chain
+from typing import Iterator
 
 
 @define
-class Column:
+class Column(Redrawable):
     """
     Column element, computes geometrics and physics props and manages dxf drawing methods (longitudinal, transversal,
     reinforcement detailing, etc.)
@@ -157,6 +160,8 @@ class Column:
     :vartype all_bars: list
     :ivar all_elements: List of all elements in the column.
     :vartype all_elements: list
+    :ivar position_registry: Bars and stirrups aggregated by position (see `gen_position_registry`).
+    :vartype position_registry: dict
 
     :ivar box_width: Width of the bounding box for the column.
     :vartype box_width: float
@@ -168,6 +173,39 @@ class Column:
     :ivar element_type: Type of element, set to COLUMN by default.
     :vartype element_type: int
     """
+    # Redrawing dependencies (see Redrawable).
+    _GROUPS = frozenset({"concrete", "beams", "bars", "stirrups"})
+    _DEPENDENCIES = {"as_sup": {"bars", "stirrups"},
+                     "as_right": {"bars", "stirrups"},
+                     "as_inf": {"bars", "stirrups"},
+                     "as_left": {"bars", "stirrups"},
+                     "anchor_sup": {"bars"},
+                     "anchor_right": {"bars"},
+                     "anchor_inf": {"bars"},
+                     "anchor_left": {"bars"},
+                     "number_init": {"bars", "stirrups"},
+                     "nomenclature": {"bars", "stirrups"},
+                     "stirrups_db": {"stirrups"},
+                     "stirrups_anchor": {"stirrups"},
+                     "stirrups_sep": {"stirrups"},
+                     "stirrups_length": {"stirrups"},
+                     "stirrups_x": {"stirrups"},
+                     "beams": {"beams"},
+                     "beams_pos": {"beams"},
+                     "beams_symbol": {"beams"},
+                     "concrete_specific_weight": set(),
+                     "denomination": set(),
+                     "element_type": set()}
+    _VIEWS = {"draw_longitudinal": {"concrete": ({"concrete"}, ("concrete_shape",)),
+                                    "middle_axe": ({"concrete"}, ("middle_axe",)),
+                                    "beams": ({"beams"}, ("beams", "beams_axes")),
+                                    "stirrups": ({"stirrups"}, ("stirrups",)),
+                                    "bars": ({"bars"}, ("bars",))},
+              "draw_transverse": {"section": ({"concrete", "bars", "stirrups"}, ())},
+              "draw_longitudinal_rebar_detailing": {"detailing": ({"bars"}, ())},
+              "draw_transverse_rebar_detailing": {"detailing": ({"concrete", "bars", "stirrups"}, ())},
+              "draw_table_rebar_detailing": {"table": ({"bars", "stirrups"}, ())}}
+
     # Geometric attributes.
     width: float = field(converter=float)
     depth: float = field(converter=float)
@@ -229,6 +267,7 @@ class Column:
     # Entities groups.
     all_bars: list = field(init=False)
     all_elements: list = field(init=False)
+    _section_indexes: dict = field(init=False, factory=dict, repr=False)
 
     # Box attributes.
     box_width: float = field(init=False)
@@ -237,6 +276,7 @@ class Column:
     # Position bar attributes.
     nomenclature: str = field(default="#")
     positions: dict = field(init=False)
+    position_registry: dict = field(init=False, repr=False)
 
     # Column attributes.
     denomination: str = field(default=None)
@@ -244,6 +284,8 @@ class Column:
     element_type: ElementTypes = field(default=ElementTypes.COLUMN)
 
     def __attrs_post_init__(self):
+        self._record_inputs()
+
         # Longitudinal steel attributes.
         if self.number_init is None:
             self.number_init = 0
@@ -338,11 +380,20 @@ class Column:
         # Entities groups.
         self.all_bars = self.bars_as_sup + self.bars_as_right + self.bars_as_inf + self.bars_as_left
         self.all_elements = self.all_bars + self.stirrups
+        self.position_registry = gen_position_registry(elements=self.all_elements)
 
         # Box attributes.
         self.box_width = self.width
         self.box_height = self.height
 
+    def clear_section_index(self) -> None:
+        """
+        Discards the interval indexes used by section queries and rebuilds the position registry. Call it after moving,
+        resizing or relabeling elements of the column in place, the indexes are rebuilt on the next section drawn.
+        """
+        self._section_indexes.clear()
+        self.position_registry = gen_position_registry(elements=self.all_elements)
+
     def draw_longitudinal(self, document: Drawing,
                           x: float = None,
                           y: float = None,
@@ -356,7 +407,9 @@ class Column:
                           dim: bool = True,
                           dim_style: str = "EZ_M_25_H25_CM",
                           unifilar_bars: bool = False,
-                          unifilar_stirrups: bool = True) -> dict:
+                          unifilar_stirrups: bool = True,
+                          compact_stirrups: bool = False,
+                          collect: bool = True) -> dict:
         """
         Draws the longitudinal view of the column, including concrete shape, beams,
         stirrups, and bars. Also includes dimensioning and optional middle axes.
@@ -389,6 +442,11 @@ class Column:
         :type unifilar_bars: bool
         :param unifilar_stirrups: Whether to draw stirrups in unifilar view. Defaults to True.
         :type unifilar_stirrups: bool
+        :param compact_stirrups: Whether to draw each stirrup zone as one block array reference (MINSERT).
+            Defaults to False.
+        :type compact_stirrups: bool
+        :param collect: If False, the entities are not grouped and only their number is returned ({"count": n}).
+        :type collect: bool
         :return: A dict of entities drawn on the document.
         :rtype: dict
         """
@@ -415,7 +473,8 @@ class Column:
                                                                    y=y,
                                                                    dimensions=dim,
                                                                    dimensions_inner=False,
-                                                                   settings=COLUMN_SET_LONG["concrete_settings"])
+                                                                   settings=COLUMN_SET_LONG["concrete_settings"],
+                                                                   collect=collect)
 
         # Drawing beams.
         if self.beams:
@@ -458,7 +517,9 @@ class Column:
                 elements["stirrups"].append(stirrup.draw_longitudinal(document=document,
                                                                       x=x + (stirrup.x - self.x),
                                                                       y=y + (stirrup.y - self.y),
-                                                                      unifilar=unifilar_stirrups))
+                                                                      unifilar=unifilar_stirrups,
+                                                                      compact=compact_stirrups,
+                                                                      collect=collect))
             # Drawing dimensions.
             if dim:
                 for stirrup in self.stirrups:
@@ -482,10 +543,14 @@ class Column:
                                                                   y=y + (bar.y - self.y),
                                                                   unifilar=unifilar_bars,
                                                                   dimensions=False,
-                                                                  denomination=False))  # Only left bars.
+                                                                  denomination=False,
+                                                                  collect=collect))  # Only left bars.
+
+        if not collect:
+            return {"count": count_entities(*elements.values())}
 
         # Setting groups of elements in dictionary.
-        elements["all_elements"] = (elements["concrete"]["all_elements"] +
+        elements["all_elements"] = ((elements["concrete"]["all_elements"] if elements["concrete"] else []) +
                                     elements["beam_elements"] +
                                     elements["beam_axe_elements"] +
                                     elements["column_axe_elements"] +
@@ -502,7 +567,8 @@ class Column:
                         y_section: float = None,
                         unifilar: bool = False,
                         dimensions: bool = True,
-                        settings: dict = COLUMN_SET_TRANSVERSE) -> dict:
+                        settings: dict = COLUMN_SET_TRANSVERSE,
+                        collect: bool = True) -> dict:
         """
         Draws the transverse view of the column at a given y-section.
         generate a drawing from the transverse perspective.
@@ -521,6 +587,8 @@ class Column:
         :type dimensions: bool
         :param settings: Dict with column transverse drawing settings.
         :type settings: dict
+        :param collect: If False, the entities are not grouped and only their number is returned ({"count": n}).
+        :type collect: bool
         :return: A dict of entities representing the transverse view of the column.
         :rtype: dict
         """
@@ -534,7 +602,7 @@ class Column:
 
         # Checking if y given is in column height.
         if not 0 <= y_section <= self.height:
-            return {}
+            return {} if collect else {"count": 0}
 
         elements = {"concrete": None,
                     "bars": [],
@@ -554,11 +622,12 @@ class Column:
                                                              dimensions=dimensions,
                                                              dimensions_boxing=True,
                                                              dimensions_inner=False,
-                                                             settings=settings["concrete_settings"])
+                                                             settings=settings["concrete_settings"],
+                                                             collect=collect)
 
         # Drawing of bars.
         for bar in bars:
-            elements["bars"].append(bar.draw_transverse(document=document, x=x, y=y))
+            elements["bars"].append(bar.draw_transverse(document=document, x=x, y=y, collect=collect))
 
         # Drawing of stirrups.
         for stirrup in stirrups:
@@ -568,7 +637,11 @@ class Column:
             elements["stirrups"].append(stirrup.draw_transverse(document=document,
                                                                 x=x + delta_x,
                                                                 y=y + delta_y,
-                                                                unifilar=unifilar))
+                                                                unifilar=unifilar,
+                                                                collect=collect))
+
+        if not collect:
+            return {"count": count_entities(*elements.values())}
 
         # Setting groups of elements in dictionary.
         elements["all_elements"] = (elements["concrete"]["all_elements"] +
@@ -583,7 +656,8 @@ class Column:
                                           y: float = None,
                                           unifilar: bool = True,
                                           beam_axes: bool = True,
-                                          settings: dict = COLUMN_SET_LONG_REBAR) -> dict:
+                                          settings: dict = COLUMN_SET_LONG_REBAR,
+                                          collect: bool = True) -> dict:
         """
         Draws the longitudinal rebar detailing for the column.
 
@@ -599,6 +673,8 @@ class Column:
         :type beam_axes: bool
         :param settings: Dict with column longitudinal rebar drawing settings.
         :type settings: dict
+        :param collect: If False, the entities are not grouped and only their number is returned ({"count": n}).
+        :type collect: bool
         :return: A dict of graphical entities representing the longitudinal rebar detailing.
         :rtype: dict
         """
@@ -626,17 +702,18 @@ class Column:
                                       height=settings["text_height"],
                                       point=(rebar_x + 0.02, rebar_y + self.height + spacing * 2))
 
-            unique_bars_list = []
+            drawn_positions = set()
             for bar in bars:
-                if bar.denomination not in unique_bars_list:
+                if bar.position not in drawn_positions:
+                    drawn_positions.add(bar.position)
                     rebar_x += spacing + bar.box_height
                     bars_elements.append(bar.draw_longitudinal(document=document,
                                                                x=rebar_x,
                                                                y=rebar_y,
                                                                unifilar=unifilar,
                                                                dimensions=True,
-                                                               settings=settings["bar_settings"]))
-                    unique_bars_list.append(bar.denomination)
+                                                               settings=settings["bar_settings"],
+                                                               collect=collect))
 
             if barline:
                 barline_elements += rect(doc=document,
@@ -725,6 +802,10 @@ class Column:
         #                              text_height=0.1,
         #                              attr=GfxAttribs(linetype="CENTER"))
 
+        if not collect:
+            return {"count": count_entities(elements["text_elements"], elements["bars"], elements["barline_elements"],
+                                            elements["beam_axes_elements"])}
+
         # Setting groups of elements in dictionary.
         elements["all_elements"] = (elements["text_elements"] +
                                     list(chain(*[bar_dict["all_elements"] for bar_dict in elements["bars"]])) +
@@ -739,7 +820,8 @@ class Column:
                                         y_section: float = None,
                                         unifilar: bool = False,
                                         dimensions: bool = True,
-                                        settings: dict = COLUMN_SET_TRANSVERSE_REBAR) -> dict:
+                                        settings: dict = COLUMN_SET_TRANSVERSE_REBAR,
+                                        collect: bool = True) -> dict:
         """
         Draws the transverse rebar detailing for the column at a given y-section.
 
@@ -757,6 +839,8 @@ class Column:
         :type dimensions: bool
         :param settings: Dict with column longitudinal rebar drawing settings.
         :type settings: dict
+        :param collect: If False, the entities are not grouped and only their number is returned ({"count": n}).
+        :type collect: bool
         :return: A dict of graphical entities representing the transverse rebar detailing.
         :rtype: dict
         """
@@ -765,7 +849,7 @@ class Column:
 
         # Checking if x given is in beam length.
         if not 0 <= y_section <= self.height:
-            return {}
+            return {} if collect else {"count": 0}
 
         elements = {"stirrups": []}
 
@@ -777,7 +861,11 @@ class Column:
                                                                 x=x,
                                                                 y=y,
                                                                 unifilar=unifilar,
-                                                                dimensions=dimensions))
+                                                                dimensions=dimensions,
+                                                                collect=collect))
+
+        if not collect:
+            return {"count": count_entities(elements["stirrups"])}
 
         # Setting groups of elements in dictionary.
         elements["all_elements"] = (list(chain(*[st_dict["all_elements"] for st_dict in elements["stirrups"]])))
@@ -922,13 +1010,26 @@ class Column:
         if y is None:
             y = self.y + self.height / 2  # Default value if is nothing entered.
 
-        # Filtering elements by X coordinate.
-        entities = []
-        for element in elements:
-            if element.y <= self.y + y <= element.y + element.reinforcement_length:
-                entities.append(element)
+        # Filtering elements by Y coordinate.
+        return self.__section_index(elements=elements).query(self.y + y)
 
-        return entities
+    def __section_index(self, elements: list) -> IntervalIndex:
+        """
+        Returns the interval index of the elements given over their Y span, building it if the group has no index yet
+        or if it has changed since the index was built.
+
+        :param elements: Group of entities (bars and stirrups).
+        :type elements: list
+        :return: Interval index of the group of entities.
+        :rtype: IntervalIndex
+        """
+        index = self._section_indexes.get(id(elements))
+        if index is None or index.items is not elements or len(index) != len(elements):
+            spans = [(element.y, element.y + element.reinforcement_length) for element in elements]
+            index = IntervalIndex(items=elements, spans=spans)
+            self._section_indexes[id(elements)] = index
+
+        return index
 
     def __list_to_stirrups(self) -> list:
         """
@@ -974,36 +1075,44 @@ class Column:
     def draw_table_rebar_detailing(self,
                                    document: Drawing,
                                    x: float = None,
-                                   y: float = None) -> dict:
+                                   y: float = None,
+                                   page_rows: int = None,
+                                   collect: bool = True) -> dict:
+        labels = ["POSITION", "DIAMETER", "SPACING", "QUANTITY", "LENGTH", "TOTAL LENGTH", "WEIGHT"]
+
+        # Drawing table in pages, rows are streamed from the data iterator.
+        if page_rows:
+            table = CADTable(rows=0, columns=len(labels), labels=labels)
+            return table.draw_pages(document=document, rows=self.iter_data(), x=x, y=y, page_rows=page_rows,
+                                    collect=collect)
+
         # Getting data.
         data = self.extract_data()
 
         # Creating table.
-        table = CADTable(data=data, labels=["POSITION", "DIAMETER", "SPACING", "QUANTITY", "LENGTH", "TOTAL LENGTH",
-                                            "WEIGHT"])
+        table = CADTable(data=data, labels=labels)
 
         # Drawing table.
-        elements = table.draw_table(document=document, x=x, y=y)
+        elements = table.draw_table(document=document, x=x, y=y, collect=collect)
 
         return elements
 
     def extract_data(self) -> list:
-        data = []
-        position_list = []
-        for element in (self.all_bars + self.stirrups):
-            if element.position not in position_list:
-                position = element.position
-                diameter = element.diameter
-                spacing = "{0}".format(element.spacing) if element.element_type == ElementTypes.STIRRUP else "-"
-                quantity = element.quantity if element.element_type == ElementTypes.STIRRUP else \
-                self.positions[element.position]["quantity"]
-                length = "{0:.2f}".format(float(element.length))
-                total_length = "{0:.2f}".format(element.quantity * element.length)
-
-                weight = "{0:.2f}".format(element.quantity * element.weight)
-                total_weight = 0
-
-                data.append([position, diameter, spacing, quantity, length, total_length, weight])
-                position_list.append(element.position)
-
-        return data
+        return list(self.iter_data())
+
+    def iter_data(self) -> Iterator[list]:
+        """
+        Yields the rows of `extract_data` one at a time, so long tables can be drawn without building every row first.
+        Rows are taken from the position registry, one per bar or stirrup position.
+
+        :return: Iterator over the rows [POSITION, DIAMETER, SPACING, QUANTITY, LENGTH, TOTAL LENGTH, WEIGHT].
+        :rtype: Iterator[list]
+        """
+        for position, entry in self.position_registry.items():
+            element = entry["bar"]
+            spacing = "{0}".format(element.spacing) if element.element_type == ElementTypes.STIRRUP else "-"
+            length = "{0:.2f}".format(float(element.length))
+            total_length = "{0:.2f}".format(entry["length"])
+            weight = "{0:.2f}".format(entry["weight"])
+
+            yield [position, element.diameter, spacing, entry["quantity"], length, total_length, weight]
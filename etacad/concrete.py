@@ -2,17 +2,23 @@
 
 # Imports.
 # Locals imports.
-from etacad.drawing_utils import line, polyline, translate, dim_linear
+from etacad.drawing_utils import count_entities, line, polyline, translate, dim_linear
 from etacad.globals import (CONCRETE_WEIGHT, DRotation, CONCRETE_SET_LONG, CONCRETE_SET_TRANSVERSE,
                             CONCRETE_SET_RIGHT_VIEW, CONCRETE_SET_FRONT_VIEW, ElementTypes)
 from etacad.geometry.polygon import Polygon
 from etacad.geometry.utils import displace_perpendicular, get_angle
 
 # External imports.
-from attrs import define, field
+from attrs import define, field, setters
 from ezdxf.document import Drawing
 
 
+# Function that discards the cached polygon of a concrete section when its vertices are set.
+def _reset_polygon(instance, attribute, value):
+    instance.clear_polygon()
+    return value
+
+
 @define
 class Concrete:
     """
@@ -62,16 +68,18 @@ class Concrete:
         Draws the concrete section in the transverse direction with optional dimensioning.
 
     polygon
-        Property method to return a Polygon object created from the vertices of the concrete section.
+        Property method to return the Polygon object created from the vertices of the concrete section. The polygon
+        is built once and cached, assigning new vertices discards it.
     """
     # Geometric attributes.
-    vertices: list[tuple[float, float]]
+    vertices: list[tuple[float, float]] = field(on_setattr=setters.pipe(setters.convert, setters.validate,
+                                                                         _reset_polygon))
     height: float = field(default=None)
     length: float = field(default=None)
     x: float = field(default=0.0)
     y: float = field(default=0.0)
     dim3D: float = field(init=False)
-    # polygon: Polygon = field(init=False)
+    _polygon: Polygon = field(init=False, default=None, repr=False, eq=False)
 
     # Physics attributes.
     volume: float = field(init=False)
@@ -89,36 +97,62 @@ class Concrete:
 
     def __attrs_post_init__(self):
         # Geometric attributes.
-        self.vertices = self.polygon.vertices
+        polygon = self.polygon
+        self.vertices = polygon.vertices
+        self._polygon = polygon  # Normalized vertices, same polygon.
+
+        min_x, min_y, max_x, max_y = polygon.bounding_box
         if self.height is not None:
             self.dim3D = self.height
-            self.box_width = self.polygon.get_right_point()[0][0] - self.polygon.get_left_point()[0][0]
+            self.box_width = max_x - min_x
             self.box_height = self.height
 
         elif self.length is not None:
             self.dim3D = self.length
             self.box_width = self.length
-            self.box_height = self.polygon.get_top_point()[0][1] - self.polygon.get_bottom_point()[0][1]
+            self.box_height = max_y - min_y
 
         else:
             raise TypeError("Missing length or height argument.")
 
         # Physics attributes.
-        self.volume = self.polygon.area * self.dim3D
+        self.volume = polygon.area * self.dim3D
         self.weight = self.volume * self.specific_weight
 
-        self.box_width_transverse = self.polygon.get_right_point()[0][0] - self.polygon.get_left_point()[0][0]
-        self.box_height_transverse = self.polygon.get_top_point()[0][1] - self.polygon.get_bottom_point()[0][1]
+        self.box_width_transverse = max_x - min_x
+        self.box_height_transverse = max_y - min_y
 
     @property
-    def polygon(self):
+    def polygon(self) -> Polygon:
         """
-        Property to get a Polygon object created from the vertices of the concrete section.
+        Property to get the Polygon object created from the vertices of the concrete section. It is built on first
+        access and cached until new vertices are assigned (call `clear_polygon` after changing the vertices list in
+        place).
 
         :return: A Polygon object representing the concrete section.
         :rtype: Polygon
         """
-        return Polygon(vertices=self.vertices)
+        if self._polygon is None:
+            self._polygon = Polygon(vertices=self.vertices)
+        return self._polygon
+
+    def clear_polygon(self) -> None:
+        """
+        Discards the cached polygon of the concrete section, it is rebuilt from the vertices on next access.
+        """
+        self._polygon = None
+
+    def get_cover_vertices(self, cover: float) -> list[tuple[float, float]]:
+        """
+        Calculates the vertices of the cover line of the concrete section (its polygon offset inwards by the cover),
+        where perimeter bars and stirrups are placed. Works with concave sections too.
+
+        :param cover: Concrete cover.
+        :type cover: float
+        :return: List of (x, y) vertices of the cover line. Empty if the cover is larger than the section.
+        :rtype: list[tuple[float, float]]
+        """
+        return self.polygon.get_offset_vertices(distance=cover)
 
     def draw_longitudinal(self,
                           document: Drawing,
@@ -126,7 +160,8 @@ class Concrete:
                           y: float = None,
                           dimensions: bool = True,
                           dimensions_inner: bool = True,
-                          settings: dict = CONCRETE_SET_LONG) -> dict:
+                          settings: dict = CONCRETE_SET_LONG,
+                          collect: bool = True) -> dict:
         """
         Draws the concrete section in the longitudinal direction with optional dimensioning.
 
@@ -144,6 +179,9 @@ class Concrete:
         :type dimensions_inner: bool, optional
         :param settings: Dictionary of settings for dimensioning. Defaults to `CONCRETE_SET_LONG`.
         :type settings: dict, optional
+        :param collect: Flag to indicate whether to return the drawing elements grouped. If False, only the number of
+         elements drawn is returned ({"count": n}). Defaults to True.
+        :type collect: bool, optional
 
         :return: A dictionary with keys "concrete_elements", "dimensions", and "all_elements", each containing the
         corresponding drawing elements.
@@ -160,8 +198,8 @@ class Concrete:
 
         if self.length is not None:
             # Getting right points between top and bottom points of concrete section.
-            top_point = self.polygon.get_top_point()[0]
-            bottom_point = self.polygon.get_bottom_point()[0]
+            top_point = self.polygon.top_points[0]
+            bottom_point = self.polygon.bottom_points[0]
             top_index = self.vertices.index(top_point)
             bottom_index = self.vertices.index(bottom_point)
 
@@ -181,8 +219,8 @@ class Concrete:
 
         if self.height is not None:
             # Getting front points between right and left points of concrete section.
-            left_point = self.polygon.get_left_point()[0]
-            right_point = self.polygon.get_right_point()[0]
+            left_point = self.polygon.left_points[0]
+            right_point = self.polygon.right_points[0]
             left_index = self.vertices.index(left_point)
             right_index = self.vertices.index(right_point)
 
@@ -256,6 +294,9 @@ class Concrete:
                                                    p2=(x + front_points[i + 1][0], y + self.height),
                                                    dimstyle=settings["dim_style_inner"])
 
+        if not collect:
+            return {"count": count_entities(concrete_elements, dim_elements)}
+
         # Setting elements dict.
         elements["concrete_elements"] = concrete_elements
         elements["dimensions"] = dim_elements
@@ -270,7 +311,8 @@ class Concrete:
                         dimensions: bool = True,
                         dimensions_boxing: bool = True,
                         dimensions_inner: bool = False,
-                        settings: dict = CONCRETE_SET_TRANSVERSE) -> dict:
+                        settings: dict = CONCRETE_SET_TRANSVERSE,
+                        collect: bool = True) -> dict:
         """
         Draws the concrete section in the transverse direction with optional dimensioning.
 
@@ -290,6 +332,9 @@ class Concrete:
         :type dimensions_inner: bool, optional
         :param settings: Dictionary of settings for dimensioning. Defaults to `CONCRETE_SET_TRANSVERSE`.
         :type settings: dict, optional
+        :param collect: Flag to indicate whether to return the drawing elements grouped. If False, only the number of
+         elements drawn is returned ({"count": n}). Defaults to True.
+        :type collect: bool, optional
 
         :return: A dictionary with keys "concrete_elements" and "all_elements", each containing the corresponding drawing
          elements.
@@ -308,8 +353,8 @@ class Concrete:
         concrete_elements += polyline(document=document, vertices=self.vertices, closed=True)
 
         # Moves all elements to x, y coordinates given.
-        min_x = self.polygon.get_left_point()[0][0]
-        min_y = self.polygon.get_bottom_point()[0][1]
+        min_x = self.polygon.left_points[0][0]
+        min_y = self.polygon.bottom_points[0][1]
         vector_translate = (x - min_x, y - min_y)
         translate(objects=concrete_elements, vector=vector_translate)
 
@@ -355,6 +400,9 @@ class Concrete:
                                                rotation=angle,
                                                dimstyle=settings["dim_style_inner"])
 
+        if not collect:
+            return {"count": count_entities(concrete_elements, dim_elements)}
+
         # Setting elements dict.
         elements["concrete_elements"] = concrete_elements
         elements["dimensions"] = dim_elements
@@ -368,7 +416,8 @@ class Concrete:
                         y: float = None,
                         dimensions: bool = True,
                         dimensions_inner: bool = True,
-                        settings: dict = CONCRETE_SET_RIGHT_VIEW) -> dict:
+                        settings: dict = CONCRETE_SET_RIGHT_VIEW,
+                        collect: bool = True) -> dict:
         if x is None:
             x = self.x
         if y is None:
@@ -379,8 +428,8 @@ class Concrete:
         dim_elements = []
 
         # Getting right points between top and bottom points of concrete section.
-        top_point = self.polygon.get_top_point()[-1]
-        bottom_point = self.polygon.get_bottom_point()[-1]
+        top_point = self.polygon.top_points[-1]
+        bottom_point = self.polygon.bottom_points[-1]
         top_index = self.vertices.index(top_point)
         bottom_index = self.vertices.index(bottom_point)
 
@@ -461,6 +510,9 @@ class Concrete:
                                                    p2=(x + right_points[i + 1][1], y + self.height),
                                                    dimstyle=settings["dim_style_inner"])
 
+        if not collect:
+            return {"count": count_entities(concrete_elements, dim_elements)}
+
         # Setting elements dict.
         elements["concrete_elements"] = concrete_elements
         elements["dimensions"] = dim_elements
@@ -474,14 +526,16 @@ class Concrete:
                         y: float = None,
                         dimensions: bool = True,
                         dimensions_inner: bool = True,
-                        settings: dict = CONCRETE_SET_RIGHT_VIEW) -> dict:
+                        settings: dict = CONCRETE_SET_RIGHT_VIEW,
+                        collect: bool = True) -> dict:
         if self.length:
             return self.draw_transverse(document=document,
                                         x=x,
                                         y=y,
                                         dimensions=dimensions,
                                         dimensions_inner=dimensions_inner,
-                                        settings=CONCRETE_SET_FRONT_VIEW)
+                                        settings=CONCRETE_SET_FRONT_VIEW,
+                                        collect=collect)
 
         if self.height:
             return self.draw_longitudinal(document=document,
@@ -489,4 +543,5 @@ class Concrete:
                                           y=y,
                                           dimensions=dimensions,
                                           dimensions_inner=dimensions_inner,
-                                          settings=settings)
+                                          settings=settings,
+                                          collect=collect)
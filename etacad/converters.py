@@ -1,3 +1,6 @@
+import sys
+
+
 def to_list(arg: list | float) -> list | None:
     """
     Converts a float value into a single-element list or returns the original list.
@@ -13,3 +16,16 @@ def to_list(arg: list | float) -> list | None:
     if isinstance(arg, list):
         return arg
     return [arg]
+
+
+def to_interned(arg):
+    """
+    Interns a string, so the labels repeated by many elements (denominations, positions) share a single object.
+    Values other than strings (None, numbers, enums, string subclasses) are returned unchanged.
+
+    :param arg: A label of any type.
+    :return: The interned string if `arg` is a string, otherwise `arg`.
+    """
+    if type(arg) is not str:
+        return arg
+    return sys.intern(arg)
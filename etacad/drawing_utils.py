@@ -6,15 +6,33 @@ from etacad.globals import Aligment, Direction
 
 # External imports.
 import ezdxf
+import numpy as np
+import weakref
+
+from attrs import define, field
 from ezdxf.gfxattribs import GfxAttribs
 from ezdxf.document import Drawing
+from ezdxf.entities import factory
+from ezdxf.entities.boundary_paths import PolylinePath
+from ezdxf.graphicsfactory import CreatorInterface
+from ezdxf.layouts import BaseLayout
 from ezdxf.transform import inplace
-from ezdxf.math import Matrix44
+from ezdxf.math import Matrix44, Vec3
 from ezdxf.enums import TextEntityAlignment
 from ezdxf.tools.standards import linetypes
 
 from math import pi
 
+# Entity types exported as plain records.
+RECORD_TYPES = ("ARC", "CIRCLE", "DIMENSION", "HATCH", "INSERT", "LINE", "LWPOLYLINE", "MTEXT", "POINT", "SOLID",
+                "TEXT")
+
+# Positional DXF attributes of dimensions, the rest of attributes define the geometry rendered.
+DIMENSION_POINTS = ("defpoint", "defpoint2", "defpoint3", "defpoint4", "defpoint5", "text_midpoint", "insert")
+
+# Documents with deferred dimensions, mapped to their dimensions pending of render by handle.
+_deferred_dimensions = weakref.WeakKeyDictionary()
+
 # Classes references.
 doc_class = Drawing
 attrib_class = GfxAttribs
@@ -44,6 +62,148 @@ matrix_y_paralel_line_mirror = Matrix44([-1, 0, 0, 2],  # Constant 2 must multip
                                         [0, 0, 0, 1])
 
 
+@define
+class EntityRecorder(CreatorInterface):
+    """
+    Recording backend that can be passed to every draw method instead of a Drawing. Entities are created as virtual
+    entities (not bound to the document database) and kept in a buffer, so the translations, rotations and mirrors
+    applied by the draw methods do not touch the document. The buffer is added to the modelspace in one pass by
+    `flush`.
+
+    :param doc: Target document of the recorded entities.
+    :type doc: Drawing
+
+    :ivar doc: Target document of the recorded entities.
+    :vartype doc: Drawing
+    :ivar entities: Buffer of recorded virtual entities, in drawing order.
+    :vartype entities: list
+    """
+    doc: Drawing
+    entities: list = field(factory=list)
+
+    @property
+    def linetypes(self):
+        """Linetypes table of the target document."""
+        return self.doc.linetypes
+
+    def modelspace(self) -> "EntityRecorder":
+        """
+        Returns the recorder itself, so the drawing functions use it as the layout to add entities to.
+
+        :return: The recorder.
+        :rtype: EntityRecorder
+        """
+        return self
+
+    def new_entity(self, type_: str, dxfattribs: dict):
+        """
+        Creates a virtual entity and appends it to the buffer.
+
+        :param type_: DXF type of the entity ("LINE", "ARC", "TEXT", etc.).
+        :type type_: str
+        :param dxfattribs: DXF attributes of the entity.
+        :type dxfattribs: dict
+        :return: The virtual entity created.
+        :rtype: DXFGraphic
+        """
+        entity = factory.new(type_, dxfattribs)
+        self.entities.append(entity)
+
+        return entity
+
+    def add_entity(self, entity) -> None:
+        """
+        Appends an existing virtual entity to the buffer.
+
+        :param entity: Virtual entity to be recorded.
+        :type entity: DXFGraphic
+        """
+        self.entities.append(entity)
+
+    def add_linear_dim(self, *args, **kwargs):
+        """
+        Dimensions need the document dimension styles and blocks to be rendered, so they are added to the modelspace
+        of the target document right away.
+        """
+        return self.doc.modelspace().add_linear_dim(*args, **kwargs)
+
+    def flush(self, layout: BaseLayout = None) -> int:
+        """
+        Adds all the recorded entities to the given layout in one pass and empties the buffer.
+
+        :param layout: Layout where the entities are added. Defaults to the modelspace of the target document.
+        :type layout: BaseLayout, optional
+        :return: Number of entities added.
+        :rtype: int
+        """
+        if layout is None:
+            layout = self.doc.modelspace()
+
+        count = 0
+        for entity in self.entities:
+            if entity.is_alive:
+                layout.add_entity(entity)
+                count += 1
+
+        self.entities = []
+
+        return count
+
+
+# Function that draws copies of a group of entities displaced by a set of offsets.
+def array_copies(doc: Drawing, entities: list, offsets) -> list:
+    """
+    Draws copies of a group of template entities, one copy of the group for each offset. The coordinates of lines and
+    arcs are computed for all the offsets at once as arrays, the rest of the entities are copied and translated.
+
+    :param doc: The drawing object where the copies will be drawn.
+    :type doc: Drawing
+    :param entities: Template entities to be copied, usually virtual entities drawn at the origin.
+    :type entities: list
+    :param offsets: Array like of (dx, dy) displacements, one for each copy.
+    :type offsets: list or numpy.ndarray
+    :return: A list with the list of copied entities for each offset.
+    :rtype: list
+    """
+    if not isinstance(doc, (Drawing, EntityRecorder)):
+        return []
+
+    msp = doc.modelspace()
+
+    offsets = np.asarray(offsets, dtype=float).reshape(-1, 2)
+    offsets = np.column_stack((offsets, np.zeros(len(offsets))))
+    copies = [[] for _ in range(len(offsets))]
+
+    for entitie in entities:
+        attr = entitie.dxfattribs(drop={"handle", "owner"})
+
+        if entitie.dxftype() == "LINE":
+            starts = (offsets + entitie.dxf.start.xyz).tolist()
+            ends = (offsets + entitie.dxf.end.xyz).tolist()
+            for group, start, end in zip(copies, starts, ends):
+                group.append(msp.add_line(start, end, dxfattribs=attr))
+
+        elif entitie.dxftype() == "ARC":
+            # Center of arcs is defined in OCS.
+            ocs_offsets = np.array([point.xyz for point in entitie.ocs().points_from_wcs(offsets.tolist())])
+            centers = (ocs_offsets + entitie.dxf.center.xyz).tolist()
+            for group, center in zip(copies, centers):
+                group.append(msp.add_arc(center,
+                                         radius=attr["radius"],
+                                         start_angle=attr["start_angle"],
+                                         end_angle=attr["end_angle"],
+                                         dxfattribs=attr))
+
+        else:
+            for group, offset in zip(copies, offsets.tolist()):
+                entitie_copy = entitie.copy()
+                entitie_copy.translate(*offset)
+                msp.add_entity(entitie_copy)
+                group.append(entitie_copy)
+
+    return copies
+
+
 # Function that draws a circunference.
 def circle(doc: Drawing,
            center_point: tuple,
@@ -63,7 +223,7 @@ def circle(doc: Drawing,
     :return: A list containing the circle entity.
     :rtype: list
     """
-    if not isinstance(doc, Drawing):
+    if not isinstance(doc, (Drawing, EntityRecorder)):
         return []
 
     msp = doc.modelspace()
@@ -74,6 +234,56 @@ def circle(doc: Drawing,
     return circ
 
 
+# Function that draws a group of circunferences.
+def circles(doc: Drawing, center_points, radius: float, attr=None) -> list:
+    """
+    Draws a group of circles with the same radius in the provided drawing, in bulk.
+
+    :param doc: The drawing object where the circles will be drawn.
+    :type doc: Drawing
+    :param center_points: Array like of (x, y) center points of the circles.
+    :type center_points: list or numpy.ndarray
+    :param radius: The radius of the circles.
+    :type radius: float
+    :param attr: Optional DXF attributes for the circles.
+    :type attr: dict, optional
+    :return: A list containing the circle entities.
+    :rtype: list
+    """
+    if not isinstance(doc, (Drawing, EntityRecorder)):
+        return []
+
+    msp = doc.modelspace()
+
+    return [msp.add_circle(center_point, radius=radius, dxfattribs=attr)
+            for center_point in np.asarray(center_points, dtype=float).tolist()]
+
+
+# Function that counts the entities of groups of drawing results.
+def count_entities(*groups) -> int:
+    """
+    Counts the entities drawn in groups of drawing results, without joining them. A group can be a list of
+    entities, a dict returned by a drawing method (its "count" with collect=False, else its "all_elements"), a list
+    of those dicts or None.
+
+    :param groups: Groups of drawing results.
+    :return: Number of entities.
+    :rtype: int
+    """
+    count = 0
+    for group in groups:
+        if not group:
+            continue
+        if isinstance(group, dict):
+            count += group["count"] if "count" in group else len(group["all_elements"])
+        elif isinstance(group[0], dict):
+            count += count_entities(*group)
+        else:
+            count += len(group)
+
+    return count
+
+
 # Function that draws a curve with/out thickness.
 def curve(doc: Drawing,
           center_point: tuple,
@@ -102,7 +312,7 @@ def curve(doc: Drawing,
     :return: A list containing the arc entities.
     :rtype: list
     """
-    if not isinstance(doc, Drawing):
+    if not isinstance(doc, (Drawing, EntityRecorder)):
         return []
 
     msp = doc.modelspace()
@@ -117,6 +327,50 @@ def curve(doc: Drawing,
     return arcs
 
 
+# Function that defers the render of the dimensions drawn in a document.
+def defer_dimensions(doc: Drawing) -> None:
+    """
+    Defers the render of the dimensions drawn in a document. Dimensions drawn by `dim_linear` (and re-rendered by
+    `dim_render`) are recorded without geometry block until `render_dimensions` renders all of them in one pass.
+
+    :param doc: The drawing object where the dimensions will be drawn.
+    :type doc: Drawing
+    """
+    _deferred_dimensions.setdefault(doc, {})
+
+
+# Function that deletes entities of a document given their handles.
+def delete_entities(doc: Drawing, handles: list) -> int:
+    """
+    Deletes the entities of the handles given from their layouts. The geometry blocks of the dimensions deleted are
+    deleted as well. Handles of entities already deleted are skipped.
+
+    :param doc: The drawing object holding the entities.
+    :type doc: Drawing
+    :param handles: Handles of the entities to delete.
+    :type handles: list[str]
+    :return: Number of entities deleted.
+    :rtype: int
+    """
+    count = 0
+    for handle in handles:
+        entitie = doc.entitydb.get(handle)
+        if entitie is None or not entitie.is_alive:
+            continue
+
+        block_name = entitie.dxf.get("geometry") if entitie.dxftype() == "DIMENSION" else None
+        layout = entitie.get_layout()
+        if layout is not None:
+            layout.delete_entity(entitie)
+        else:
+            doc.entitydb.delete_entity(entitie)
+        if block_name and block_name in doc.blocks:
+            doc.blocks.delete_block(block_name, safe=False)
+        count += 1
+
+    return count
+
+
 # Create a delimit axe and rerturns and list with elements.
 def delimit_axe(document: Drawing,
                 x: float,
@@ -204,12 +458,92 @@ def dim_linear(document: Drawing,
     msp = document.modelspace()
 
     dim_so = msp.add_linear_dim(base=p_base, p1=p1, p2=p2, dimstyle=dimstyle, angle=rotation, dxfattribs=attr)
-    dim_so.render()
+    dim_render(dimension=dim_so.dimension)
     dim = [dim_so.dimension]  # DXF entitie.
 
     return dim
 
 
+# Function that renders a dimension, or records it when its document defers dimensions.
+def dim_render(dimension) -> None:
+    """
+    Renders the geometry block of a dimension. If the document of the dimension defers dimensions (see
+    `defer_dimensions`), the dimension is recorded to be rendered by `render_dimensions` instead.
+
+    :param dimension: DIMENSION entity.
+    :type dimension: Dimension
+    """
+    pending = _deferred_dimensions.get(dimension.doc)
+    if pending is None:
+        dimension.render()
+    else:
+        pending[dimension.dxf.handle] = dimension
+
+
+# Function that exports an entity as a plain record.
+def entity_record(entitie) -> tuple:
+    """
+    Exports an entity as a plain record (DXF type, DXF attributes, geometry data) with no references to the
+    document, usable by `import_entities`. Entities with data out of the DXF attributes not supported (extended data,
+    hatch edge paths, etc.) are exported as (DXF type, None, detached copy).
+
+    :param entitie: DXF entity.
+    :return: Tuple (DXF type, DXF attributes, geometry data).
+    :rtype: tuple
+    """
+    dxftype = entitie.dxftype()
+    if dxftype in RECORD_TYPES and not entitie.xdata and not entitie.has_extension_dict:
+        attribs = {key: value.xyz if isinstance(value, Vec3) else value
+                   for key, value in entitie.dxfattribs(drop={"handle", "owner"}).items()}
+        if dxftype == "LWPOLYLINE":
+            return dxftype, attribs, list(entitie.get_points(format="xyseb"))
+        if dxftype == "MTEXT":
+            return dxftype, attribs, entitie.text
+        if dxftype == "HATCH":
+            if all(isinstance(path, PolylinePath) for path in entitie.paths):
+                return dxftype, attribs, [(list(path.vertices), path.is_closed) for path in entitie.paths]
+        elif dxftype != "INSERT" or not entitie.attribs:
+            return dxftype, attribs, None
+
+    entitie_copy = entitie.copy()
+    entitie_copy.doc = None
+    return dxftype, None, entitie_copy
+
+
+# Function that exports the modelspace of a document as a batch of plain entity records.
+def export_entities(doc: Drawing) -> dict:
+    """
+    Exports the entities of the modelspace of a document as a batch of plain records (DXF type, DXF attributes
+    and geometry data as tuples and floats), together with the blocks they reference (dimension geometry blocks,
+    blocks of block references and the blocks nested in them). The batch can be pickled and sent to other
+    processes, and added to another document with `import_entities`. Entities that cannot be described by plain
+    data are exported as detached copies (without document, handles or owners).
+
+    :param doc: Source document.
+    :type doc: Drawing
+    :return: Dictionary with the batch:
+        - "entities": List of records in modelspace order.
+        - "blocks": Dictionary mapping block names to tuples (base point, list of records).
+    :rtype: dict
+    """
+    entities = [entity_record(entitie) for entitie in doc.modelspace()]
+
+    # Referenced blocks, including the nested ones (dimension arrows, etc.).
+    blocks = {}
+    pending = [record[1].get("geometry" if record[0] == "DIMENSION" else "name") for record in entities
+               if record[0] in ("DIMENSION", "INSERT")]
+    pending = [name for name in pending if name]
+    while pending:
+        name = pending.pop()
+        if name in blocks:
+            continue
+        block = doc.blocks.get(name)
+        blocks[name] = (block.block.dxf.base_point.xyz, [entity_record(entitie) for entitie in block])
+        pending += [entitie.dxf.name for entitie in block if entitie.dxftype() == "INSERT"]
+
+    return {"entities": entities, "blocks": blocks}
+
+
 def filter_entities(entities: list) -> dict:
     """
     Groups a list of DXF entities by their type.
@@ -232,6 +566,72 @@ def filter_entities(entities: list) -> dict:
     return groups
 
 
+# Function that adds a batch of entity records to the modelspace of a document.
+def import_entities(doc: Drawing, batch: dict) -> list:
+    """
+    Adds a batch of entity records exported by `export_entities` to the modelspace of a document. Anonymous blocks
+    (dimension geometry) are created with new names, named blocks are only created if the document has not got them
+    yet.
+
+    :param doc: Target document.
+    :type doc: Drawing
+    :param batch: Batch of entity records exported by `export_entities`.
+    :type batch: dict
+    :return: List of entities added to the modelspace.
+    :rtype: list
+    """
+    def add_record(layout, dxftype, attribs, data):
+        if attribs is None:
+            for key in ("name", "geometry"):
+                if data.dxf.hasattr(key) and data.dxf.get(key) in names:
+                    data.dxf.set(key, names[data.dxf.get(key)])
+            layout.add_entity(data)
+            return data
+
+        if dxftype == "INSERT":
+            attribs["name"] = names[attribs["name"]]
+        if dxftype == "DIMENSION" and "geometry" in attribs:
+            attribs["geometry"] = names[attribs["geometry"]]
+        if dxftype == "LWPOLYLINE":
+            return layout.add_lwpolyline(data, format="xyseb", dxfattribs=attribs)
+        if dxftype == "MTEXT":
+            return layout.add_mtext(data, dxfattribs=attribs)
+
+        entitie = layout.new_entity(dxftype, attribs)
+        if dxftype == "HATCH":
+            for vertices, is_closed in data:
+                entitie.paths.add_polyline_path(vertices, is_closed=is_closed)
+            if not attribs["solid_fill"]:
+                entitie.set_pattern_fill(attribs["pattern_name"],
+                                         color=attribs.get("color", 7),
+                                         angle=attribs.get("pattern_angle", 0),
+                                         scale=attribs.get("pattern_scale", 1),
+                                         double=attribs.get("pattern_double", 0))
+        return entitie
+
+    # Blocks.
+    names = {}
+    new_blocks = []
+    for name, (base_point, records) in batch["blocks"].items():
+        if name.startswith("*"):
+            block = doc.blocks.new_anonymous_block(type_char=name[1], base_point=base_point)
+        elif name not in doc.blocks:
+            block = doc.blocks.new(name=name, base_point=base_point)
+        else:
+            names[name] = name
+            continue
+        names[name] = block.name
+        new_blocks.append((block, records))
+
+    for block, records in new_blocks:
+        for record in records:
+            add_record(block, *record)
+
+    # Modelspace entities.
+    msp = doc.modelspace()
+    return [add_record(msp, *record) for record in batch["entities"]]
+
+
 # Function that draws a line.
 def line(doc: Drawing, p1: tuple, p2: tuple, attr=None) -> list:
     """
@@ -253,6 +653,29 @@ def line(doc: Drawing, p1: tuple, p2: tuple, attr=None) -> list:
     return [line_segment]
 
 
+# Function that draws a group of lines.
+def lines(doc: Drawing, start_points, end_points, attr=None) -> list:
+    """
+    Draws a group of lines between paired start and end points in the provided drawing, in bulk.
+
+    :param doc: The drawing object where the lines will be drawn.
+    :type doc: Drawing
+    :param start_points: Array like of (x, y) starting points of the lines.
+    :type start_points: list or numpy.ndarray
+    :param end_points: Array like of (x, y) ending points of the lines.
+    :type end_points: list or numpy.ndarray
+    :param attr: Optional DXF attributes for the lines.
+    :type attr: dict, optional
+    :return: A list containing the line entities.
+    :rtype: list
+    """
+    msp = doc.modelspace()
+
+    return [msp.add_line(p1, p2, dxfattribs=attr)
+            for p1, p2 in zip(np.asarray(start_points, dtype=float).tolist(),
+                              np.asarray(end_points, dtype=float).tolist())]
+
+
 # Function that mirrors a given group of objects.
 def mirror(objects: list, mirror_type: str, c: float = None) -> int:
     """
@@ -379,7 +802,7 @@ def rect(doc: Drawing, width: float, height: float, x: float, y: float, sides=No
     if sides is None:
         sides = [1, 1, 1, 1]
 
-    if not isinstance(doc, Drawing):
+    if not isinstance(doc, (Drawing, EntityRecorder)):
         return []
 
     msp = doc.modelspace()
@@ -451,7 +874,7 @@ def rect_border_curve(doc: Drawing, width: float, height: float, radius: float,
     if curves_radius is None:
         curves_radius = [radius, radius, radius, radius]
 
-    if not isinstance(doc, Drawing):
+    if not isinstance(doc, (Drawing, EntityRecorder)):
         return []
 
     msp = doc.modelspace()
@@ -514,6 +937,67 @@ def rect_border_curve(doc: Drawing, width: float, height: float, radius: float,
     return lines
 
 
+# Function that renders the deferred dimensions of a document.
+def render_dimensions(doc: Drawing, skip: bool = False, reuse: bool = True, defer: bool = False) -> int:
+    """
+    Renders in one pass the dimensions of a document recorded since `defer_dimensions`, and ends the deferral.
+
+    Dimensions with the same style, attributes and points relative to their first measured point only differ by their
+    position, so with `reuse` the geometry block and rendered points of the first one are copied and translated for
+    the rest, instead of rendering them again. Dimensions with style overrides are always rendered.
+
+    :param doc: The drawing object where the dimensions were drawn.
+    :type doc: Drawing
+    :param skip: If True, the dimensions are left without geometry block, for viewers regenerating them.
+    :type skip: bool
+    :param reuse: If True, the geometry blocks of equal dimensions are copied instead of rendered.
+    :type reuse: bool
+    :param defer: If True, dimensions drawn afterward are still deferred.
+    :type defer: bool
+    :return: Number of dimensions rendered.
+    :rtype: int
+    """
+    pending = _deferred_dimensions.pop(doc, None)
+    if defer and pending is not None:
+        defer_dimensions(doc=doc)
+    if not pending or skip:
+        return 0
+
+    count = 0
+    templates = {}
+    for dimension in pending.values():
+        if not dimension.is_alive:
+            continue
+
+        # Points relative to the first measured point (defpoint2), which render() keeps. It moves the defpoint from
+        # the base point to the dimension line.
+        key = None
+        if reuse and not dimension.xdata:
+            attribs = dimension.dxfattribs(drop={"handle", "owner", "geometry", *DIMENSION_POINTS})
+            origin = dimension.dxf.defpoint2
+            key = (tuple(sorted(attribs.items())),
+                   *((dimension.dxf.get(name) - origin).round(9) if dimension.dxf.hasattr(name) else None
+                     for name in DIMENSION_POINTS))
+
+        template = templates.get(key)
+        if template is None:
+            dimension.render()
+            if key is not None:
+                templates[key] = dimension
+        else:
+            offset = dimension.dxf.defpoint2 - template.dxf.defpoint2
+            block = doc.blocks.new_anonymous_block(type_char="D")
+            for entitie in template.get_geometry_block():
+                block.add_entity(entitie.copy().translate(*offset))
+            dimension.dxf.geometry = block.name
+            for name in DIMENSION_POINTS:
+                if template.dxf.hasattr(name):
+                    dimension.dxf.set(name, template.dxf.get(name) + offset)
+        count += 1
+
+    return count
+
+
 # Function that rotates elements.
 def rotate(objects: list, angle: float) -> int:
     """
@@ -559,6 +1043,23 @@ def text(document: Drawing, text: str, height: float, point: tuple, rotation: fl
     return [group]
 
 
+# Function that transforms a group of elements.
+def transform(objects: list, matrix: Matrix44) -> int:
+    """
+    Transforms a group of objects by a transformation matrix, in a single pass.
+
+    :param objects: A list of objects to be transformed.
+    :type objects: list
+    :param matrix: The transformation matrix, several transformations can be composed with `Matrix44.chain`.
+    :type matrix: Matrix44
+    :return: An integer status code indicating success (1).
+    :rtype: int
+    """
+    inplace(objects, matrix)
+
+    return 1
+
+
 # Function that translates a group of elements.
 def translate(objects: list, vector: tuple) -> int:
     """
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+
+# Imports.
+# Local imports.
+from etacad.drawing_utils import render_dimensions
+
+# External imports.
+import ezdxf
+import os
+import tempfile
+
+from attrs import define, field
+from ezdxf.document import Drawing
+from ezdxf.lldxf.const import DXF12
+from ezdxf.lldxf.tagwriter import TagWriter
+from typing import TextIO
+
+
+@define
+class DXFStreamWriter:
+    """
+    Writes a DXF file streaming the modelspace entities to disk as they are drawn, so big sheets do not keep every
+    entity alive until the document is saved.
+
+    Elements are drawn into `document` as usual, then `flush` writes the modelspace entities to a temporary spool
+    file and deletes them from the document. `close` writes the header, classes, tables and blocks of the document,
+    the spooled entities and the objects, in the order of a DXF file. The geometry blocks of the dimensions flushed are
+    spooled as well, only their names are kept in the document. The entities returned by the drawing methods are
+    destroyed by `flush`, they must not be used after it, and the document is only meant to be written by the writer.
+
+    :param stream: File path or text stream where the DXF file is written. A text stream must be opened with the
+                   output encoding of the document and errors="dxfreplace" (see `Drawing.write`).
+    :type stream: str | TextIO
+    :param document: The `ezdxf` Drawing object where the elements are drawn. If None, a new one is created.
+    :type document: Drawing, optional
+    :param dxfversion: DXF version of the document created when no document is given.
+    :type dxfversion: str
+
+    :ivar count: Number of entities written.
+    :vartype count: int
+    """
+    stream: str | TextIO
+    document: Drawing = field(default=None)
+    dxfversion: str = field(default="R2010")
+    count: int = field(init=False, default=0)
+    _spool: TextIO = field(init=False, default=None, repr=False)
+    _tagwriter: TagWriter = field(init=False, default=None, repr=False)
+    _blocks_spool: TextIO = field(init=False, default=None, repr=False)
+    _blocks_tagwriter: TagWriter = field(init=False, default=None, repr=False)
+    _spooled_blocks: set[str] = field(init=False, factory=set, repr=False)
+
+    def __attrs_post_init__(self):
+        if self.document is None:
+            self.document = ezdxf.new(dxfversion=self.dxfversion, setup=True)
+        self.dxfversion = self.document.dxfversion
+
+        self._spool = self.__new_spool()
+        self._tagwriter = TagWriter(self._spool, write_handles=True, dxfversion=self.dxfversion)
+        self._blocks_spool = self.__new_spool()
+        self._blocks_tagwriter = TagWriter(self._blocks_spool, write_handles=True, dxfversion=self.dxfversion)
+
+    def __new_spool(self) -> TextIO:
+        return tempfile.TemporaryFile(mode="w+t", encoding=self.document.output_encoding, errors="dxfreplace")
+
+    def __enter__(self) -> "DXFStreamWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._spool.close()
+            self._blocks_spool.close()
+
+    def flush(self) -> int:
+        """
+        Writes the entities of the modelspace to the spool file and deletes them from the document. Deferred dimensions
+        of the document (see `defer_dimensions`) are rendered first, dimensions drawn afterward are still deferred.
+
+        :return: Number of entities written.
+        :rtype: int
+        """
+        render_dimensions(doc=self.document, defer=True)
+
+        entity_space = self.document.modelspace().entity_space
+        entitydb = self.document.entitydb
+
+        count = 0
+        for entitie in entity_space:
+            entitie.export_dxf(self._tagwriter)
+            if entitie.dxftype() == "DIMENSION":
+                self.__spool_block(name=entitie.dxf.get("geometry"))
+            entitydb.delete_entity(entitie)
+            count += 1
+        entity_space.clear()
+
+        self.count += count
+        return count
+
+    def __spool_block(self, name: str) -> None:
+        # Writes an anonymous dimension block to the blocks spool and deletes its entities from the document.
+        if not name or not name.startswith("*D") or name not in self.document.blocks:
+            return
+
+        block_record = self.document.blocks.get(name).block_record
+        block_record.export_block_definition(self._blocks_tagwriter)
+        for entitie in block_record.entity_space:
+            self.document.entitydb.delete_entity(entitie)
+        block_record.entity_space.clear()
+        self._spooled_blocks.add(block_record.dxf.handle)
+
+    def close(self) -> None:
+        """
+        Flushes the modelspace and writes the whole DXF file to the stream.
+        """
+        self.flush()
+
+        document = self.document
+        document.commit_pending_changes()
+        if self.dxfversion > DXF12:
+            document.classes.add_required_classes(self.dxfversion)
+        document.update_all()
+
+        if isinstance(self.stream, (str, os.PathLike)):
+            with open(self.stream, mode="wt", encoding=document.output_encoding, errors="dxfreplace") as stream:
+                self._write(stream)
+        else:
+            self._write(self.stream)
+
+        self._spool.close()
+        self._blocks_spool.close()
+
+    def _write(self, stream: TextIO) -> None:
+        document = self.document
+        tagwriter = TagWriter(stream, write_handles=True, dxfversion=self.dxfversion)
+
+        document.header.export_dxf(tagwriter)
+        if self.dxfversion > DXF12:
+            document.classes.export_dxf(tagwriter)
+        document.tables.export_dxf(tagwriter)
+
+        # Blocks section, blocks of the document and spooled dimension blocks.
+        stream.write("  0\nSECTION\n  2\nBLOCKS\n")
+        for block_record in document.block_records:
+            if block_record.dxf.handle not in self._spooled_blocks:
+                block_record.export_block_definition(tagwriter)
+        self.__copy_spool(spool=self._blocks_spool, stream=stream)
+        tagwriter.write_tag2(0, "ENDSEC")
+
+        # Entities section, spooled modelspace and active paperspace.
+        stream.write("  0\nSECTION\n  2\nENTITIES\n")
+        self.__copy_spool(spool=self._spool, stream=stream)
+        document.layouts.active_layout().entity_space.export_dxf(tagwriter)
+        tagwriter.write_tag2(0, "ENDSEC")
+
+        if self.dxfversion > DXF12:
+            document.objects.export_dxf(tagwriter)
+        tagwriter.write_tag2(0, "EOF")
+
+    @staticmethod
+    def __copy_spool(spool: TextIO, stream: TextIO) -> None:
+        spool.seek(0)
+        while chunk := spool.read(1 << 20):
+            stream.write(chunk)
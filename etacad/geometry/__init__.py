@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
 
+from .interval_index import IntervalIndex
 from .polygon import Polygon
 from .utils import *
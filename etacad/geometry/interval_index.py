@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+# Imports.
+# External imports.
+from attrs import define, field
+from bisect import bisect_left
+
+
+@define
+class IntervalIndex:
+    """
+    Static index of closed intervals answering point (stabbing) queries in logarithmic time.
+
+    Centered interval tree over the sorted endpoints of all the intervals: every node is centered on an endpoint and
+    keeps the intervals containing it, sorted by start and by end, the rest go down to the left or right subtree.
+    Every interval is stored once, so building the index is O(n log n) and a query is a descent of the tree plus the
+    size of the answer.
+
+    :param items: Items indexed, usually the elements of a structural member (bars, stirrups, spaced bars...).
+    :type items: list
+    :param spans: List of tuples (start, end) with the closed interval covered by each item, in the same order as
+                  items.
+    :type spans: list[tuple[float, float]]
+
+    :ivar points: Sorted and unique endpoints of the intervals.
+    :vartype points: list[float]
+    :ivar size: Number of items indexed at construction.
+    :vartype size: int
+    """
+    items: list
+    spans: list[tuple[float, float]] = field(repr=False)
+    points: list[float] = field(init=False, repr=False)
+    size: int = field(init=False)
+    _by_start: list[list] = field(init=False, repr=False)
+    _by_end: list[list] = field(init=False, repr=False)
+
+    def __attrs_post_init__(self):
+        self.size = len(self.items)
+        self.points = sorted(set(point for span in self.spans for point in span))
+
+        # Nodes: the node centered on points[i] is stored at index i.
+        nodes = [0] * len(self.spans)
+        for order, (start, end) in enumerate(self.spans):
+            if end < start:
+                nodes[order] = None
+                continue
+            low, high, first, last = 0, len(self.points), bisect_left(self.points, start), bisect_left(self.points, end)
+            while True:
+                middle = (low + high) // 2
+                if last < middle:
+                    high = middle
+                elif first > middle:
+                    low = middle + 1
+                else:
+                    nodes[order] = middle
+                    break
+
+        # Intervals of every node by ascending start and by descending end, as (coordinate, order) tuples.
+        self._by_start = [[] for _ in self.points]
+        self._by_end = [[] for _ in self.points]
+        for order in sorted(range(len(self.spans)), key=lambda i: self.spans[i][0]):
+            if nodes[order] is not None:
+                self._by_start[nodes[order]].append((self.spans[order][0], order))
+        for order in sorted(range(len(self.spans)), key=lambda i: self.spans[i][1], reverse=True):
+            if nodes[order] is not None:
+                self._by_end[nodes[order]].append((self.spans[order][1], order))
+
+    def __len__(self) -> int:
+        return self.size
+
+    def query(self, point: float) -> list:
+        """
+        Returns the items whose closed interval contains the point given, in the same order as they were indexed.
+
+        :param point: Coordinate to query.
+        :type point: float
+        :return: List of items with start <= point <= end.
+        :rtype: list
+        """
+        orders = []
+        low, high = 0, len(self.points)
+        while low < high:
+            middle = (low + high) // 2
+            center = self.points[middle]
+            if point < center:
+                for start, order in self._by_start[middle]:
+                    if start > point:
+                        break
+                    orders.append(order)
+                high = middle
+            elif point > center:
+                for end, order in self._by_end[middle]:
+                    if end < point:
+                        break
+                    orders.append(order)
+                low = middle + 1
+            else:
+                orders += [order for _, order in self._by_start[middle]]
+                break
+
+        return [self.items[order] for order in sorted(orders)]
@@ -3,9 +3,13 @@
 # Imports.
 # Local imports.
 from etacad.globals import DRotation
-from .utils import get_linear_center, get_line_longitud, get_line_eq, segment_center
+from .utils import get_line_eq, segment_center
 
 # External imports.
+import heapq
+import math
+import numpy as np
+
 from attrs import define, field
 
 
@@ -26,6 +30,16 @@ class Polygon:
     :vartype area: float
     :ivar centroid: The centroid of the polygon, represented as a tuple of two floats (x, y).
     :vartype centroid: tuple[float, float]
+    :ivar top_points: Points with the highest Y-coordinate, sorted by X.
+    :vartype top_points: list[tuple[float, float]]
+    :ivar right_points: Points with the highest X-coordinate, sorted by Y.
+    :vartype right_points: list[tuple[float, float]]
+    :ivar bottom_points: Points with the lowest Y-coordinate, sorted by X.
+    :vartype bottom_points: list[tuple[float, float]]
+    :ivar left_points: Points with the lowest X-coordinate, sorted by Y.
+    :vartype left_points: list[tuple[float, float]]
+    :ivar bounding_box: Axis-aligned bounding box of the polygon (min_x, min_y, max_x, max_y).
+    :vartype bounding_box: tuple[float, float, float, float]
     """
     # Geometry.
     vertices: list[tuple[float, float]]
@@ -33,11 +47,69 @@ class Polygon:
     area: float = field(init=False, default=0.0)
     centroid: tuple[float, float] = field(init=False, default=(0.0, 0.0))
 
+    # Extreme points and bounding box.
+    top_points: list[tuple[float, float]] = field(init=False, factory=list)
+    right_points: list[tuple[float, float]] = field(init=False, factory=list)
+    bottom_points: list[tuple[float, float]] = field(init=False, factory=list)
+    left_points: list[tuple[float, float]] = field(init=False, factory=list)
+    bounding_box: tuple[float, float, float, float] = field(init=False, default=(0.0, 0.0, 0.0, 0.0))
+
     def __attrs_post_init__(self):
         self.vertices = self.normalize_vertices(vertices=self.vertices)
-        self.perimeter = get_line_longitud(self.vertices)
-        self.area = self.get_area()
-        self.centroid = get_linear_center(points=self.vertices)
+        if self.vertices:
+            self.__sweep_vertices()
+
+    def __sweep_vertices(self) -> None:
+        """
+        Computes perimeter, area (Shoelace formula), centroid, extreme points and bounding box of the polygon in a
+        single pass over the vertices.
+        """
+        vertices = self.vertices
+        n = len(vertices)
+
+        perimeter = 0.0
+        area = 0.0
+        sum_x = 0
+        sum_y = 0
+        x_min, y_min = x_max, y_max = vertices[0]
+        top_points, right_points, bottom_points, left_points = [], [], [], []
+        for i in range(n):
+            x1, y1 = point = vertices[i]
+            x2, y2 = vertices[(i + 1) % n]
+
+            if i < n - 1:  # Open polyline length, closing side not included.
+                perimeter += math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+            area += x1 * y2 - x2 * y1
+            sum_x += x1
+            sum_y += y1
+
+            # Extreme points.
+            if y1 > y_max:
+                y_max, top_points = y1, [point]
+            elif y1 == y_max:
+                top_points.append(point)
+            if x1 > x_max:
+                x_max, right_points = x1, [point]
+            elif x1 == x_max:
+                right_points.append(point)
+            if y1 < y_min:
+                y_min, bottom_points = y1, [point]
+            elif y1 == y_min:
+                bottom_points.append(point)
+            if x1 < x_min:
+                x_min, left_points = x1, [point]
+            elif x1 == x_min:
+                left_points.append(point)
+
+        self.perimeter = perimeter
+        self.area = abs(area) / 2.0
+        self.centroid = (sum_x / n, sum_y / n)
+
+        self.top_points = sorted(top_points, key=lambda point: point[0])
+        self.right_points = sorted(right_points, key=lambda point: point[1])
+        self.bottom_points = sorted(bottom_points, key=lambda point: point[0])
+        self.left_points = sorted(left_points, key=lambda point: point[1])
+        self.bounding_box = (x_min, y_min, x_max, y_max)
 
     def get_area(self) -> float:
         """
@@ -59,65 +131,49 @@ class Polygon:
         """
         Get the topmost points from the vertices.
 
-        This method finds all points in the list of vertices that have the maximum Y-coordinate (top points).
-        It returns the list of points sorted by the X-coordinate.
+        Returns a copy of the top points computed at construction, the points of the vertices with the
+        maximum Y-coordinate sorted by the X-coordinate.
 
         :return: A list of points with the highest Y-coordinate, sorted by X.
         :rtype: list
         """
-        max_y = max(self.vertices, key=lambda vertice: vertice[1])[1]
-        top_points = [point for point in self.vertices if point[1] == max_y]
-        top_points.sort(key=lambda point: point[0])
-
-        return top_points
+        return list(self.top_points)
 
     def get_right_point(self) -> list:
         """
         Get the rightmost points from the vertices.
 
-        This method finds all points in the list of vertices that have the maximum X-coordinate (right points).
-        It returns the list of points sorted by the X-coordinate.
+        Returns a copy of the right points computed at construction, the points of the vertices with the
+        maximum X-coordinate sorted by the Y-coordinate.
 
-        :return: A list of points with the highest X-coordinate, sorted by X.
+        :return: A list of points with the highest X-coordinate, sorted by Y.
         :rtype: list
         """
-        max_x = max(self.vertices, key=lambda vertice: vertice[0])[0]
-        right_points = [point for point in self.vertices if point[0] == max_x]
-        right_points.sort(key=lambda point: point[1])
-
-        return right_points
+        return list(self.right_points)
 
     def get_bottom_point(self) -> list:
         """
         Get the bottommost points from the vertices.
 
-        This method finds all points in the list of vertices that have the minimum Y-coordinate (bottom points).
-        It returns the list of points sorted by the X-coordinate.
+        Returns a copy of the bottom points computed at construction, the points of the vertices with the
+        minimum Y-coordinate sorted by the X-coordinate.
 
         :return: A list of points with the lowest Y-coordinate, sorted by X.
         :rtype: list
         """
-        min_y = min(self.vertices, key=lambda vertice: vertice[1])[1]
-        bottom_points = [point for point in self.vertices if point[1] == min_y]
-        bottom_points.sort(key=lambda point: point[0])
-
-        return bottom_points
+        return list(self.bottom_points)
 
     def get_left_point(self) -> list:
         """
         Get the leftmost points from the vertices.
 
-        This method finds all points in the list of vertices that have the minimum X-coordinate (left points).
-        It returns the list of points sorted by the X-coordinate.
+        Returns a copy of the left points computed at construction, the points of the vertices with the
+        minimum X-coordinate sorted by the Y-coordinate.
 
-        :return: A list of points with the lowest X-coordinate, sorted by X.
+        :return: A list of points with the lowest X-coordinate, sorted by Y.
         :rtype: list
         """
-        min_x = min(self.vertices, key=lambda vertice: vertice[0])[0]
-        left_points = [point for point in self.vertices if point[0] == min_x]
-        left_points.sort(key=lambda point: point[1])
-
-        return left_points
+        return list(self.left_points)
 
     def get_points_direction_of_rotation(self) -> DRotation:
         """
@@ -215,6 +271,106 @@ class Polygon:
 
         return segment_centers
 
+    def get_offset_vertices(self, distance: float) -> list[tuple[float, float]]:
+        """
+        Calculates the vertices of the polygon offset inwards (positive distance) or outwards (negative distance), as
+        the cover line of a concrete section.
+
+        Every side is displaced along its unit normal (no slope/intercept forms, so vertical sides keep their
+        precision) and every vertex moves along the bisector of its sides. Sides that shrink to zero length before
+        reaching the distance (short sides between corners, chamfers, small steps) are removed in order of their
+        collapse distance with a heap, and their neighbours are joined, so the offset runs in O(n log n). Offsets
+        splitting the polygon in several parts are not handled.
+
+        :param distance: Offset distance, positive towards the inside of the polygon.
+        :type distance: float
+        :return: List of (x, y) vertices of the offset polygon, in the same direction of rotation as the polygon
+                 vertices. Empty if the polygon vanishes.
+        :rtype: list[tuple[float, float]]
+        """
+        points = np.asarray(self.vertices, dtype=float)
+
+        # Removing repeated consecutive vertices.
+        if len(points):
+            points = points[np.any(points != np.roll(points, -1, axis=0), axis=1)]
+        n = len(points)
+        if n < 3:
+            return []
+
+        # Sides directions and offset normals.
+        directions = np.roll(points, -1, axis=0) - points
+        directions /= np.hypot(directions[:, 0], directions[:, 1])[:, np.newaxis]
+        signed_area = np.sum(points[:, 0] * np.roll(points[:, 1], -1) - np.roll(points[:, 0], -1) * points[:, 1])
+        normals = np.stack((-directions[:, 1], directions[:, 0]), axis=1)
+        if (signed_area < 0) != (distance < 0):  # Clockwise inwards or counterclockwise outwards.
+            normals = -normals
+        distance = abs(distance)
+
+        def velocity(i: int, j: int) -> np.ndarray:
+            # Velocity of the vertex between sides i and j, along the bisector.
+            return (normals[i] + normals[j]) / max(1 + float(np.dot(normals[i], normals[j])), 1e-12)
+
+        # Vertices (start of every side): position at a given offset, the offset and velocity.
+        previous = np.roll(np.arange(n), 1)
+        velocities = normals[previous] + normals
+        velocities /= np.maximum(1 + np.sum(normals[previous] * normals, axis=1), 1e-12)[:, np.newaxis]
+        positions = points.copy()
+        offsets = np.zeros(n)
+
+        previous = previous.tolist()
+        following = np.roll(np.arange(n), -1).tolist()
+
+        def collapse(i: int) -> float:
+            # Offset at which the side i shrinks to zero length (infinite if it does not shrink).
+            j = following[i]
+            rate = float(np.dot(velocities[j] - velocities[i], directions[i]))
+            if rate >= 0:
+                return math.inf
+            length = float(np.dot(positions[j] - offsets[j] * velocities[j] -
+                                  positions[i] + offsets[i] * velocities[i], directions[i]))
+            return -length / rate
+
+        # Removing collapsed sides in order of offset.
+        alive = [True] * n
+        versions = [0] * n
+        remaining = n
+        events = [(collapse(i), i, 0) for i in range(n)]
+        heapq.heapify(events)
+        while events and remaining >= 3:
+            offset, i, version = heapq.heappop(events)
+            if offset > distance:
+                break
+            if not alive[i] or version != versions[i]:
+                continue
+
+            # Joining the neighbour sides at the collapse point.
+            alive[i] = False
+            remaining -= 1
+            i_previous, i_following = previous[i], following[i]
+            following[i_previous], previous[i_following] = i_following, i_previous
+            offset = max(offset, offsets[i], offsets[i_following])
+            positions[i_following] = positions[i_following] + (offset - offsets[i_following]) * velocities[i_following]
+            offsets[i_following] = offset
+            velocities[i_following] = velocity(i_previous, i_following)
+
+            for j in (i_previous, i_following):
+                versions[j] += 1
+                heapq.heappush(events, (collapse(j), j, versions[j]))
+
+        if remaining < 3:
+            return []
+
+        first = alive.index(True)
+        vertices = []
+        i = first
+        while True:
+            vertices.append(tuple((positions[i] + (distance - offsets[i]) * velocities[i]).tolist()))
+            i = following[i]
+            if i == first:
+                break
+
+        return vertices
+
     def normalize_vertices(self, vertices: list[tuple]) -> list[tuple]:
         """
         Normalize a polygon (vertices) by translating it to the first quadrant,
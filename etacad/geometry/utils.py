@@ -5,6 +5,7 @@
 
 # Externals imports.
 import math
+import numpy as np
 
 
 def displace_perpendicular(x0, y0, a, d):
@@ -54,6 +55,28 @@ def get_euclidean_distance(point1: tuple | list, point2: tuple | list):
     return distance_between_points
 
 
+def get_euclidean_distance_array(points1, points2):
+    """
+    Calculate the Euclidean distances between two groups of Cartesian coordinates, point by point. Single points
+    fall back to `get_euclidean_distance`.
+
+    :param points1: Array like (N, 2) of x and y coordinates of the first points.
+    :type points1: list | numpy.ndarray
+    :param points2: Array like (N, 2) of x and y coordinates of the second points.
+    :type points2: list | numpy.ndarray
+    :return: Array (N,) of distances between the points, or a float for single points.
+    :rtype: numpy.ndarray | float
+    """
+    if np.ndim(points1) == 1 and np.ndim(points2) == 1:
+        return get_euclidean_distance(points1, points2)
+
+    points1 = np.asarray(points1, dtype=float)
+    points2 = np.asarray(points2, dtype=float)
+    delta = points2 - points1
+
+    return np.sqrt(delta[..., 0] ** 2 + delta[..., 1] ** 2)
+
+
 def get_angle(point1: tuple | list, point2: tuple | list, degrees: bool = True, axis: str = "x") -> float:
     """
     Calculates de angle of to points, sorted by axis given (default X).
@@ -265,6 +288,37 @@ def get_line_eq(x1, y1, x2, y2, aprox_inf: bool = True):
     return a, b
 
 
+def get_line_eq_array(points1, points2, aprox_inf: bool = True):
+    """
+    Calculates slopes and intercepts of the lines formed by two groups of points, point by point. Single points fall
+    back to `get_line_eq`.
+
+    :param points1: Array like (N, 2) of the first points of the lines.
+    :type points1: list | numpy.ndarray
+    :param points2: Array like (N, 2) of the second points of the lines.
+    :type points2: list | numpy.ndarray
+    :param aprox_inf: Boolean that specified if the vertical lines are aproximated by 9999999999999999 slope or not.
+    :type aprox_inf: bool
+    :return: Array (N, 2) of slopes and intercepts of the lines, or a tuple for single points.
+    :rtype: numpy.ndarray | tuple
+    """
+    if np.ndim(points1) == 1 and np.ndim(points2) == 1:
+        return get_line_eq(points1[0], points1[1], points2[0], points2[1], aprox_inf=aprox_inf)
+
+    points1 = np.asarray(points1, dtype=float)
+    points2 = np.asarray(points2, dtype=float)
+    x1, y1 = points1[..., 0], points1[..., 1]
+    x2, y2 = points2[..., 0], points2[..., 1]
+
+    # Vertical lines.
+    vertical = x1 == x2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        a = np.where(vertical, float(9999999999999999) if aprox_inf else np.inf, (y2 - y1) / (x2 - x1))
+        b = np.where(vertical, - a * x1, y1 - a * x1)
+
+    return np.stack((a, b), axis=-1)
+
+
 def get_normal_line_eq(a: float, b: float, aprox_inf: bool = True) -> tuple:
     """
     Calculates slope and intercep of the normal line of the slope and intercep given.
@@ -311,6 +365,40 @@ def get_lines_intersec(a1: float, b1: float, a2: float, b2: float) -> tuple[floa
     return x, x * a1 + b1
 
 
+def get_lines_intersec_array(a1, b1, a2, b2, pairwise: bool = False):
+    """
+    Calculates the intersections of two groups of lines given by slopes and intercepts. Lines are intersected one to
+    one (i-th line of the first group with the i-th line of the second one) or, if pairwise is True, every line of
+    the first group with every line of the second one. Single lines fall back to `get_lines_intersec`.
+
+    :param a1: Slopes of the first group of lines.
+    :type a1: float | list | numpy.ndarray
+    :param b1: Intercepts of the first group of lines.
+    :type b1: float | list | numpy.ndarray
+    :param a2: Slopes of the second group of lines.
+    :type a2: float | list | numpy.ndarray
+    :param b2: Intercepts of the second group of lines.
+    :type b2: float | list | numpy.ndarray
+    :param pairwise: Intersects every line of the first group with every line of the second one if it is True.
+    :type pairwise: bool
+    :return: Array (N, 2) of intersections, (N, M, 2) if pairwise, or a tuple for single lines. Parallel lines give
+     not finite coordinates.
+    :rtype: numpy.ndarray | tuple
+    """
+    if all(np.ndim(value) == 0 for value in (a1, b1, a2, b2)):
+        return get_lines_intersec(a1, b1, a2, b2)
+
+    a1, b1 = np.asarray(a1, dtype=float), np.asarray(b1, dtype=float)
+    a2, b2 = np.asarray(a2, dtype=float), np.asarray(b2, dtype=float)
+    if pairwise:
+        a1, b1 = a1[:, np.newaxis], b1[:, np.newaxis]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x = (b2 - b1) / (a1 - a2)
+
+    return np.stack((x, x * a1 + b1), axis=-1)
+
+
 def get_lines_intersec_at_distance(r1: tuple, r2: tuple, d: float, x1: float) -> tuple:
     """
     Calculates the interction of the parallel lines of first and second line given at distance at X value given.
@@ -416,6 +504,44 @@ def parallel_points(p1: tuple, p2: tuple, d: float, sort: bool = True) -> tuple:
     return displaced_point1, displaced_point2, displaced_point3, displaced_point4
 
 
+def parallel_points_array(points1, points2, d: float, sort: bool = True):
+    """
+    Finds the parallels points at the distance given in the both sides of the lines formed by two groups of points,
+    point by point. Single points fall back to `parallel_points`.
+
+    :param points1: Array like (N, 2) of the first points of the lines.
+    :type points1: list | numpy.ndarray
+    :param points2: Array like (N, 2) of the second points of the lines.
+    :type points2: list | numpy.ndarray
+    :param d: Distance at where the parralels line pass.
+    :type d: float
+    :param sort: Sort the points of every line by X coordinate if is it True.
+    :type sort: bool
+    :return: Array (N, 4, 2) with the four points of the parallels lines of every line (same order as
+     `parallel_points`), or a tuple for single points.
+    :rtype: numpy.ndarray | tuple
+    """
+    if np.ndim(points1) == 1 and np.ndim(points2) == 1:
+        return parallel_points(tuple(points1), tuple(points2), d, sort=sort)
+
+    points1 = np.asarray(points1, dtype=float)
+    points2 = np.asarray(points2, dtype=float)
+
+    # Sort points.
+    if sort:
+        swap = (points2[:, 0] < points1[:, 0])[:, np.newaxis]
+        points1, points2 = np.where(swap, points2, points1), np.where(swap, points1, points2)
+
+    # Calculate the slope of the original lines.
+    m = get_line_eq_array(points1, points2)[:, 0]
+
+    # Calculate the horizontal and vertical displacement.
+    delta_y = d / ((1 + m ** 2) ** 0.5)
+    delta = np.stack((-m * delta_y, delta_y), axis=-1)
+
+    return np.stack((points1 + delta, points2 + delta, points1 - delta, points2 - delta), axis=1)
+
+
 def polygon_area(points: list[tuple[float, float]]) -> float:
     """
     Calculate the area of a polygon using the shoelace formula.
@@ -452,6 +578,23 @@ def polygon_area(points: list[tuple[float, float]]) -> float:
     return abs(area) / 2
 
 
+def polygon_area_array(points) -> float | np.ndarray:
+    """
+    Calculate the area of a polygon, or of a stack of polygons with the same number of vertices, using the shoelace
+    formula over the arrays of coordinates.
+
+    :param points: Array like (N, 2) of the polygon vertices, or (M, N, 2) for M polygons.
+    :type points: list | numpy.ndarray
+    :return: The area of the polygon, or an array (M,) of areas.
+    :rtype: float | numpy.ndarray
+    """
+    points = np.asarray(points, dtype=float)
+    x, y = points[..., 0], points[..., 1]
+    area = np.abs(np.sum(x * np.roll(y, -1, axis=-1) - y * np.roll(x, -1, axis=-1), axis=-1)) / 2
+
+    return float(area) if area.ndim == 0 else area
+
+
 def scale_coordinates(*args, scale_factor: float):
     """
     Scales the args given by the scale factor given.
@@ -468,6 +611,20 @@ def scale_coordinates(*args, scale_factor: float):
     return scaled_coordinates
 
 
+def scale_coordinates_array(points, scale_factor: float):
+    """
+    Scales an array of coordinates by the scale factor given.
+
+    :param points: Array like (N, 2) of coordinates to scale.
+    :type points: list | numpy.ndarray
+    :param scale_factor: Number to multiplicate the coordinates given.
+    :type scale_factor: float
+    :return: Array (N, 2) of coordinates scaled.
+    :rtype: numpy.ndarray
+    """
+    return np.asarray(points, dtype=float) * scale_factor
+
+
 # Function that returns center of a line segment.
 def segment_center(points: list) -> tuple:
     """
@@ -511,3 +668,22 @@ def sort_points(*args, axis: str = "x") -> list:
         raise ValueError("Invalid axis. Axis must be 'x' or 'y'.")
 
     return sorted_points
+
+
+def sort_points_array(points, axis: str = "x"):
+    """
+    Sort an array of points by axis given (x or y), keeping the order of points with the same coordinate.
+
+    :param points: Array like (N, 2) of points.
+    :type points: list | numpy.ndarray
+    :param axis: Axis by which the points are sorted ("x" or "y").
+    :type axis: str
+    :return: Array (N, 2) of points sorted.
+    :rtype: numpy.ndarray
+    """
+    if axis not in ("x", "y"):
+        raise ValueError("Invalid axis. Axis must be 'x' or 'y'.")
+
+    points = np.asarray(points, dtype=float)
+
+    return points[np.argsort(points[:, 0 if axis == "x" else 1], kind="stable")]
@@ -65,6 +65,14 @@ class Orientation(Enum):
     LEFT = 3
 
 
+class ShapeCodes(Enum):
+    STRAIGHT = 0
+    ONE_ANCHOR = 1
+    TWO_ANCHORS = 2
+    BENT = 3
+    STIRRUP = 4
+
+
 class SlabTypes(Enum):
     RECTANGULAR = 0
 
@@ -121,7 +129,8 @@ CADTABLE_SET_DEFAULT = {"content_row_height": 0.3,
                         "labels_row_height": 0.3,
                         "labels_column_width": 1,
                         "labels_text_height": 0.2,
-                        "labels_fit": True}
+                        "labels_fit": True,
+                        "text_font": None}
 
 # Column.
 COLUMN_SET_LONG = {"concrete_settings": {"text_dim_distance_horizontal": 0.15,
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+
+# Imports.
+# Local imports.
+from etacad.beam import Beam
+from etacad.column import Column
+from etacad.drawing_utils import defer_dimensions, export_entities, import_entities, render_dimensions
+from etacad.dxf_writer import DXFStreamWriter
+from etacad.slab import Slab
+
+# External imports.
+import ezdxf
+
+from attrs import define, field
+from concurrent.futures import ProcessPoolExecutor
+from ezdxf.document import Drawing
+from typing import TextIO
+
+
+@define
+class Placement:
+    """
+    Represents a view of a structural element placed at a position of the project sheet.
+
+    :param element: Structural element to draw.
+    :type element: Beam | Column | Slab
+    :param x: X coordinate where the view is drawn.
+    :type x: float
+    :param y: Y coordinate where the view is drawn.
+    :type y: float
+    :param view: Name of the drawing method of the element ("draw_longitudinal", "draw_transverse",
+                 "draw_longitudinal_rebar_detailing", etc.).
+    :type view: str
+    :param options: Keyword arguments passed to the drawing method.
+    :type options: dict
+    """
+    element: Beam | Column | Slab
+    x: float = field(default=0)
+    y: float = field(default=0)
+    view: str = field(default="draw_longitudinal")
+    options: dict = field(factory=dict)
+
+    def draw(self, document: Drawing, collect: bool = True) -> dict:
+        """
+        Draws the view of the element in the document given.
+
+        :param document: The `ezdxf` Drawing object where the view will be drawn.
+        :type document: Drawing
+        :param collect: If False, the entities are not grouped and only their number is returned ({"count": n}).
+        :type collect: bool
+        :return: Dictionary of entities returned by the drawing method of the element.
+        :rtype: dict
+        """
+        options = {**self.options, "collect": collect}
+        return getattr(self.element, self.view)(document=document, x=self.x, y=self.y, **options)
+
+
+@define
+class Project:
+    """
+    Represents a drawing project holding many structural elements (beams, columns, slabs) with their positions on the
+    sheet, drawn all together into a single document.
+
+    :param placements: Views of the elements placed in the project.
+    :type placements: list[Placement]
+    :param dxfversion: DXF version of the document created when drawing the project.
+    :type dxfversion: str
+
+    :ivar placements: Views of the elements placed in the project.
+    :vartype placements: list[Placement]
+    :ivar dxfversion: DXF version of the document created when drawing the project.
+    :vartype dxfversion: str
+    """
+    placements: list[Placement] = field(factory=list)
+    dxfversion: str = field(default="R2010")
+
+    def add(self,
+            element: Beam | Column | Slab,
+            x: float = 0,
+            y: float = 0,
+            view: str = "draw_longitudinal",
+            **options) -> Placement:
+        """
+        Places a view of an element in the project.
+
+        :param element: Structural element to draw.
+        :type element: Beam | Column | Slab
+        :param x: X coordinate where the view is drawn.
+        :type x: float
+        :param y: Y coordinate where the view is drawn.
+        :type y: float
+        :param view: Name of the drawing method of the element.
+        :type view: str
+        :param options: Keyword arguments passed to the drawing method.
+        :return: The placement added.
+        :rtype: Placement
+        """
+        if not callable(getattr(element, view, None)):
+            raise AttributeError(f"{type(element).__name__} has no drawing method {view}.")
+
+        placement = Placement(element=element, x=x, y=y, view=view, options=options)
+        self.placements.append(placement)
+
+        return placement
+
+    def draw(self,
+             document: Drawing = None,
+             processes: int = 1,
+             chunk_size: int = None,
+             dimension_blocks: bool = True) -> Drawing:
+        """
+        Draws every placement of the project into a single document.
+
+        With more than one process, the placements are split in ordered chunks and every chunk is drawn in a worker
+        process into its own document. Workers send back the entities as detached batches (see `export_entities`),
+        merged into the document given in the order of the placements. Scripts using processes must guard their
+        entry point with `if __name__ == "__main__":`. Dimensions are rendered in one pass once every placement is
+        drawn (see `render_dimensions`).
+
+        :param document: The `ezdxf` Drawing object where the project will be drawn. If None, a new one is created.
+        :type document: Drawing, optional
+        :param processes: Number of worker processes. With 1, placements are drawn straight into the document.
+        :type processes: int
+        :param chunk_size: Number of placements drawn by every worker task. Defaults to four tasks per process, so
+                           the batches of the first tasks are merged while the workers draw the next ones.
+        :type chunk_size: int, optional
+        :param dimension_blocks: If False, dimensions are left without geometry block, for viewers regenerating them.
+        :type dimension_blocks: bool
+        :return: The document with the project drawn.
+        :rtype: Drawing
+        """
+        if document is None:
+            document = ezdxf.new(dxfversion=self.dxfversion, setup=True)
+
+        if processes <= 1 or len(self.placements) <= 1:
+            defer_dimensions(doc=document)
+            for placement in self.placements:
+                placement.draw(document=document, collect=False)
+            render_dimensions(doc=document, skip=not dimension_blocks)
+            return document
+
+        if chunk_size is None:
+            chunk_size = -(-len(self.placements) // (processes * 4))
+        chunks = [self.placements[i:i + chunk_size] for i in range(0, len(self.placements), chunk_size)]
+
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            for batch in executor.map(_draw_chunk, chunks, [document.dxfversion] * len(chunks),
+                                      [dimension_blocks] * len(chunks)):
+                import_entities(doc=document, batch=batch)
+
+        return document
+
+    def write(self, stream: str | TextIO, document: Drawing = None, dimension_blocks: bool = True) -> int:
+        """
+        Draws every placement of the project and streams it to a DXF file (see `DXFStreamWriter`). The entities of
+        every placement are written to disk right after it is drawn, so the entities of the whole sheet are never held
+        in memory at once.
+
+        :param stream: File path or text stream where the DXF file is written.
+        :type stream: str | TextIO
+        :param document: The `ezdxf` Drawing object used to draw the placements (header, tables, blocks and objects
+                         are taken from it). If None, a new one is created.
+        :type document: Drawing, optional
+        :param dimension_blocks: If False, dimensions are left without geometry block, for viewers regenerating them.
+        :type dimension_blocks: bool
+        :return: Number of modelspace entities written.
+        :rtype: int
+        """
+        with DXFStreamWriter(stream=stream, document=document, dxfversion=self.dxfversion) as writer:
+            defer_dimensions(doc=writer.document)
+            for placement in self.placements:
+                placement.draw(document=writer.document, collect=False)
+                render_dimensions(doc=writer.document, skip=not dimension_blocks, defer=True)
+                writer.flush()
+            render_dimensions(doc=writer.document)
+
+        return writer.count
+
+
+# Function that draws a chunk of placements in a new document and returns its entities (worker process task).
+def _draw_chunk(placements: list[Placement], dxfversion: str, dimension_blocks: bool = True) -> dict:
+    document = ezdxf.new(dxfversion=dxfversion, setup=True)
+    defer_dimensions(doc=document)
+    for placement in placements:
+        placement.draw(document=document, collect=False)
+    render_dimensions(doc=document, skip=not dimension_blocks)
+
+    return export_entities(doc=document)
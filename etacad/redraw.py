@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+
+# Imports.
+# Local imports.
+from etacad.drawing_utils import delete_entities
+
+# External imports.
+import copy
+
+from attrs import define, field, fields
+from ezdxf.document import Drawing
+from itertools import chain
+
+
+@define
+class TrackedDrawing:
+    """
+    Record of a view of an element drawn with `Redrawable.draw_tracked`.
+
+    :param document: The `ezdxf` Drawing object where the view was drawn.
+    :type document: Drawing
+    :param view: Name of the drawing method of the element.
+    :type view: str
+    :param x: X coordinate given to the drawing method. If None, the view follows the x of the element.
+    :type x: float, optional
+    :param y: Y coordinate given to the drawing method. If None, the view follows the y of the element.
+    :type y: float, optional
+    :param options: Keyword arguments passed to the drawing method.
+    :type options: dict
+    :param handles: Handles of the entities drawn by every piece of the view.
+    :type handles: dict[str, list[str]]
+    :param dirty: Groups of derived sub-objects changed since the view was last drawn.
+    :type dirty: set[str]
+    """
+    document: Drawing = field(repr=False, eq=False)
+    view: str
+    x: float = field(default=None)
+    y: float = field(default=None)
+    options: dict = field(factory=dict)
+    handles: dict = field(factory=dict)
+    dirty: set = field(factory=set)
+
+
+@define
+class Redrawable:
+    """
+    Base of the structural elements redrawn in place after changing their inputs.
+
+    The views drawn with `draw_tracked` keep the handles of their entities. `update` changes inputs of the element and
+    marks the groups of derived sub-objects (bars, stirrups, concrete, etc.) depending on them, then `redraw` deletes
+    and draws again only the pieces of the tracked views depending on those groups.
+
+    Subclasses describe their dependencies with class attributes:
+        - `_GROUPS`: Groups of derived sub-objects of the element.
+        - `_DEPENDENCIES`: Groups depending on every input. Inputs not listed (geometry, position, etc.) affect all
+          the groups.
+        - `_VIEWS`: Pieces of every drawing method, as {piece: (groups, flags)}. A piece is drawn calling the method
+          with its flags on and the flags of the other pieces of the view off. Methods not listed are drawn as a single
+          piece depending on all the groups.
+    """
+    _GROUPS = frozenset()
+    _DEPENDENCIES = {}
+    _VIEWS = {}
+
+    _inputs: dict = field(init=False, factory=dict, repr=False, eq=False)
+    _drawings: list = field(init=False, factory=list, repr=False, eq=False)
+
+    def _record_inputs(self) -> None:
+        # Keeps the inputs given, called before __attrs_post_init__ derives the rest of attributes from them.
+        self._inputs = {attribute.name: copy.deepcopy(getattr(self, attribute.name))
+                        for attribute in fields(type(self)) if attribute.init}
+
+    def update(self, **changes) -> set[str]:
+        """
+        Changes inputs of the element and rebuilds its derived attributes. The pieces of the tracked drawings depending
+        on the inputs changed are drawn again by the next `redraw`.
+
+        :param changes: Inputs of the element to change, as given to the constructor.
+        :return: Groups of derived sub-objects affected by the changes.
+        :rtype: set[str]
+        """
+        for name in changes:
+            if name not in self._inputs:
+                raise AttributeError(f"{type(self).__name__} has no input {name}.")
+
+        inputs = {**self._inputs, **changes}
+        element = type(self)(**{name.lstrip("_"): value for name, value in inputs.items()})
+
+        groups = set()
+        for name in changes:
+            if element._inputs[name] != self._inputs[name]:
+                groups |= self._DEPENDENCIES.get(name, self._GROUPS)
+
+        for attribute in fields(type(self)):
+            if attribute.name != "_drawings":
+                setattr(self, attribute.name, getattr(element, attribute.name))
+        for drawing in self._drawings:
+            drawing.dirty |= groups
+
+        return groups
+
+    def draw_tracked(self,
+                     document: Drawing,
+                     view: str = "draw_longitudinal",
+                     x: float = None,
+                     y: float = None,
+                     **options) -> dict:
+        """
+        Draws a view of the element as its drawing method does, keeping the handles of the entities of every piece of
+        the view for `redraw`.
+
+        :param document: The `ezdxf` Drawing object where the view will be drawn.
+        :type document: Drawing
+        :param view: Name of the drawing method of the element.
+        :type view: str
+        :param x: X coordinate where the view is drawn. If None, the view follows the x of the element.
+        :type x: float, optional
+        :param y: Y coordinate where the view is drawn. If None, the view follows the y of the element.
+        :type y: float, optional
+        :param options: Keyword arguments passed to the drawing method.
+        :return: Dictionary with the entities drawn by every piece of the view and "all_elements".
+        :rtype: dict
+        """
+        if not callable(getattr(self, view, None)):
+            raise AttributeError(f"{type(self).__name__} has no drawing method {view}.")
+
+        drawing = TrackedDrawing(document=document, view=view, x=x, y=y, options=options)
+        self._drawings.append(drawing)
+
+        elements = {}
+        for piece in self.__pieces(view=view):
+            elements[piece] = self.__draw_piece(document=document, drawing=drawing, piece=piece)
+        elements["all_elements"] = list(chain(*elements.values()))
+
+        return elements
+
+    def redraw(self, document: Drawing) -> int:
+        """
+        Deletes and draws again the pieces of the views tracked in the document affected by the changes made with
+        `update`. Views tracked in other documents are left for their own `redraw`.
+
+        :param document: The `ezdxf` Drawing object where the tracked views were drawn.
+        :type document: Drawing
+        :return: Number of entities drawn.
+        :rtype: int
+        """
+        count = 0
+        for drawing in self._drawings:
+            if drawing.document is not document:
+                continue
+            for piece, (groups, _) in self.__pieces(view=drawing.view).items():
+                if groups & drawing.dirty:
+                    delete_entities(doc=document, handles=drawing.handles[piece])
+                    count += len(self.__draw_piece(document=document, drawing=drawing, piece=piece))
+            drawing.dirty.clear()
+
+        return count
+
+    def __pieces(self, view: str) -> dict:
+        return self._VIEWS.get(view, {view: (self._GROUPS, ())})
+
+    def __draw_piece(self, document: Drawing, drawing: TrackedDrawing, piece: str) -> list:
+        pieces = self.__pieces(view=drawing.view)
+        flags = {flag: drawing.options.get(flag, True) for flag in pieces[piece][1]}
+
+        entities = []
+        if not flags or any(flags.values()):
+            # Switching off the other pieces of the view.
+            options = {**drawing.options, "collect": True}
+            for _, piece_flags in pieces.values():
+                options.update(dict.fromkeys(piece_flags, False))
+            options.update(flags)
+
+            elements = getattr(self, drawing.view)(document=document, x=drawing.x, y=drawing.y, **options)
+            entities = elements.get("all_elements", [])
+
+        drawing.handles[piece] = [entitie.dxf.handle for entitie in entities]
+        return entities
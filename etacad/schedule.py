@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+
+# Imports.
+# Local imports.
+from etacad.beam import Beam
+from etacad.cadtable import CADTable
+from etacad.column import Column
+from etacad.globals import ElementTypes, ShapeCodes
+from etacad.project import Project
+from etacad.slab import Slab
+
+# External imports.
+import csv
+import json
+import numpy as np
+import os
+
+from attrs import define, field
+from ezdxf.document import Drawing
+from typing import Iterator, TextIO
+
+# Columns of the schedule records and their types.
+SCHEDULE_COLUMNS = {"element": np.int64,
+                    "diameter": np.float64,
+                    "shape": np.int8,
+                    "length": np.float64,
+                    "quantity": np.int64,
+                    "weight": np.float64}
+
+# Columns of the grouped totals.
+SCHEDULE_TOTALS = ("quantity", "total_length", "weight")
+
+
+# Function that gets the shape code of a bar, stirrup or spaced bars.
+def shape_code(element) -> ShapeCodes:
+    """
+    Classifies the shape of a reinforcement element for the bending schedule.
+
+    :param element: Bar, stirrup or spaced bars.
+    :return: Shape code of the element.
+    :rtype: ShapeCodes
+    """
+    if element.element_type == ElementTypes.STIRRUP:
+        return ShapeCodes.STIRRUP
+    if element.bend_angle:
+        return ShapeCodes.BENT
+
+    anchors = bool(element.left_anchor) + bool(element.right_anchor)
+    return (ShapeCodes.STRAIGHT, ShapeCodes.ONE_ANCHOR, ShapeCodes.TWO_ANCHORS)[anchors]
+
+
+@define
+class BarSchedule:
+    """
+    Bar bending schedule of many structural elements, kept as typed numeric columns (one record per bar position of
+    every element) instead of formatted table rows, so totals over thousands of elements are array reductions.
+
+    Records are taken from the position registry of the elements (see `gen_position_registry`): the diameter, shape
+    code and length of the representative bar of the position, the number of pieces and their total weight.
+
+    :param elements: Structural elements of the schedule.
+    :type elements: list[Beam | Column | Slab]
+
+    :ivar positions: Position of every record.
+    :vartype positions: list[str]
+    :ivar columns: Typed arrays of the records, by column name (see `SCHEDULE_COLUMNS`).
+    :vartype columns: dict[str, numpy.ndarray]
+    """
+    elements: list[Beam | Column | Slab] = field(factory=list)
+    positions: list[str] = field(init=False, factory=list)
+    _records: dict = field(init=False, repr=False)
+    _columns: dict = field(init=False, default=None, repr=False)
+
+    def __attrs_post_init__(self):
+        self._records = {name: [] for name in SCHEDULE_COLUMNS}
+
+        elements, self.elements = self.elements, []
+        for element in elements:
+            self.add(element=element)
+
+    @classmethod
+    def from_project(cls, project: Project) -> "BarSchedule":
+        """
+        Creates the schedule of the elements placed in a project, counting once the elements placed in several
+        views.
+
+        :param project: Project holding the elements.
+        :type project: Project
+        :return: Schedule of the elements of the project.
+        :rtype: BarSchedule
+        """
+        elements = {id(placement.element): placement.element for placement in project.placements}
+        return cls(elements=[*elements.values()])
+
+    def add(self, element: Beam | Column | Slab) -> int:
+        """
+        Adds the records of the bar positions of an element.
+
+        :param element: Structural element.
+        :type element: Beam | Column | Slab
+        :return: Number of records added.
+        :rtype: int
+        """
+        index = len(self.elements)
+        self.elements.append(element)
+
+        records = self._records
+        for position, entry in element.position_registry.items():
+            bar = entry["bar"]
+            self.positions.append(position)
+            records["element"].append(index)
+            records["diameter"].append(bar.diameter)
+            records["shape"].append(shape_code(bar).value)
+            records["length"].append(bar.length)
+            records["quantity"].append(entry["quantity"])
+            records["weight"].append(entry["weight"])
+        self._columns = None
+
+        return len(element.position_registry)
+
+    @property
+    def columns(self) -> dict:
+        """Typed arrays of the records, built once after the last element added."""
+        if self._columns is None:
+            self._columns = {name: np.array(values, dtype=SCHEDULE_COLUMNS[name])
+                             for name, values in self._records.items()}
+        return self._columns
+
+    def total_weight(self) -> float:
+        """
+        Total steel weight of the schedule.
+
+        :return: Weight in kg.
+        :rtype: float
+        """
+        return float(self.columns["weight"].sum())
+
+    def group(self, by: tuple = ("diameter", "shape", "length"), decimals: int = 2) -> dict:
+        """
+        Totals the records grouped by the columns given. Diameters and lengths are grouped rounded, to `decimals`
+        places for lengths and to the tenth of millimeter for diameters.
+
+        :param by: Columns grouping the records, among "element", "diameter", "shape" and "length".
+        :type by: tuple
+        :param decimals: Decimal places of the lengths grouped.
+        :type decimals: int
+        :return: Typed arrays with the columns grouped, sorted by them, and the totals "quantity", "total_length"
+                 and "weight" of every group.
+        :rtype: dict[str, numpy.ndarray]
+        """
+        columns = self.columns
+        places = {"diameter": 4, "length": decimals}
+        keys = {name: np.round(columns[name], places.get(name, 0)).astype(columns[name].dtype) for name in by}
+
+        unique, inverse = np.unique(np.rec.fromarrays([*keys.values()], names=[*keys]), return_inverse=True)
+        groups = {name: unique[name] for name in keys}
+        groups["quantity"] = np.bincount(inverse, weights=columns["quantity"], minlength=len(unique)).astype(np.int64)
+        groups["total_length"] = np.bincount(inverse, weights=columns["quantity"] * columns["length"],
+                                             minlength=len(unique)).astype(np.float64)
+        groups["weight"] = np.bincount(inverse, weights=columns["weight"], minlength=len(unique)).astype(np.float64)
+
+        return groups
+
+    def iter_rows(self, by: tuple = ("diameter", "shape", "length"), decimals: int = 2) -> Iterator[dict]:
+        """
+        Yields the groups of `group` one at a time as dictionaries of plain numbers, shapes by name.
+
+        :param by: Columns grouping the records.
+        :type by: tuple
+        :param decimals: Decimal places of the lengths grouped.
+        :type decimals: int
+        :return: Iterator over the rows.
+        :rtype: Iterator[dict]
+        """
+        groups = self.group(by=by, decimals=decimals)
+        names = [*groups]
+        for values in zip(*(groups[name].tolist() for name in names)):
+            row = dict(zip(names, values))
+            if "shape" in row:
+                row["shape"] = ShapeCodes(row["shape"]).name
+            yield row
+
+    def write_csv(self, stream: str | TextIO, by: tuple = ("diameter", "shape", "length"), decimals: int = 2) -> int:
+        """
+        Streams the grouped totals to a CSV file, a row per group with a header.
+
+        :param stream: File path or text stream where the CSV is written.
+        :type stream: str | TextIO
+        :param by: Columns grouping the records.
+        :type by: tuple
+        :param decimals: Decimal places of the lengths grouped.
+        :type decimals: int
+        :return: Number of rows written.
+        :rtype: int
+        """
+        def write(text_stream: TextIO) -> int:
+            writer = csv.DictWriter(text_stream, fieldnames=[*by, *SCHEDULE_TOTALS])
+            writer.writeheader()
+            count = 0
+            for row in self.iter_rows(by=by, decimals=decimals):
+                writer.writerow(row)
+                count += 1
+            return count
+
+        if isinstance(stream, (str, os.PathLike)):
+            with open(stream, mode="wt", newline="") as text_stream:
+                return write(text_stream)
+        return write(stream)
+
+    def write_json(self, stream: str | TextIO, by: tuple = ("diameter", "shape", "length"), decimals: int = 2) -> int:
+        """
+        Streams the grouped totals to a JSON file, as an array with an object per group.
+
+        :param stream: File path or text stream where the JSON is written.
+        :type stream: str | TextIO
+        :param by: Columns grouping the records.
+        :type by: tuple
+        :param decimals: Decimal places of the lengths grouped.
+        :type decimals: int
+        :return: Number of rows written.
+        :rtype: int
+        """
+        def write(text_stream: TextIO) -> int:
+            count = 0
+            text_stream.write("[")
+            for row in self.iter_rows(by=by, decimals=decimals):
+                text_stream.write((",\n" if count else "\n") + json.dumps(row))
+                count += 1
+            text_stream.write("\n]\n")
+            return count
+
+        if isinstance(stream, (str, os.PathLike)):
+            with open(stream, mode="wt") as text_stream:
+                return write(text_stream)
+        return write(stream)
+
+    def draw_table(self,
+                   document: Drawing,
+                   x: float = 0,
+                   y: float = 0,
+                   by: tuple = ("diameter", "shape", "length"),
+                   decimals: int = 2,
+                   page_rows: int = 40,
+                   collect: bool = True) -> dict:
+        """
+        Draws the grouped totals as a table, in pages of `page_rows` rows (see `CADTable.draw_pages`). Rows are
+        formatted as they are drawn.
+
+        :param document: The `ezdxf` Drawing object where the table will be drawn.
+        :type document: Drawing
+        :param x: X coordinate of the bottom-left corner of the table.
+        :type x: float
+        :param y: Y coordinate of the bottom-left corner of the table.
+        :type y: float
+        :param by: Columns grouping the records.
+        :type by: tuple
+        :param decimals: Decimal places of the lengths grouped.
+        :type decimals: int
+        :param page_rows: Number of rows of every page.
+        :type page_rows: int
+        :param collect: If False, the entities are not grouped and only their number is returned ({"count": n}).
+        :type collect: bool
+        :return: Dictionary with the entities of every page and "all_elements".
+        :rtype: dict
+        """
+        names = [*by, *SCHEDULE_TOTALS]
+        formats = {"diameter": "{0}", "length": "{0:.%df}" % decimals, "total_length": "{0:.2f}", "weight": "{0:.2f}"}
+        rows = ([formats.get(name, "{0}").format(row[name]) for name in names]
+                for row in self.iter_rows(by=by, decimals=decimals))
+
+        table = CADTable(rows=0, columns=len(names), labels=[name.replace("_", " ").upper() for name in names])
+        return table.draw_pages(document=document, rows=rows, x=x, y=y, page_rows=page_rows, collect=collect)
@@ -4,19 +4,23 @@
 from etacad.cadtable import CADTable
 from etacad.concrete import Concrete
 from etacad.converters import to_list
-from etacad.drawing_utils import text
+from etacad.drawing_utils import count_entities, text
+from etacad.geometry import IntervalIndex
 from etacad.globals import (Position, Axes, Direction, ElementTypes, Orientation, CONCRETE_WEIGHT,
                             SLAB_SET_LONGITUDINAL, SLAB_SET_TRANSVERSE, SLAB_SET_LONG_REBBAR)
+from etacad.redraw import Redrawable
 from etacad.spaced_bars import SpacedBars
+from etacad.utils import gen_position_registry
 
 # External imports.
 from attrs import define, field
 from ezdxf.document import Drawing
 from itertools import chain
+from typing import Iterator
 
 
 @define
-class Slab:
+class Slab(Redrawable):
     """
     Slab element, computes geometrics and physics props and manages dxf drawing methods (longitudinal, transversal,
     reinforcement detailing, etc.)
@@ -163,6 +167,8 @@ class Slab:
 
     :ivar positions: Dictionary of bar positions used in labeling.
     :vartype positions: dict
+    :ivar position_registry: Spaced bars aggregated by position (see `gen_position_registry`).
+    :vartype position_registry: dict
     :ivar max_db_sup_x: Maximum diameter in superior X bars.
     :vartype max_db_sup_x: float
     :ivar max_db_sup_y: Maximum diameter in superior Y bars.
@@ -183,6 +189,37 @@ class Slab:
     :ivar number_init_inf_y: Initial bar ID number for inferior Y bars.
     :vartype number_init_inf_y: int
     """
+    # Redrawing dependencies (see Redrawable).
+    _GROUPS = frozenset({"concrete", "bars_sup", "bars_inf"})
+    _DEPENDENCIES = {"as_sup_x_db": {"bars_sup", "bars_inf"},
+                     "as_sup_y_db": {"bars_sup", "bars_inf"},
+                     "as_inf_x_db": {"bars_sup", "bars_inf"},
+                     "as_inf_y_db": {"bars_sup", "bars_inf"},
+                     "as_sup_x_sp": {"bars_sup"},
+                     "as_sup_y_sp": {"bars_sup"},
+                     "as_inf_x_sp": {"bars_inf"},
+                     "as_inf_y_sp": {"bars_inf"},
+                     "as_sup_x_anchor": {"bars_sup"},
+                     "as_sup_y_anchor": {"bars_sup"},
+                     "as_inf_x_anchor": {"bars_inf"},
+                     "as_inf_y_anchor": {"bars_inf"},
+                     "as_sup_x_bend_longitud": {"bars_sup"},
+                     "as_sup_y_bend_longitud": {"bars_sup"},
+                     "as_sup_x_bend_angle": {"bars_sup"},
+                     "as_sup_y_bend_angle": {"bars_sup"},
+                     "number_init": {"bars_sup", "bars_inf"},
+                     "nomenclature": {"bars_sup", "bars_inf"},
+                     "concrete_specific_weight": set(),
+                     "description": set(),
+                     "element_type": set()}
+    _VIEWS = {"draw_longitudinal": {"concrete": ({"concrete"}, ("concrete_shape",)),
+                                    "bars_sup": ({"bars_sup"}, ("bars", "bars_sup")),
+                                    "bars_inf": ({"bars_inf"}, ("bars", "bars_inf"))},
+              "draw_transverse": {"concrete": ({"concrete"}, ("concrete_shape",)),
+                                  "bars": ({"bars_sup", "bars_inf"}, ("bars",))},
+              "draw_longitudinal_rebar_detailing": {"detailing": ({"bars_sup", "bars_inf"}, ())},
+              "draw_table_rebar_detailing": {"table": ({"bars_sup", "bars_inf"}, ())}}
+
     # Geometric attributes.
     length_x: float = field(converter=float)
     length_y: float = field(converter=float)
@@ -207,7 +244,7 @@ class Slab:
     max_db_sup_y: float = field(init=False)
     max_db_inf_x: float = field(init=False)
     max_db_inf_y: float = field(init=False)
-    max_db_hz: float = field(init=False)
+    max_db_hz: float = field(init=False, default=None)
 
     as_sup_x_anchor: list | float = field(default=None, converter=to_list)
     as_sup_y_anchor: list | float = field(default=None, converter=to_list)
@@ -242,6 +279,7 @@ class Slab:
     # Entities groups.
     all_bars: list[SpacedBars] = field(init=False)
     all_elements: list = field(init=False)
+    _section_indexes: dict = field(init=False, factory=dict, repr=False)
 
     # Box attributes.
     _box_width: float = field(init=False)
@@ -249,7 +287,8 @@ class Slab:
 
     # Position bar attributes.
     nomenclature: str = field(default="#")
-    positions: dict = field(init=False)
+    positions: dict = field(init=False, factory=dict)
+    position_registry: dict = field(init=False, factory=dict, repr=False)
     number_init: int = field(default=None)
     description: str = field(default=None)
 
@@ -257,6 +296,8 @@ class Slab:
     element_type: ElementTypes = field(default=ElementTypes.SLAB)
 
     def __attrs_post_init__(self):
+        self._record_inputs()
+
         # Longitudinal steel attributes.
         if self.number_init is None:
             self.number_init = 1
@@ -347,6 +388,7 @@ class Slab:
         # Entities groups.
         self.all_bars = self.bars_as_sup_x + self.bars_as_sup_y + self.bars_as_inf_x + self.bars_as_inf_y
         self.all_elements = self.all_bars
+        self.position_registry = gen_position_registry(elements=self.all_bars)
 
         # Box attributes.
         self._box_width = self.length_x
@@ -362,6 +404,14 @@ class Slab:
         """Bounding box height (equal to length_y)."""
         return self._box_height
 
+    def clear_section_index(self) -> None:
+        """
+        Discards the interval indexes used by section queries and rebuilds the position registry. Call it after moving,
+        resizing or relabeling spaced bars of the slab in place, the indexes are rebuilt on the next section drawn.
+        """
+        self._section_indexes.clear()
+        self.position_registry = gen_position_registry(elements=self.all_bars)
+
     def draw_longitudinal(self, document: Drawing,
                           x: float = None,
                           y: float = None,
@@ -374,7 +424,10 @@ class Slab:
                           one_bar_position_inf: int = 6,
                           dimensions: bool = True,
                           description: bool = True,
-                          unifilar_bars: bool = False) -> dict:
+                          unifilar_bars: bool = False,
+                          cache: bool = False,
+                          as_blocks: bool = False,
+                          collect: bool = True) -> dict:
         """
         Draws the longitudinal view of the slab, including the concrete section and reinforcement bars.
 
@@ -408,6 +461,13 @@ class Slab:
         :type description: bool
         :param unifilar_bars: If True, draws bars in unifilar (symbolic) representation.
         :type unifilar_bars: bool
+        :param cache: If True, bars with the same shape are computed once and reused with a translation.
+        :type cache: bool
+        :param as_blocks: If True, each distinct bar shape is defined once as a block and bars are drawn as block
+            references (INSERT entities).
+        :type as_blocks: bool
+        :param collect: If False, the entities are not grouped and only their number is returned ({"count": n}).
+        :type collect: bool
 
         :return: Dictionary containing grouped drawing elements:
             - "concrete_elements": list of DXF elements related to the concrete section
@@ -431,7 +491,8 @@ class Slab:
                                                           y=y,
                                                           dimensions=dimensions,
                                                           dimensions_inner=False,
-                                                          settings=SLAB_SET_LONGITUDINAL["concrete_settings"])
+                                                          settings=SLAB_SET_LONGITUDINAL["concrete_settings"],
+                                                          collect=collect)
 
         # Drawing of bars.
         if bars:
@@ -447,7 +508,10 @@ class Slab:
                         description=description,
                         one_bar=one_bar,
                         one_bar_position=one_bar_position_sup,
-                        settings=SLAB_SET_LONGITUDINAL["spaced_bars_settings"]))
+                        settings=SLAB_SET_LONGITUDINAL["spaced_bars_settings"],
+                        cache=cache,
+                        as_blocks=as_blocks,
+                        collect=collect))
             if bars_inf:
                 for sp_bar in (self.bars_as_inf_x + self.bars_as_inf_y):
                     spaced_bars_dict.append(sp_bar.draw_longitudinal(
@@ -460,12 +524,18 @@ class Slab:
                         description=description,
                         one_bar=one_bar,
                         one_bar_position=one_bar_position_inf,
-                        settings=SLAB_SET_LONGITUDINAL["spaced_bars_settings"]))
+                        settings=SLAB_SET_LONGITUDINAL["spaced_bars_settings"],
+                        cache=cache,
+                        as_blocks=as_blocks,
+                        collect=collect))
+
+        if not collect:
+            return {"count": count_entities(concrete_dict, spaced_bars_dict)}
 
         # Setting groups of elements in dictionary.
         elements["concrete_elements"] = concrete_dict
         elements["spaced_bars_elements"] = spaced_bars_dict
-        elements["all_elements"] = (elements["concrete_elements"]["all_elements"] +
+        elements["all_elements"] = ((concrete_dict["all_elements"] if concrete_dict else []) +
                                     list(chain(*[spbars["all_elements"] for spbars in spaced_bars_dict])))
 
         return elements
@@ -474,6 +544,7 @@ class Slab:
                         x: float = None,
                         y: float = None,
                         axe_section: str = "x",
+                        section: float = None,
                         concrete_shape: bool = True,
                         bars: bool = True,
                         dimensions: bool = True,
@@ -481,7 +552,8 @@ class Slab:
                         description_start_sup: int = 6,
                         description_start_inf: int = 8,
                         unifilar: bool = False,
-                        settings: dict = SLAB_SET_TRANSVERSE) -> dict:
+                        settings: dict = SLAB_SET_TRANSVERSE,
+                        collect: bool = True) -> dict:
         """
         Draws the transverse section of the slab, including the concrete shape and reinforcement bars.
 
@@ -497,6 +569,9 @@ class Slab:
         :type y: float, optional
         :param axe_section: Section axis ("x" for right view or "y" for front view).
         :type axe_section: str
+        :param section: Coordinate of the section along the section axis, relative to the slab origin. Only the
+                        spaced bars crossing it are drawn. If None, all the spaced bars are drawn.
+        :type section: float, optional
         :param concrete_shape: Whether to draw the concrete shape of the slab section.
         :type concrete_shape: bool
         :param bars: Whether to draw reinforcement bars.
@@ -513,6 +588,8 @@ class Slab:
         :type unifilar: bool
         :param settings: Dictionary of drawing settings for concrete and reinforcement bars.
         :type settings: dict
+        :param collect: If False, the entities are not grouped and only their number is returned ({"count": n}).
+        :type collect: bool
 
         :return: Dictionary containing grouped DXF elements:
             - "concrete": DXF elements related to the concrete shape.
@@ -537,14 +614,16 @@ class Slab:
                                                               y=y,
                                                               dimensions=dimensions,
                                                               dimensions_inner=False,
-                                                              settings=settings["concrete_settings"])
+                                                              settings=settings["concrete_settings"],
+                                                              collect=collect)
             if axe_section == Axes.Y.value:
                 concrete_dict = self.concrete.draw_front_view(document=document,
                                                               x=x,
                                                               y=y,
                                                               dimensions=dimensions,
                                                               dimensions_inner=False,
-                                                              settings=settings["concrete_settings"])
+                                                              settings=settings["concrete_settings"],
+                                                              collect=collect)
 
         # Drawing bars.
         if bars:
@@ -573,6 +652,21 @@ class Slab:
                 other_extreme = False
                 inverter_coeficient = -1
 
+            # Filtering bars by section coordinate.
+            if section is not None:
+                sp_bars_tr_sup = self.__elements_section(elements=sp_bars_tr_sup,
+                                                         section=section,
+                                                         axe_section=axe_section)
+                sp_bars_tr_inf = self.__elements_section(elements=sp_bars_tr_inf,
+                                                         section=section,
+                                                         axe_section=axe_section)
+                sp_bars_lg_sup = self.__elements_section(elements=sp_bars_lg_sup,
+                                                         section=section,
+                                                         axe_section=axe_section)
+                sp_bars_lg_inf = self.__elements_section(elements=sp_bars_lg_inf,
+                                                         section=section,
+                                                         axe_section=axe_section)
+
             # Transverse bar sections.
             # Superior.
             for i, sp_bar in enumerate(sp_bars_tr_sup):
@@ -601,7 +695,8 @@ class Slab:
                                                                bar_displacements=bar_displacements,
                                                                rotate_angle=rotate_angle,
                                                                other_extreme=other_extreme,
-                                                               settings=settings["spaced_bars_settings"]))
+                                                               settings=settings["spaced_bars_settings"],
+                                                               collect=collect))
 
             # Inferior.
             for i, sp_bar in enumerate(sp_bars_tr_inf):
@@ -630,7 +725,8 @@ class Slab:
                                                                bar_displacements=bar_displacements,
                                                                rotate_angle=rotate_angle,
                                                                other_extreme=other_extreme,
-                                                               settings=settings["spaced_bars_settings"]))
+                                                               settings=settings["spaced_bars_settings"],
+                                                               collect=collect))
 
             # Longitudinal bars.
             # Superior.
@@ -647,7 +743,8 @@ class Slab:
                                                                              dimensions=False,
                                                                              denomination=False,
                                                                              unifilar=unifilar,
-                                                                             settings=settings["spaced_bars_settings"]))
+                                                                             settings=settings["spaced_bars_settings"],
+                                                                             collect=collect))
 
             # Inferior.
             for sp_bar in sp_bars_lg_inf:
@@ -663,15 +760,19 @@ class Slab:
                                                                              dimensions=False,
                                                                              denomination=False,
                                                                              unifilar=unifilar,
-                                                                             settings=settings["spaced_bars_settings"]))
+                                                                             settings=settings["spaced_bars_settings"],
+                                                                             collect=collect))
         if dimensions:
             # Dimensions are drawn at concrete shape.
             pass
 
+        if not collect:
+            return {"count": count_entities(concrete_dict, spaced_bars_dict)}
+
         # Setting groups of elements in dictionary.
         elements["concrete_elements"] = concrete_dict
         elements["spaced_bars_elements"] = spaced_bars_dict
-        elements["all_elements"] = (elements["concrete_elements"]["all_elements"] +
+        elements["all_elements"] = ((concrete_dict["all_elements"] if concrete_dict else []) +
                                     list(chain(
                                         *[sp_dict["all_elements"] for sp_dict in elements["spaced_bars_elements"]])))
 
@@ -682,7 +783,8 @@ class Slab:
                                           x: float = None,
                                           y: float = None,
                                           unifilar: bool = False,
-                                          settings: dict = SLAB_SET_LONG_REBBAR) -> dict:
+                                          settings: dict = SLAB_SET_LONG_REBBAR,
+                                          collect: bool = True) -> dict:
         """
         Draws a detailed longitudinal reinforcement schedule for the slab.
 
@@ -702,6 +804,8 @@ class Slab:
         :type unifilar: bool
         :param settings: Dictionary containing configuration for text height, spacing, and bar styling.
         :type settings: dict
+        :param collect: If False, the entities are not grouped and only their number is returned ({"count": n}).
+        :type collect: bool
 
         :return: Dictionary containing grouped DXF elements:
             - "text_elements": DXF elements related to text labels.
@@ -731,7 +835,8 @@ class Slab:
                                                                       x=x,
                                                                       y=y - rebbar_y,
                                                                       unifilar=unifilar,
-                                                                      settings=settings["bar_settings"]))
+                                                                      settings=settings["bar_settings"],
+                                                                      collect=collect))
                 rebbar_y += sp_bar.bars[0].box_height + settings["spacing"]
 
         if self.bars_as_sup_y:
@@ -746,7 +851,8 @@ class Slab:
                                                                       x=x,
                                                                       y=y - rebbar_y,
                                                                       unifilar=unifilar,
-                                                                      settings=settings["bar_settings"]))
+                                                                      settings=settings["bar_settings"],
+                                                                      collect=collect))
                 rebbar_y += sp_bar.bars[0].box_height + settings["spacing"]
 
         if self.bars_as_inf_x:
@@ -761,7 +867,8 @@ class Slab:
                                                                       x=x,
                                                                       y=y - rebbar_y,
                                                                       unifilar=unifilar,
-                                                                      settings=settings["bar_settings"]))
+                                                                      settings=settings["bar_settings"],
+                                                                      collect=collect))
                 rebbar_y += sp_bar.bars[0].box_height + settings["spacing"]
 
         if self.bars_as_inf_y:
@@ -776,10 +883,14 @@ class Slab:
                                                                       x=x,
                                                                       y=y - rebbar_y,
                                                                       unifilar=unifilar,
-                                                                      settings=settings["bar_settings"]))
+                                                                      settings=settings["bar_settings"],
+                                                                      collect=collect))
 
                 rebbar_y += sp_bar.bars[0].box_height + settings["spacing"]
 
+        if not collect:
+            return {"count": count_entities(text_elements, bars_elements)}
+
         # Setting groups of elements in dictionary.
         elements["bars_elements"] = bars_elements
         elements["text_elements"] = text_elements
@@ -795,7 +906,9 @@ class Slab:
     def draw_table_rebar_detailing(self,
                                    document: Drawing,
                                    x: float = None,
-                                   y: float = None) -> dict:
+                                   y: float = None,
+                                   page_rows: int = None,
+                                   collect: bool = True) -> dict:
         """
         Draws a reinforcement detailing table for the slab.
 
@@ -810,19 +923,31 @@ class Slab:
         :type x: float, optional
         :param y: Y-coordinate of the bottom-left corner of the table. If not specified, defaults to the slab's own y.
         :type y: float, optional
+        :param page_rows: If given, the rows are streamed from `iter_data` and drawn in pages of `page_rows` rows
+                          placed side by side (see `CADTable.draw_pages`).
+        :type page_rows: int, optional
+        :param collect: If False, the entities are not grouped and only their number is returned ({"count": n}).
+        :type collect: bool
 
         :return: Dictionary containing the generated DXF elements of the table.
         :rtype: dict
         """
+        labels = ["POSITION", "DIAMETER", "SPACING", "QUANTITY", "LENGTH", "TOTAL LENGTH", "WEIGHT"]
+
+        # Drawing table in pages, rows are streamed from the data iterator.
+        if page_rows:
+            table = CADTable(rows=0, columns=len(labels), labels=labels)
+            return table.draw_pages(document=document, rows=self.iter_data(), x=x, y=y, page_rows=page_rows,
+                                    collect=collect)
+
         # Getting data.
         data = self.extract_data()
 
         # Creating table.
-        table = CADTable(data=data, labels=["POSITION", "DIAMETER", "SPACING", "QUANTITY", "LENGTH", "TOTAL LENGTH",
-                                            "WEIGHT"])
+        table = CADTable(data=data, labels=labels)
 
         # Drawing table.
-        elements = table.draw_table(document=document, x=x, y=y)
+        elements = table.draw_table(document=document, x=x, y=y, collect=collect)
 
         return elements
 
@@ -840,19 +965,24 @@ class Slab:
                  [POSITION, DIAMETER, SPACING, QUANTITY, LENGTH, TOTAL LENGTH, WEIGHT]
         :rtype: list
         """
-        data = []
-        for element in self.all_bars:
-            position = element.position
-            diameter = element.diameter
+        return list(self.iter_data())
+
+    def iter_data(self) -> Iterator[list]:
+        """
+        Yields the rows of `extract_data` one at a time, so long tables can be drawn without building every row first.
+        Rows are taken from the position registry, one per bar position.
+
+        :return: Iterator over the rows [POSITION, DIAMETER, SPACING, QUANTITY, LENGTH, TOTAL LENGTH, WEIGHT].
+        :rtype: Iterator[list]
+        """
+        for position, entry in self.position_registry.items():
+            element = entry["bar"]
             spacing = "{0}".format(element.spacing)
-            quantity = element.quantity
             length = "{0:.2f}".format(float(element.length))
-            total_length = "{0:.2f}".format(element.quantity * element.length)
-            weight = "{0:.2f}".format(element.weight)
+            total_length = "{0:.2f}".format(entry["length"])
+            weight = "{0:.2f}".format(entry["weight"])
 
-            data.append([position, diameter, spacing, quantity, length, total_length, weight])
-
-        return data
+            yield [position, element.diameter, spacing, entry["quantity"], length, total_length, weight]
 
     def __asign_bar_vars(self,
                          as_db: list,
@@ -908,11 +1038,63 @@ class Slab:
 
         return as_db, max_db, as_anchor, number_init_as, as_bend_length, as_bend_angle
 
-    # TODO: Escribir función elements_section y refactorizar funciones de transversal acordemente.
     def __elements_section(self,
-                           elements: list,
-                           x: float) -> list:
-        pass
+                           elements: list = None,
+                           section: float = None,
+                           axe_section: str = "x") -> list:
+        """
+        Filters and returns the spaced bars that are located within the specified section of the slab.
+
+        :param elements: List of spaced bars to filter. Defaults to all the spaced bars of the slab.
+        :type elements: list, optional
+        :param section: Coordinate of the section along the section axis, relative to the slab origin. If None,
+                        defaults to the middle of the slab.
+        :type section: float, optional
+        :param axe_section: Section axis ("x" or "y").
+        :type axe_section: str
+
+        :return: List of spaced bars located within the specified section.
+        :rtype: list
+        """
+        if elements is None:
+            elements = self.all_elements
+
+        origin, length = self.x, self.length_x
+        if axe_section == Axes.Y.value:
+            origin, length = self.y, self.length_y
+
+        if section is None:
+            section = length / 2  # Default value if is nothing entered.
+
+        # Filtering elements by section coordinate.
+        return self.__section_index(elements=elements, axe_section=axe_section).query(origin + section)
+
+    def __section_index(self,
+                        elements: list,
+                        axe_section: str = "x") -> IntervalIndex:
+        """
+        Returns the interval index of the spaced bars given over their span along the section axis, building it if
+        the group has no index yet or if it has changed since the index was built.
+
+        :param elements: List of spaced bars.
+        :type elements: list
+        :param axe_section: Section axis ("x" or "y").
+        :type axe_section: str
+
+        :return: Interval index of the spaced bars.
+        :rtype: IntervalIndex
+        """
+        key = (id(elements), axe_section)
+        index = self._section_indexes.get(key)
+        if index is None or index.items is not elements or len(index) != len(elements):
+            if axe_section == Axes.Y.value:
+                spans = [(sp_bar.y, sp_bar.y + sp_bar.box_height) for sp_bar in elements]
+            else:
+                spans = [(sp_bar.x, sp_bar.x + sp_bar.box_width) for sp_bar in elements]
+            index = IntervalIndex(items=elements, spans=spans)
+            self._section_indexes[key] = index
+
+        return index
 
     def __gen_bars(self,
                    as_db: list,
@@ -4,17 +4,65 @@ import math
 # Imports.
 # Local imports.
 from etacad.bar import Bar
+from etacad.converters import to_interned
 from etacad.drawing_utils import *
 from etacad.globals import (Direction, ElementTypes, Orientation, ROUND_ERROR_TOLERANCE, STEEL_WEIGHT,
                             SPACEDBARS_SET_LONG, SAPCEDBARS_SET_TRANSVERSE)
 
 # External imports.
-from attrs import define, field
+import numpy as np
+from attrs import define, evolve, field
+from collections.abc import Sequence
 from ezdxf.document import Drawing
-from itertools import chain
+from itertools import chain, islice
 from math import cos, sin, pi
 
 
+@define
+class BarSequence(Sequence):
+    """
+    Lazy sequence of the bars of a spaced bars element. Each bar is built on demand from the prototype and its index.
+    Bars accessed by index are kept, so the same bar is returned on every access and changes made to it persist. Bars
+    reached by iteration are built without being kept (unless already kept), so walking the sequence does not keep
+    every bar in memory.
+
+    :param prototype: First bar of the sequence.
+    :type prototype: Bar
+    :param spacing: Spacing between bars, along Y axis.
+    :type spacing: float
+    :param quantity: Number of bars of the sequence.
+    :type quantity: int
+    """
+    prototype: Bar
+    spacing: float
+    quantity: int
+    _bars: dict = field(factory=dict, init=False, repr=False, eq=False)
+
+    def __len__(self) -> int:
+        return self.quantity
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.quantity))]
+
+        if index < 0:
+            index += self.quantity
+        if not 0 <= index < self.quantity:
+            raise IndexError("Bar index out of range.")
+
+        if index not in self._bars:
+            self._bars[index] = self._build(index=index)
+
+        return self._bars[index]
+
+    def __iter__(self):
+        for index in range(self.quantity):
+            yield self._bars[index] if index in self._bars else self._build(index=index)
+
+    def _build(self, index: int) -> Bar:
+        return evolve(self.prototype, y=self.prototype.y + index * self.spacing)
+
+
 @define
 class SpacedBars:
     # Spaced bars attributes.
@@ -31,7 +79,7 @@ class SpacedBars:
     quantity: int = field(init=False)
 
     # Bar elements attribute.
-    bars: list[Bar] = field(init=False)
+    bars: BarSequence = field(init=False)
 
     # Bar anchor attributes.
     left_anchor: float = field(default=0)
@@ -57,8 +105,8 @@ class SpacedBars:
 
     # Others.
     element_type: ElementTypes = field(default=ElementTypes.SPACED_BARS)
-    description: str = field(default=None)
-    position: str = field(default=None)
+    description: str = field(default=None, converter=to_interned)
+    position: str = field(default=None, converter=to_interned)
 
     def __attrs_post_init__(self):
         # Others.
@@ -76,27 +124,27 @@ class SpacedBars:
             self.mandrel_radius_ext += self.mandrel_radius
 
         # Bar element attribute.
-        self.bars = []
-        for i in range(self.quantity):
-            self.bars.append(Bar(reinforcement_length=self.length,
-                                 diameter=self.diameter,
-                                 x=0,
-                                 y=i * self.spacing,
-                                 direction=Direction.HORIZONTAL,
-                                 orientation=self.orientation,
-                                 left_anchor=self.left_anchor,
-                                 right_anchor=self.right_anchor,
-                                 mandrel_radius=self.mandrel_radius,
-                                 bend_longitud=self.bend_longitud,
-                                 bend_angle=self.bend_angle,
-                                 bend_height=self.bend_height,
-                                 element_type=ElementTypes.BAR,
-                                 denomination=self.description,
-                                 position=self.position))
+        self.bars = BarSequence(prototype=Bar(reinforcement_length=self.length,
+                                              diameter=self.diameter,
+                                              x=0,
+                                              y=0,
+                                              direction=Direction.HORIZONTAL,
+                                              orientation=self.orientation,
+                                              left_anchor=self.left_anchor,
+                                              right_anchor=self.right_anchor,
+                                              mandrel_radius=self.mandrel_radius,
+                                              bend_longitud=self.bend_longitud,
+                                              bend_angle=self.bend_angle,
+                                              bend_height=self.bend_height,
+                                              element_type=ElementTypes.BAR,
+                                              denomination=self.description,
+                                              position=self.position),
+                                spacing=self.spacing,
+                                quantity=self.quantity)
 
         # Boxing attributes.
-        self._box_width = self.bars[0].box_width
-        self._box_height = (self.quantity - 1) * self.spacing + self.bars[0].box_height
+        self._box_width = self.bars.prototype.box_width
+        self._box_height = (self.quantity - 1) * self.spacing + self.bars.prototype.box_height
         self._box_width_transverse = self.diameter
         self._box_height_transverse = (self.quantity - 1) * self.spacing + self.diameter
         self._remanent_distance = self.reinforcement_length - (self.quantity - 1) * self.spacing
@@ -136,7 +184,11 @@ class SpacedBars:
                           one_bar: bool = False,
                           one_bar_position: int = None,
                           other_extreme: bool = False,
-                          settings: dict = SPACEDBARS_SET_LONG) -> dict:
+                          settings: dict = SPACEDBARS_SET_LONG,
+                          cache: bool = False,
+                          as_blocks: bool = False,
+                          batch: bool = False,
+                          collect: bool = True) -> dict:
         if x is None:
             x = self.x
         if y is None:
@@ -162,24 +214,58 @@ class SpacedBars:
         bar_dict = []
         dimension_elements = []
 
-        for i, bar in enumerate(self.bars):
-            if not one_bar or i == one_bar_position:
-                bar_dict.append(bar.draw_longitudinal(document=document,
-                                                      x=x + bar.x,
-                                                      y=y + bar.y,
+        # Entities are needed to orient vertical spaced bars.
+        oriented = self.direction == Direction.VERTICAL
+        bar_collect = collect or oriented
+
+        if batch and not as_blocks:
+            bar_dict = self.__draw_longitudinal_batch(document=document,
+                                                      x=x,
+                                                      y=y,
                                                       unifilar=unifilar,
-                                                      dimensions=False,
-                                                      denomination=description and i == description_position,
-                                                      settings=settings))
-            if dimensions:
-                if bar_dimension and i == bar_dimension_position:
-                    dimension_elements += text(document=document,
-                                               text=f"Ø{self.diameter}/ {self.spacing}m",
-                                               height=settings["text_dim_height"],
-                                               point=(x + bar.x + bar.box_width / 2,
-                                                      y + bar.y + settings["text_dim_distance_vertical"]),
-                                               rotation=0,
-                                               attr={"halign": 4, "valign": 0})
+                                                      description=description,
+                                                      description_position=description_position,
+                                                      one_bar=one_bar,
+                                                      one_bar_position=one_bar_position,
+                                                      settings=settings,
+                                                      collect=bar_collect)
+        else:
+            # Only the bar drawn is built with one_bar.
+            indexed_bars = enumerate(self.bars)
+            if one_bar:
+                indexed_bars = [(one_bar_position, self.bars[one_bar_position])] if (
+                        0 <= one_bar_position < self.quantity) else []
+            for i, bar in indexed_bars:
+                bar_denomination = description and i == description_position
+                if as_blocks:
+                    bar_dict.append(bar.draw_longitudinal_block(document=document,
+                                                                x=x + bar.x,
+                                                                y=y + bar.y,
+                                                                unifilar=unifilar,
+                                                                dimensions=False,
+                                                                denomination=bar_denomination,
+                                                                settings=settings,
+                                                                collect=bar_collect))
+                else:
+                    bar_dict.append(bar.draw_longitudinal(document=document,
+                                                          x=x + bar.x,
+                                                          y=y + bar.y,
+                                                          unifilar=unifilar,
+                                                          dimensions=False,
+                                                          denomination=bar_denomination,
+                                                          settings=settings,
+                                                          cache=cache,
+                                                          collect=bar_collect))
+
+        if dimensions and bar_dimension and 0 <= bar_dimension_position < self.quantity:
+            bar = self.bars[bar_dimension_position]
+            dimension_elements += text(document=document,
+                                       text=f"Ø{self.diameter}/ {self.spacing}m",
+                                       height=settings["text_dim_height"],
+                                       point=(x + bar.x + bar.box_width / 2,
+                                              y + bar.y + settings["text_dim_distance_vertical"]),
+                                       rotation=0,
+                                       attr={"halign": 4, "valign": 0})
 
         if dimensions and reinforcement_dimensions:
             dim_x = x + self.bars[0].x
@@ -203,17 +289,23 @@ class SpacedBars:
                                              rotation=90,
                                              dimstyle=settings["dim_style"])
 
+        # Orienting elements.
+        all_elements = []
+        if bar_collect:
+            all_elements = list(chain(*[bar["all_elements"] for bar in bar_dict])) + dimension_elements
+            self.__direc_orient(group=all_elements,
+                                x=x,
+                                y=y,
+                                unifilar=unifilar,
+                                other_extreme=other_extreme)
+
+        if not collect:
+            return {"count": count_entities(bar_dict, dimension_elements)}
+
         # Setting groups of elements in dictionary.
         elements["bar_elements"] = bar_dict
         elements["dimension_elements"] = dimension_elements
-        elements["all_elements"] = (list(chain(*[bar["all_elements"] for bar in bar_dict])) +
-                                    elements["dimension_elements"])
-
-        self.__direc_orient(group=elements["all_elements"],
-                            x=x,
-                            y=y,
-                            unifilar=unifilar,
-                            other_extreme=other_extreme)
+        elements["all_elements"] = all_elements
 
         return elements
 
@@ -227,7 +319,9 @@ class SpacedBars:
                         bar_displacements: dict = None,
                         rotate_angle: float = None,
                         other_extreme: bool = False,
-                        settings: dict = SAPCEDBARS_SET_TRANSVERSE) -> dict:
+                        settings: dict = SAPCEDBARS_SET_TRANSVERSE,
+                        batch: bool = False,
+                        collect: bool = True) -> dict:
         if x is None:
             x = self.x
 
@@ -261,15 +355,36 @@ class SpacedBars:
         descriptions_elements = []
         dimensions_elements = []
 
+        # Entities are needed to orient vertical or rotated spaced bars.
+        oriented = self.direction == Direction.VERTICAL or bool(rotate_angle)
+        bar_collect = collect or oriented
+
         # Drawing of circles.
-        for i, bar in enumerate(self.bars):
-            x_displacement, y_displacement = (0, 0)
-            if i in bar_displacements:
-                x_displacement, y_displacement = bar_displacements[i]
-            bar_dict.append(bar.draw_transverse(document=document,
-                                                x=x + x_displacement,
-                                                y=y + self.spacing * i + y_displacement,
-                                                settings=settings))
+        if batch:
+            indexes = np.arange(self.quantity)
+            displacements = np.zeros((self.quantity, 2))
+            for i, displacement in bar_displacements.items():
+                if 0 <= i < self.quantity:
+                    displacements[i] = displacement
+
+            center_points = (np.column_stack((np.full(self.quantity, x), y + self.spacing * indexes)) +
+                             displacements + self.radius)
+            circle_elements = circles(doc=document, center_points=center_points, radius=self.radius)
+            if bar_collect:
+                for circle_element in circle_elements:
+                    bar_dict.append({"steel_elements": [circle_element], "all_elements": [circle_element]})
+            else:
+                bar_dict.append({"count": len(circle_elements)})
+        else:
+            for i, bar in enumerate(self.bars):
+                x_displacement, y_displacement = (0, 0)
+                if i in bar_displacements:
+                    x_displacement, y_displacement = bar_displacements[i]
+                bar_dict.append(bar.draw_transverse(document=document,
+                                                    x=x + x_displacement,
+                                                    y=y + self.spacing * i + y_displacement,
+                                                    settings=settings,
+                                                    collect=bar_collect))
 
         # Drawing dimensions.
         if dimensions:
@@ -284,8 +399,20 @@ class SpacedBars:
             description_text = f"Ø{self.diameter}/ {self.spacing}m."
 
             p2 = None
-            for i, bar in enumerate(self.bars):
-                if description_start <= i < description_start + 3:
+            if batch:
+                indexes = np.arange(self.quantity)
+                indexes = indexes[(description_start <= indexes) & (indexes < description_start + 3)]
+                if len(indexes):
+                    p2 = (x + settings["text_description_distance_horizontal"],
+                          y + indexes[0] * self.spacing + settings["text_description_distance_vertical"])
+                    start_points = np.column_stack((np.full(len(indexes), x + self.radius),
+                                                    y + indexes * self.spacing + self.radius))
+                    descriptions_elements += lines(doc=document,
+                                                   start_points=start_points,
+                                                   end_points=np.tile(p2, (len(indexes), 1)))
+            else:
+                start = max(math.ceil(description_start), 0)
+                for bar in islice(self.bars, start, max(math.ceil(description_start + 3), start)):
                     p1 = (x + bar.x + bar.radius, y + bar.y + bar.radius)
                     if p2 is None:
                         p2 = (x + bar.x + settings["text_description_distance_horizontal"],
@@ -300,21 +427,27 @@ class SpacedBars:
                                           point=p2,
                                           rotation=90)
 
+        # Orienting elements.
+        all_elements = []
+        if bar_collect:
+            all_elements = (list(chain(*[bar["all_elements"] for bar in bar_dict])) +
+                            descriptions_elements +
+                            dimensions_elements)
+            self.__direc_orient(group=all_elements,
+                                x=x,
+                                y=y,
+                                rotate_angle=rads(rotate_angle),
+                                other_extreme=other_extreme,
+                                transverse=True)
+
+        if not collect:
+            return {"count": count_entities(bar_dict, descriptions_elements, dimensions_elements)}
+
         # Setting groups of elements in dictionary.
         elements["bar_elements"] = bar_dict
         elements["description_elements"] = descriptions_elements
         elements["dimension_elements"] = dimensions_elements
-        elements["all_elements"] = (list(chain(*[bar["all_elements"] for bar in elements["bar_elements"]])) +
-                                    elements["description_elements"] +
-                                    elements["dimension_elements"])
-
-        # Orienting elements.
-        self.__direc_orient(group=elements["all_elements"],
-                            x=x,
-                            y=y,
-                            rotate_angle=rads(rotate_angle),
-                            other_extreme=other_extreme,
-                            transverse=True)
+        elements["all_elements"] = all_elements
 
         return elements
 
@@ -360,6 +493,81 @@ class SpacedBars:
 
         return data_required
 
+    def __draw_longitudinal_batch(self,
+                                  document: Drawing,
+                                  x: float,
+                                  y: float,
+                                  unifilar: bool,
+                                  description: bool,
+                                  description_position: int,
+                                  one_bar: bool,
+                                  one_bar_position: int,
+                                  settings: dict,
+                                  collect: bool = True) -> list:
+        """
+        Draws the longitudinal view of the bars in bulk. The prototype bar is drawn once at the origin, and the
+        coordinates of the entities of all the bars are computed at once as arrays.
+
+        :param document: The DXF document to draw on.
+        :type document: Drawing
+        :param x: X coordinate of the first bar.
+        :type x: float
+        :param y: Y coordinate of the first bar.
+        :type y: float
+        :param unifilar: Whether to draw a unifilar representation.
+        :type unifilar: bool
+        :param description: Whether to include the description label.
+        :type description: bool
+        :param description_position: Index of the bar with the description label.
+        :type description_position: int
+        :param one_bar: Whether to draw only one bar.
+        :type one_bar: bool
+        :param one_bar_position: Index of the bar drawn when one_bar is True.
+        :type one_bar_position: int
+        :param settings: Dictionary of settings for dimensioning.
+        :type settings: dict
+        :param collect: Whether to return the entities of each bar. If False, a single dict with the number of
+            entities drawn is returned in the list.
+        :type collect: bool
+        :return: List of dicts of drawing entities, one for each bar.
+        :rtype: list
+        """
+        prototype = self.bars.prototype
+        indexes = np.array([one_bar_position]) if one_bar else np.arange(self.quantity)
+        offsets = np.column_stack((np.full(len(indexes), x + prototype.x),
+                                   y + prototype.y + indexes * self.spacing))
+
+        # Drawing of prototype bar at the origin.
+        recorder = EntityRecorder(doc=document.doc if isinstance(document, EntityRecorder) else document)
+        template = prototype.draw_longitudinal(document=recorder,
+                                               x=0,
+                                               y=0,
+                                               unifilar=unifilar,
+                                               dimensions=False,
+                                               denomination=description,
+                                               settings=settings)
+
+        bar_dict = []
+        steel_copies = array_copies(doc=document, entities=template["steel_elements"], offsets=offsets)
+        for i, (index, steel_elements) in enumerate(zip(indexes.tolist(), steel_copies)):
+            denomination_elements = []
+            if description and index == description_position:
+                denomination_elements = array_copies(doc=document,
+                                                     entities=template["denomination_elements"],
+                                                     offsets=offsets[i])[0]
+
+            if not collect:
+                bar_dict.append({"count": count_entities(steel_elements, denomination_elements)})
+                continue
+
+            bar_dict.append({"steel_elements": steel_elements,
+                             "dimension_elements": [],
+                             "denomination_elements": denomination_elements,
+                             "text_elements": denomination_elements,
+                             "all_elements": steel_elements + denomination_elements})
+
+        return bar_dict
+
     def __direc_orient(self,
                        group: list,
                        x: float = None,
@@ -416,7 +624,7 @@ class SpacedBars:
             if "DIMENSION" in group_filter:
                 for dimension in group_filter["DIMENSION"]:
                     dimension.dxf.text_rotation = dimension.dxf.angle if dimension.dxf.angle != 180 else 0
-                    dimension.render()
+                    dim_render(dimension=dimension)
 
             if "TEXT" in group_filter:
                 for text_element in group_filter["TEXT"]:
@@ -440,7 +648,7 @@ class SpacedBars:
             if "DIMENSION" in group_filter:
                 for dimension in group_filter["DIMENSION"]:
                     dimension.dxf.text_rotation = dimension.dxf.angle if dimension.dxf.angle != 180 else 0
-                    dimension.render()
+                    dim_render(dimension=dimension)
 
             if "TEXT" in group_filter:
                 for text_element in group_filter["TEXT"]:
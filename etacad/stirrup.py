@@ -2,13 +2,17 @@
 
 # Imports.
 # Local imports.
+from etacad.converters import to_interned
 from etacad.geometry.utils import get_lines_intersec
-from etacad.drawing_utils import curve, dim_linear, line, mirror, rect_border_curve, rotate, text, translate
+from etacad.drawing_utils import (EntityRecorder, count_entities, curve, dim_linear, line, lines, mirror,
+                                  rect_border_curve, rotate, text, translate)
 from etacad.globals import COS45, Direction, ElementTypes, Orientation, SIN45, STEEL_WEIGHT, STIRRUP_SET_TRANSVERSE
 
 # External imports.
+import numpy as np
 from attrs import define, field
 from ezdxf.document import Drawing
+from hashlib import sha1
 from math import cos, sin, pi, floor
 
 
@@ -87,8 +91,8 @@ class Stirrup:
 
     # Others.
     element_type: ElementTypes = field(default=ElementTypes.STIRRUP)
-    denomination: str = field(default=None)
-    position: str = field(default=None)
+    denomination: str = field(default=None, converter=to_interned)
+    position: str = field(default=None, converter=to_interned)
 
     def __attrs_post_init__(self):
         # Stirrups attributes.
@@ -110,7 +114,9 @@ class Stirrup:
                           document: Drawing,
                           x: float = None,
                           y: float = None,
-                          unifilar=True) -> dict:
+                          unifilar=True,
+                          compact: bool = False,
+                          collect: bool = True) -> dict:
         """
         Draw the longitudinal reinforcement of the stirrup in the dxf file.
 
@@ -122,6 +128,12 @@ class Stirrup:
         :type y: float
         :param unifilar: Single-line drawing.
         :type unifilar: bool
+        :param compact: Draws all the stirrups as one block array reference (MINSERT) of a single stirrup line,
+            instead of one line per stirrup.
+        :type compact: bool
+        :param collect: Returns the entities grouped. If False, only the number of entities drawn is returned
+            ({"count": n}).
+        :type collect: bool
 
         :return: None.
         :rtype: None
@@ -135,20 +147,33 @@ class Stirrup:
         elements = {}
 
         # Drawing stirrup steel bars.
-        if unifilar:
-            steel = [line(doc=document, p1=(x + self.spacing * i, y), p2=(x + self.spacing * i, y + self.height))[0]
-                     for i in range(self.quantity)]
+        if compact:
+            name = "STIRRUP_" + sha1(repr(self.height).encode()).hexdigest()[:16].upper()
+
+            # Defining block of one stirrup line.
+            doc = document.doc if isinstance(document, EntityRecorder) else document
+            if name not in doc.blocks:
+                block = doc.blocks.new(name=name)
+                block.add_line((0, 0), (0, self.height))
+
+            steel = [document.modelspace().add_blockref(name=name, insert=(x, y))]
+            steel[0].grid(size=(1, self.quantity), spacing=(self.height, self.spacing))
         else:
-            steel = [line(doc=document, p1=(x + self.spacing * i, y), p2=(x + self.spacing * i, y + self.height))[0]
-                     for i in range(self.quantity)]
+            xs = x + self.spacing * np.arange(self.quantity)
+            steel = lines(doc=document,
+                          start_points=np.column_stack((xs, np.full(self.quantity, y))),
+                          end_points=np.column_stack((xs, np.full(self.quantity, y + self.height))))
+
+        # Orienting the bar (direction and orientation).
+        self.__direc_orient(steel, x=x, y=y, longitudinal=True)
+
+        if not collect:
+            return {"count": count_entities(steel)}
 
         # Setting groups of elements in dictionary.
         elements["steel_elements"] = steel
         elements["all_elements"] = elements["steel_elements"]
 
-        # Orienting the bar (direction and orientation).
-        self.__direc_orient(elements["steel_elements"], x=x, y=y, longitudinal=True)
-
         return elements
 
     # Drawing transverse section of stirrup function.
@@ -158,7 +183,8 @@ class Stirrup:
                         y: float = None,
                         unifilar: bool = False,
                         dimensions: bool = False,
-                        settings: dict = STIRRUP_SET_TRANSVERSE) -> dict:
+                        settings: dict = STIRRUP_SET_TRANSVERSE,
+                        collect: bool = True) -> dict:
         """
         Draw the cross-section of the stirrup in the dxf file.
 
@@ -174,6 +200,9 @@ class Stirrup:
         :type dimensions: bool
         :param settings: Dictionary of settings for dimensioning. Defaults to `STIRRUP_SET_TRANSVERSE`.
         :type settings: dict, optional
+        :param collect: Returns the entities grouped. If False, only the number of entities drawn is returned
+            ({"count": n}).
+        :type collect: bool
 
         :return: None.
         :rtype: None
@@ -341,15 +370,18 @@ class Stirrup:
                                  point=(x + self.width / 2, y - settings["text_distance_length_count"]),
                                  attr={"halign": 4, "valign": 0})
 
+        # Orienting the bar (direction and orientation).
+        self.__direc_orient(steel_elements, x=x, y=y, longitudinal=False)
+
+        if not collect:
+            return {"count": count_entities(steel_elements, dim_elements)}
+
         # Setting groups of elements in dictionary.
         elements["steel_elements"] = steel_elements
         elements["dimensions_elements"] = dim_elements
         elements["all_elements"] = (elements["steel_elements"] +
                                     elements["dimensions_elements"])
 
-        # Orienting the bar (direction and orientation).
-        self.__direc_orient(elements["steel_elements"], x=x, y=y, longitudinal=False)
-
         return elements
 
     # Function that orients drawing.
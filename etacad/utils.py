@@ -2,8 +2,16 @@
 
 # Imports.
 # Local imports.
+from etacad.globals import ElementTypes
 
 # External imports.
+import numpy as np
+
+from ezdxf.fonts import fonts
+from functools import lru_cache
+
+# Glyph width tables per font, widths of every character for a text height of 1.
+_glyph_widths = {}
 
 
 def expand_dictionary(dictionary) -> list:
@@ -102,6 +110,45 @@ def gen_position_bars(dictionaries: list,
     return positions
 
 
+def gen_position_registry(elements: list) -> dict:
+    """
+    Aggregates reinforcement elements by position in a single pass, so merging thousands of positions stays linear.
+
+    Every Bar object is one bar (its quantity is the number of bars of its position), while stirrups and spaced bars
+    hold `quantity` pieces each.
+
+    :param elements: Bars, stirrups and spaced bars.
+    :type elements: list
+    :return: Dictionary mapping every position to a dictionary with:
+        - "bar": First element of the position, representative of its shape.
+        - "quantity": Number of pieces of the position.
+        - "length": Total length of the pieces.
+        - "weight": Total weight of the pieces.
+    :rtype: dict
+    """
+    registry = {}
+    for element in elements:
+        if element.element_type == ElementTypes.BAR:
+            quantity, weight = 1, element.weight
+        elif element.element_type == ElementTypes.SPACED_BARS:
+            quantity, weight = element.quantity, element.weight  # Weight of the whole set of bars.
+        else:
+            quantity, weight = element.quantity, element.quantity * element.weight
+
+        entry = registry.get(element.position)
+        if entry is None:
+            registry[element.position] = {"bar": element,
+                                          "quantity": quantity,
+                                          "length": quantity * element.length,
+                                          "weight": weight}
+        else:
+            entry["quantity"] += quantity
+            entry["length"] += quantity * element.length
+            entry["weight"] += weight
+
+    return registry
+
+
 def is_odd(number):
     """
     Checks if a number is odd.
@@ -141,12 +188,41 @@ def max_per_position(*lists):
     return [max(values) for values in zip(*lists)]
 
 
-def text_width_estimation(text: str, text_height: float, proportion: float = 1) -> float:
+def glyph_width(character: str, font: str) -> float:
+    """
+    Returns the width of a character of a font for a text height of 1. The widths are measured once with the font
+    metrics of ezdxf and kept in a table per font.
+
+    :param character: The character to measure.
+    :type character: str
+    :param font: Font file name (e.g. "arial.ttf"), ezdxf falls back to its default font when it is not found.
+    :type font: str
+    :return: The width of the character.
+    :rtype: float
+    """
+    table = _glyph_widths.setdefault(font, {})
+    if character not in table:
+        table[character] = fonts.make_font(font, 1.0).text_width(character)
+
+    return table[character]
+
+
+@lru_cache(maxsize=4096)
+def _text_width_unit(text: str, font: str = None) -> float:
+    # Width of a text for a text height and proportion of 1, repeated strings are taken from the cache.
+    if font is None:
+        return len(text)
+
+    return sum(glyph_width(character=character, font=font) for character in text)
+
+
+def text_width_estimation(text: str, text_height: float, proportion: float = 1, font: str = None) -> float:
     """
     Estimate the width of a text string based on its height.
 
     This function approximates the width of a text string by assuming each character
-    in the string occupies a width proportional to the given text height.
+    in the string occupies a width proportional to the given text height. If a font is
+    given, every character takes the width of its glyph in that font instead.
 
     :param text: The text string whose width needs to be estimated.
     :type text: str
@@ -154,19 +230,20 @@ def text_width_estimation(text: str, text_height: float, proportion: float = 1)
     :type text_height: float
     :param proportion: The proportion estimator.
     :type proportion: float
+    :param font: Font file name used to measure the glyphs. If None, every character is as wide as the text height.
+    :type font: str, optional
     :return: The estimated width of the text string.
     :rtype: float
 
     :example:
 
     >>> text_width_estimation("Hello", 10.0)
-    37.5
+    50.0
 
     . note::
        This is a simple estimation and may not be accurate for all fonts or
-       character sets. The constant `0.65` for default used for width estimation
-       is based on a typical average and might need adjustment for different fonts
-       or styles.
+       character sets. The widths of the strings are cached, so repeated texts
+       (table cells, labels) are measured once.
     """
     if not type(text) == str:
         try:
@@ -174,11 +251,33 @@ def text_width_estimation(text: str, text_height: float, proportion: float = 1)
         except TypeError:
             raise TypeError("Text must be a string, integer or float.")
 
-    text_width = 0
-    for character in text:
-        text_width += text_height * proportion
+    return _text_width_unit(text, font) * text_height * proportion
+
+
+def text_widths_estimation(texts: list[list],
+                           text_height: float,
+                           proportion: float = 1,
+                           font: str = None) -> np.ndarray:
+    """
+    Estimate the widths of a table of text strings based on their height (see `text_width_estimation`).
+
+    :param texts: Rows of text strings (or values converted to strings).
+    :type texts: list[list]
+    :param text_height: The height of the texts used for the width estimation.
+    :type text_height: float
+    :param proportion: The proportion estimator.
+    :type proportion: float
+    :param font: Font file name used to measure the glyphs. If None, every character is as wide as the text height.
+    :type font: str, optional
+    :return: Array of the estimated widths, with a row per row of texts.
+    :rtype: np.ndarray
+    """
+    if font is None:
+        widths = np.char.str_len(np.asarray(texts, dtype=str)).astype(float)
+    else:
+        widths = np.array([[_text_width_unit(str(text), font) for text in row] for row in texts], dtype=float)
 
-    return text_width
+    return widths * (text_height * proportion)
 
 
 def str_to_dict_bar(data: str) -> dict:
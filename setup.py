@@ -11,4 +11,4 @@ setup(name="etacad",
       author="Kevin Axel Tagliaferri",
       author_email='kevinaxeltagliaferri@hotmail.com',
       url="https://github.com/AxelTAG/etacad.git",
-      install_requires=["attrs", "ezdxf"])
+      install_requires=["attrs", "ezdxf", "numpy"])
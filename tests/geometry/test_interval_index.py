@@ -0,0 +1,51 @@
+# Local imports.
+from etacad.geometry import IntervalIndex
+
+# External imports.
+import pytest
+
+
+@pytest.fixture
+def interval_index():
+    return IntervalIndex(items=["a", "b", "c", "d"], spans=[(0, 4), (2, 6), (4, 4), (7, 9)])
+
+
+def test_interval_index_query(interval_index):
+    assert len(interval_index) == 4
+    assert interval_index.points == [0, 2, 4, 6, 7, 9]
+
+    # Inner points and endpoints (closed intervals).
+    assert interval_index.query(1) == ["a"]
+    assert interval_index.query(2) == ["a", "b"]
+    assert interval_index.query(4) == ["a", "b", "c"]
+    assert interval_index.query(5) == ["b"]
+    assert interval_index.query(9) == ["d"]
+
+    # Gaps and outside points.
+    assert interval_index.query(6.5) == []
+    assert interval_index.query(-1) == []
+    assert interval_index.query(10) == []
+
+
+def test_interval_index_query_matches_linear_scan():
+    spans = [(i * 0.37, i * 0.37 + (i % 5) * 0.81) for i in range(40)]
+    interval_index = IntervalIndex(items=list(range(40)), spans=spans)
+
+    for k in range(200):
+        point = k * 0.1
+        expected = [i for i, (start, end) in enumerate(spans) if start <= point <= end]
+        assert interval_index.query(point) == expected
+
+
+def test_interval_index_scaling():
+    spans = [(i * 0.01, i * 0.01 + 20 + (i % 7)) for i in range(4000)]
+    interval_index = IntervalIndex(items=list(range(4000)), spans=spans)
+
+    # Every overlapping interval stored once, not once per region it covers.
+    assert sum(len(node) for node in interval_index._by_start) == 4000
+    assert sum(len(node) for node in interval_index._by_end) == 4000
+
+    for k in range(0, 700, 7):
+        point = k * 0.1
+        expected = [i for i, (start, end) in enumerate(spans) if start <= point <= end]
+        assert interval_index.query(point) == expected
@@ -18,6 +18,46 @@ def test_polygon_clockwise_attributes(polygon_clockwise):
     assert polygon_clockwise.centroid == (1.5, 1.0)
 
 
+def test_polygon_clockwise_extreme_points(polygon_clockwise):
+    assert polygon_clockwise.top_points == [(2, 2), (3, 2)]
+    assert polygon_clockwise.right_points == [(3, 0), (3, 2)]
+    assert polygon_clockwise.bottom_points == [(0, 0), (3, 0)]
+    assert polygon_clockwise.left_points == [(0, 0), (0, 1)]
+    assert polygon_clockwise.bounding_box == (0, 0, 3, 2)
+
+
+
+def test_polygon_clockwise_get_offset_vertices(polygon_clockwise):
+    # Inwards, concave corner at (1, 1).
+    offset = polygon_clockwise.get_offset_vertices(distance=0.1)
+    expected = [(0.1, 0.1), (0.1, 0.9), (1.0414214, 0.9), (2.0414214, 1.9), (2.9, 1.9), (2.9, 0.1)]
+    assert offset == [pytest.approx(point) for point in expected]
+
+    # Outwards.
+    offset = polygon_clockwise.get_offset_vertices(distance=-0.1)
+    expected = [(-0.1, -0.1), (-0.1, 1.1), (0.9585786, 1.1), (1.9585786, 2.1), (3.1, 2.1), (3.1, -0.1)]
+    assert offset == [pytest.approx(point) for point in expected]
+
+
+def test_polygon_get_offset_vertices_collapse():
+    # T section, the web is narrower than the flange.
+    t_section = Polygon(vertices=[(0, 0.6), (0, 0.8), (1, 0.8), (1, 0.6), (0.6, 0.6), (0.6, 0), (0.4, 0), (0.4, 0.6)])
+    offset = t_section.get_offset_vertices(distance=0.03)
+    expected = [(0.03, 0.63), (0.03, 0.77), (0.97, 0.77), (0.97, 0.63), (0.57, 0.63), (0.57, 0.03), (0.43, 0.03),
+                (0.43, 0.63)]
+    assert offset == [pytest.approx(point) for point in expected]
+
+    # Small chamfer removed.
+    chamfered = Polygon(vertices=[(0, 0), (2, 0), (2, 0.95), (1.95, 1), (0, 1)])
+    offset = chamfered.get_offset_vertices(distance=0.1)
+    assert offset == [pytest.approx(point) for point in [(0.1, 0.1), (1.9, 0.1), (1.9, 0.9), (0.1, 0.9)]]
+
+    # Rectangle thinned and vanished.
+    rectangle = Polygon(vertices=[(0, 0), (2, 0), (2, 1), (0, 1)])
+    offset = rectangle.get_offset_vertices(distance=0.45)
+    assert offset == [pytest.approx(point) for point in [(0.45, 0.45), (1.55, 0.45), (1.55, 0.55), (0.45, 0.55)]]
+    assert rectangle.get_offset_vertices(distance=0.6) == []
+
 def test_polygon_clockwise_get_points_direction_of_rotation(polygon_clockwise):
     assert polygon_clockwise.get_points_direction_of_rotation() == DRotation.CLOCKWISE
 
@@ -109,3 +149,9 @@ def test_polygon_counterclockwise_get_points_between_index_limits_by_dr(polygon_
     assert ccw_list_0_4 == [(3, 0), (3, 2), (2, 2), (1, 1), (0, 1)]
 
 
+def test_polygon_counterclockwise_extreme_points(polygon_counterclockwise):
+    assert polygon_counterclockwise.get_top_point() == [(2, 2), (3, 2)]
+    assert polygon_counterclockwise.get_right_point() == [(3, 0), (3, 2)]
+    assert polygon_counterclockwise.get_bottom_point() == [(0, 0), (3, 0)]
+    assert polygon_counterclockwise.get_left_point() == [(0, 0), (0, 1)]
+    assert polygon_counterclockwise.bounding_box == (0, 0, 3, 2)
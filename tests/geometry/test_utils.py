@@ -0,0 +1,73 @@
+# Local imports.
+from etacad.geometry.utils import (get_euclidean_distance, get_euclidean_distance_array, get_line_eq,
+                                   get_line_eq_array, get_lines_intersec, get_lines_intersec_array, parallel_points,
+                                   parallel_points_array, polygon_area, polygon_area_array, scale_coordinates,
+                                   scale_coordinates_array, sort_points, sort_points_array)
+
+# External imports.
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def segments():
+    points1 = [(0, 0), (1, 1), (2, 0), (3, -1), (-1, 2)]
+    points2 = [(3, 4), (1, 5), (0, 2), (5, -1), (-3, 0)]
+    return points1, points2
+
+
+def test_get_euclidean_distance_array(segments):
+    points1, points2 = segments
+
+    distances = get_euclidean_distance_array(points1, points2)
+    assert distances.tolist() == [get_euclidean_distance(p1, p2) for p1, p2 in zip(points1, points2)]
+    assert get_euclidean_distance_array((0, 0), (3, 4)) == 5
+
+
+def test_get_line_eq_array(segments):
+    points1, points2 = segments
+
+    lines = get_line_eq_array(points1, points2)
+    assert lines.tolist() == [list(get_line_eq(*p1, *p2)) for p1, p2 in zip(points1, points2)]
+    assert get_line_eq_array(points1, points2, aprox_inf=False)[1, 0] == float("inf")
+    assert get_line_eq_array((0, 0), (1, 2)) == (2, 0)
+
+
+def test_get_lines_intersec_array():
+    intersections = get_lines_intersec_array([1, 2], [0, 1], [-1, 0], [2, 3])
+    assert intersections.tolist() == [list(get_lines_intersec(1, 0, -1, 2)), list(get_lines_intersec(2, 1, 0, 3))]
+
+    pairwise = get_lines_intersec_array([1, 2], [0, 1], [-1, 0, 3], [2, 3, 0], pairwise=True)
+    assert pairwise.shape == (2, 3, 2)
+    assert pairwise[1, 2].tolist() == list(get_lines_intersec(2, 1, 3, 0))
+    assert get_lines_intersec_array(1, 0, -1, 2) == (1, 1)
+
+
+def test_parallel_points_array(segments):
+    points1, points2 = segments
+
+    points = parallel_points_array(points1, points2, d=0.5)
+    assert points.shape == (5, 4, 2)
+    for displaced, p1, p2 in zip(points, points1, points2):
+        assert np.allclose(displaced, parallel_points(p1, p2, d=0.5))
+
+
+def test_polygon_area_array():
+    square = [(0, 0), (4, 0), (4, 3), (0, 3)]
+    hexagon = [(0.5, 1.7321), (1.5, 1.7321), (2, 0.866), (1.5, 0), (0.5, 0), (0, 0.866)]
+
+    assert polygon_area_array(square) == polygon_area(square) == 12
+    assert polygon_area_array(hexagon) == pytest.approx(polygon_area(hexagon))
+    assert polygon_area_array([square, [(0, 0), (1, 0), (1, 1), (0, 1)]]).tolist() == [12, 1]
+
+
+def test_scale_sort_points_array():
+    points = [(3, 1), (1, 2), (2, 0), (1, 1)]
+
+    assert scale_coordinates_array(points, scale_factor=2).tolist() == [list(p) for p in
+                                                                         scale_coordinates(*points, scale_factor=2)]
+    assert sort_points_array(points, axis="x").tolist() == [list(p) for p in sort_points(*points, axis="x")]
+    assert sort_points_array(points, axis="y").tolist() == [list(p) for p in sort_points(*points, axis="y")]
+
+    with pytest.raises(ValueError):
+        sort_points_array(points, axis="z")
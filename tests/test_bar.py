@@ -2,7 +2,8 @@
 
 # Local imports.
 from etacad.globals import Direction, Orientation, STEEL_WEIGHT
-from etacad.bar import Bar
+from etacad import bar as bar_module
+from etacad.bar import Bar, BarArray, clear_geometry_cache
 
 # External imports.
 import ezdxf
@@ -208,7 +209,7 @@ def test_draw_longitudinal_bar_straight_vertical(bar_straight_vertical):
 
     ex_05 = bar_straight_vertical.draw_longitudinal(document=doc, x=2, y=1, unifilar=True)
     assert len(ex_05["all_elements"]) == 3
-    assert ex_05["steel_elements"][0].dxf.start == Vec3(1.9999999999999998, 1, 0)  # Top side start.
+    assert ex_05["steel_elements"][0].dxf.start == Vec3(2, 1, 0)  # Top side start.
     assert ex_05["steel_elements"][0].dxf.end == Vec3(2.000000000000001, 13, 0)  # Top side end.
 
     # General.
@@ -406,6 +407,17 @@ def test_draw_longitudinal_horizontal_lab_top(bar_horizontal_lab_top):
     doc.saveas("./tests/bar_horizontal_lab_top_draw_longitudinal.dxf")
 
 
+def test_draw_longitudinal_horizontal_lab_top_texts(bar_horizontal_lab_top):
+    doc = ezdxf.new(setup=True)
+
+    ex_01 = bar_horizontal_lab_top.draw_longitudinal(document=doc, x=5, y=5, unifilar=False)
+    assert len(ex_01["text_elements"]) == 3
+    assert ex_01["text_elements"][0].get_placement()[1].isclose(Vec3(4.95, 5.095, 0))  # Anchor left dimension.
+    assert ex_01["text_elements"][1].get_placement()[1].isclose(Vec3(7, 4.95, 0))  # Body dimension.
+    assert ex_01["text_elements"][2].get_placement()[1].isclose(Vec3(7, 5.05, 0))  # Denomination.
+    assert all(entitie.dxf.extrusion == Vec3(0, 0, 1) for entitie in ex_01["text_elements"])
+
+
 @pytest.fixture
 def bar_horizontal_rab_top():
     return Bar(reinforcement_length=4,
@@ -453,3 +465,111 @@ def test_draw_longitudinal_horizontal_rab_top(bar_horizontal_rab_top):
 @pytest.fixture
 def bar_straight_horizontal_lab_rab():
     pass
+
+
+def test_draw_longitudinal_cache(bar_horizontal_lab_top):
+    doc = ezdxf.new(setup=True)
+    clear_geometry_cache()
+
+    ex_01 = bar_horizontal_lab_top.draw_longitudinal(document=doc, x=5, y=5)
+    ex_02 = bar_horizontal_lab_top.draw_longitudinal(document=doc, x=5, y=5, cache=True)
+    ex_03 = bar_horizontal_lab_top.draw_longitudinal(document=doc, x=10, y=5, cache=True)
+
+    assert len(ex_02["all_elements"]) == len(ex_01["all_elements"])
+    for entitie_01, entitie_02 in zip(ex_01["all_elements"], ex_02["all_elements"]):
+        assert entitie_01.dxftype() == entitie_02.dxftype()
+        if entitie_01.dxftype() == "LINE":
+            assert entitie_01.dxf.start.isclose(entitie_02.dxf.start)
+            assert entitie_01.dxf.end.isclose(entitie_02.dxf.end)
+    for entitie_01, entitie_02 in zip(ex_01["text_elements"], ex_02["text_elements"]):
+        assert entitie_01.get_placement()[1].isclose(entitie_02.get_placement()[1])
+
+    # Same shape, the cached drawing is translated.
+    assert ex_03["steel_elements"][6].dxf.start.isclose(Vec3(10.02, 5.01, 0))  # Body top start.
+    assert ex_03["steel_elements"][6].dxf.end.isclose(Vec3(14, 5.01, 0))  # Body top end.
+    assert ex_03["steel_elements"][0] is not ex_02["steel_elements"][0]
+    assert len(doc.modelspace()) == len(ex_01["all_elements"]) * 3
+
+
+def test_draw_longitudinal_cache_size(bar_straight_horizontal, bar_straight_vertical, bar_horizontal_lab_top,
+                                      monkeypatch):
+    monkeypatch.setattr(bar_module, "_GEOMETRY_CACHE_SIZE", 2)
+    doc = ezdxf.new(setup=True)
+    clear_geometry_cache()
+
+    # Least recently used shape discarded beyond the cache size.
+    bar_straight_horizontal.draw_longitudinal(document=doc, cache=True)
+    bar_straight_vertical.draw_longitudinal(document=doc, cache=True)
+    assert len(bar_module._geometry_cache) == 2
+    bar_straight_horizontal.draw_longitudinal(document=doc, cache=True)
+    key = next(reversed(bar_module._geometry_cache))
+    bar_horizontal_lab_top.draw_longitudinal(document=doc, cache=True)
+    assert len(bar_module._geometry_cache) == 2
+    assert [*bar_module._geometry_cache][0] == key
+
+
+def test_draw_longitudinal_collect(bar_straight_vertical, bar_horizontal_lab_top):
+    doc = ezdxf.new(setup=True)
+
+    ex_01 = bar_straight_vertical.draw_longitudinal(document=doc, x=0, y=1, collect=False)
+    ex_02 = bar_horizontal_lab_top.draw_longitudinal(document=doc, x=5, y=5, collect=False)
+    ex_03 = bar_horizontal_lab_top.draw_longitudinal(document=doc, x=10, y=5, cache=True, collect=False)
+
+    # Same entities drawn (oriented ones too), only their number returned.
+    assert ex_01 == {"count": 6}
+    assert ex_02 == ex_03 == {"count": len(bar_horizontal_lab_top.draw_longitudinal(document=doc)["all_elements"])}
+    assert len(doc.modelspace()) == 6 + ex_02["count"] * 3
+    assert doc.modelspace()[0].dxf.end.isclose(Vec3(0, 13, 0))
+
+
+def test_bar_array(bar_straight_horizontal, bar_horizontal_lab_top):
+    bars = [bar_straight_horizontal, bar_horizontal_lab_top,
+            Bar(reinforcement_length=4, diameter=0.016, bend_angle=45, bend_height=0.3, position="#1", quantity=2)]
+    bar_array = BarArray.from_bars(bars)
+
+    # Bars built on demand, equal to the bars stored.
+    assert len(bar_array) == 3
+    assert [bar_array[i] for i in range(3)] == bars
+    assert bar_array[-1] == bars[-1]
+    assert bar_array[1:] == bars[1:]
+    with pytest.raises(IndexError):
+        bar_array[3]
+
+    # Derived values of all the bars at once.
+    assert bar_array.length.tolist() == pytest.approx([bar.length for bar in bars])
+    assert bar_array.weight.tolist() == pytest.approx([bar.weight for bar in bars])
+
+
+def test_bar_interned_labels():
+    bars = [Bar(reinforcement_length=4, diameter=0.016, denomination="#{0} 2Ø16".format(1), position="#{0}".format(1))
+            for _ in range(2)]
+
+    # Labels repeated by many bars share a single string.
+    assert bars[0].denomination is bars[1].denomination
+    assert bars[0].position is bars[1].position
+
+    # Labels other than strings kept as given.
+    bar = Bar(reinforcement_length=4, diameter=0.016, denomination=Direction.HORIZONTAL, position=7)
+    assert bar.denomination is Direction.HORIZONTAL
+    assert bar.position == 7 and isinstance(bar.position, int)
+
+
+def test_derived_attributes():
+    bar = Bar(reinforcement_length=4, diameter=0.016, left_anchor=0.2, bend_angle=45, bend_height=0.3)
+    length = bar.length
+
+    # Derived attributes computed on access, equal to the eager formulas.
+    assert bar.bending_proyection == pytest.approx(0.3)
+    assert length == pytest.approx(4 + (2 ** 0.5 - 1) * 0.3 * 2 + 0.2)
+    assert bar.box_height == pytest.approx(max(0.016 + 0.2, 0.016 * 2 + 0.3))
+    assert bar.weight == pytest.approx(0.016 ** 2 * pi / 4 * length * STEEL_WEIGHT)
+
+    # Recomputed after changing a defining attribute.
+    bar.reinforcement_length = 5
+    assert bar.length == pytest.approx(length + 1)
+    assert bar.weight == pytest.approx(0.016 ** 2 * pi / 4 * (length + 1) * STEEL_WEIGHT)
+    bar.bend_angle = 0
+    assert bar.bending_proyection == 0
+    assert bar.length == pytest.approx(5.2)
+    bar.left_anchor = 0
+    assert bar.box_height == pytest.approx(0.016 * 2 + 0.3)
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 
 # Local imports.
-from etacad.globals import Direction, Orientation
+from etacad.globals import Direction, ElementTypes, Orientation
 from etacad.beam import Beam
 
 # External imports.
@@ -142,6 +142,27 @@ def test_draw_longitudinal_beam(beam):
     doc.saveas(filename="./tests/beam_longitudinal.dxf")
 
 
+def test_draw_longitudinal_beam_compact_stirrups(beam):
+    doc = ezdxf.new(dxfversion="R2010", setup=True)
+
+    ex_01 = beam.draw_longitudinal(document=doc, x=2, y=3, unifilar_bars=False)
+    ex_02 = beam.draw_longitudinal(document=doc, x=2, y=3, unifilar_bars=False, compact_stirrups=True)
+
+    # Stirrups, one block array reference per stirrup zone.
+    stirrups = ex_02["stirrups"][0]["steel_elements"]
+    assert len(stirrups) == 1
+    assert stirrups[0].dxftype() == "INSERT"
+    assert stirrups[0].dxf.column_count == 35
+    assert stirrups[0].dxf.column_spacing == beam.stirrups[0].spacing
+
+    # Same stirrup lines.
+    exploded = [entitie for insert in stirrups[0].multi_insert() for entitie in insert.virtual_entities()]
+    assert len(exploded) == len(ex_01["stirrups"][0]["steel_elements"])
+    for line_01, line_02 in zip(ex_01["stirrups"][0]["steel_elements"], exploded):
+        assert line_01.dxf.start.isclose(line_02.dxf.start)
+        assert line_01.dxf.end.isclose(line_02.dxf.end)
+
+
 def test_draw_transverse_beam(beam):
     doc = ezdxf.new(dxfversion="R2010", setup=True)
 
@@ -210,6 +231,31 @@ def test_draw_transverse_rebar_detailing_beam(beam):
     assert len(entities["all_elements"]) == 26
 
 
+def test_position_registry_beam(beam):
+    # A representative bar and the totals of every position, in the order of the elements.
+    assert [*beam.position_registry] == ["@7", "@8", "@9", "@10", "@S1"]
+    entry = beam.position_registry["@7"]
+    assert entry["bar"] is beam.bars_as_sup[0]
+    assert entry["quantity"] == 3
+    assert entry["length"] == pytest.approx(3 * beam.bars_as_sup[0].length)
+    assert entry["weight"] == pytest.approx(3 * beam.bars_as_sup[0].weight)
+    stirrup = beam.stirrups[0]
+    assert beam.position_registry["@S1"]["quantity"] == sum(stirrup.quantity for stirrup in beam.stirrups)
+    assert beam.position_registry["@S1"]["bar"] is stirrup
+
+
+def test_position_registry_beam_relabeled(beam):
+    # Bars relabeled after construction are drawn once per position, the registry is rebuilt on demand.
+    beam.bars_as_sup[0].position = "@70"
+    entities = beam.draw_longitudinal_rebar_detailing(document=ezdxf.new(), x=-10, y=1, unifilar=False)
+    assert len(entities["bars"]) == 5
+    assert "@70" not in beam.position_registry
+
+    beam.clear_section_index()
+    assert beam.position_registry["@70"]["quantity"] == 1
+    assert beam.position_registry["@7"]["quantity"] == 2
+
+
 def test_draw_table_rebar_detailing_beam(beam):
     doc = ezdxf.new(dxfversion="R2010", setup=True)
     entities = beam.draw_table_rebar_detailing(document=doc, x=-20, y=-5)
@@ -217,3 +263,31 @@ def test_draw_table_rebar_detailing_beam(beam):
 
     # General.
     assert len(entities["all_elements"]) == 66
+
+
+def test_draw_transverse_beam_section_index(beam):
+    doc = ezdxf.new(dxfversion="R2010", setup=True)
+
+    # Section elements, same result than the linear scan over the elements.
+    for x_section in (0, 0.1, 1.5, 3, 5.9, 6):
+        entities = beam.draw_transverse(document=doc, x_section=x_section)
+        expected = [element for element in beam.all_elements
+                    if element.x <= beam.x + x_section <= element.x + element.reinforcement_length]
+        assert len(entities["bars"]) == len([e for e in expected if e.element_type == ElementTypes.BAR])
+        assert len(entities["stirrups"]) == len([e for e in expected if e.element_type == ElementTypes.STIRRUP])
+
+    # Index rebuilt when the elements change.
+    beam.all_elements = beam.stirrups
+    entities = beam.draw_transverse(document=doc, x_section=3)
+    assert len(entities["bars"]) == 0
+
+
+def test_draw_table_rebar_detailing_beam_pages(beam):
+    doc = ezdxf.new(dxfversion="R2010", setup=True)
+    entities = beam.draw_table_rebar_detailing(document=doc, x=-20, y=-5, page_rows=3)
+
+    # Same rows than the single table, split in pages.
+    data = beam.extract_data()
+    assert len(entities["pages"]) == -(-len(data) // 3)
+    assert sum(len(page["content"]["grid_hz_lines"]) - 1 for page in entities["pages"]) == len(data)
+    assert len(entities["all_elements"]) == len(doc.modelspace())
@@ -2,6 +2,8 @@
 
 # Local imports.
 from etacad.cadtable import CADTable
+from etacad.globals import CADTABLE_SET_DEFAULT, Direction
+from etacad.utils import text_width_estimation
 
 # External imports.
 import ezdxf
@@ -73,3 +75,95 @@ def test_draw_table_cadtable_data(cadtable_data):
     assert len(table["content"]["texts_row0"]) == 5
     assert len(table["content"]["texts_row1"]) == 5
     assert len(table["content"]["texts_row2"]) == 5
+
+
+def test_layout_cadtable_data(cadtable_data):
+    # Column widths fitted once, to the content and to the labels.
+    assert cadtable_data.column_widths == pytest.approx([0.1, 0.2, 0.1, 0.2, 0.4])
+    assert cadtable_data.table_column_widths == pytest.approx([1.6, 0.4, 0.6, 1.6, 1])
+    assert cadtable_data.rows_length == pytest.approx(1)
+
+    # Editing a cell fits its column again.
+    cadtable_data.cell_content_edit(row=1, column=2, text="0.150")
+    assert cadtable_data.column_widths[2] == pytest.approx(0.5)
+    assert cadtable_data.rows_length == pytest.approx(1.4)
+
+    doc = ezdxf.new(dxfversion="R2010", setup=True)
+    table = cadtable_data.draw_table(document=doc, x=1, y=1)
+    assert table["content"]["texts_row1"][2].dxf.width == pytest.approx(0.6)
+
+
+def test_layout_cadtable_font():
+    cadtable = CADTable(data=[["1", "WWW"], ["2", "iii"]],
+                        labels=["A", "B"],
+                        settings={**CADTABLE_SET_DEFAULT, "text_font": "DejaVuSans.ttf"})
+
+    # Glyph widths of the font, narrow characters take less room.
+    assert cadtable.column_widths[1] == pytest.approx(text_width_estimation("WWW", 0.1, font="DejaVuSans.ttf"))
+    assert text_width_estimation("iii", 0.1, font="DejaVuSans.ttf") < cadtable.column_widths[1]
+
+
+def test_draw_grid_cadtable_many_rows():
+    cadtable = CADTable(data=[[str(i), "12", "0.15"] for i in range(2000)], labels=["POSITION", "DB", "SEP"])
+    doc = ezdxf.new(dxfversion="R2010", setup=True)
+    grid = cadtable.draw_grid(document=doc, x=0, y=0)
+
+    # A line per row and column border, from side to side of the grid.
+    assert len(grid["grid_hz_lines"]) == 2001
+    assert len(grid["grid_vt_lines"]) == 4
+    assert len(doc.modelspace()) == 2005
+    assert grid["grid_hz_lines"][1].dxf.start.isclose(Vec3(0, 0.3, 0))
+    assert grid["grid_hz_lines"][1].dxf.end.isclose(Vec3(cadtable.rows_length, 0.3, 0))
+    assert grid["grid_hz_lines"][-2].dxf.start.isclose(Vec3(0, 600, 0))
+    assert grid["grid_vt_lines"][-2].dxf.end.isclose(Vec3(cadtable.rows_length, 600, 0))
+
+
+def test_draw_pages_cadtable_rows():
+    rows = ([str(i), "12", "0.15"] for i in range(95))
+    cadtable = CADTable(rows=0, columns=3, labels=["POSITION", "DB", "SEP"])
+    doc = ezdxf.new(dxfversion="R2010", setup=True)
+    entities = cadtable.draw_pages(document=doc, rows=rows, x=0, y=0, page_rows=40)
+
+    # Pages, the last one with the remaining rows and its top aligned with the others.
+    assert len(entities["pages"]) == 3
+    assert [len(page["content"]["grid_hz_lines"]) for page in entities["pages"]] == [41, 41, 16]
+    assert len(entities["all_elements"]) == len(doc.modelspace())
+    first_page, last_page = entities["pages"][0], entities["pages"][-1]
+    assert max(line.dxf.start.y for line in first_page["content"]["grid_hz_lines"]) == pytest.approx(
+        max(line.dxf.start.y for line in last_page["content"]["grid_hz_lines"]))
+    assert min(line.dxf.start.x for line in last_page["content"]["grid_vt_lines"]) > \
+        max(line.dxf.start.x for line in first_page["content"]["grid_vt_lines"])
+
+    # Not collected, only the number of entities.
+    doc = ezdxf.new(dxfversion="R2010", setup=True)
+    rows = ([str(i), "12", "0.15"] for i in range(95))
+    assert cadtable.draw_pages(document=doc, rows=rows, page_rows=40, collect=False) == {"count": len(doc.modelspace())}
+
+
+def test_draw_table_cadtable_empty():
+    cadtable = CADTable(rows=0, columns=3, labels=["POSITION", "DB", "SEP"])
+    doc = ezdxf.new(dxfversion="R2010", setup=True)
+
+    # No rows, only the column borders of the grid and the labels of the table.
+    grid = cadtable.draw_grid(document=doc, x=0, y=0)
+    assert grid["grid_hz_lines"] == []
+    assert len(grid["grid_vt_lines"]) == 4
+    entities = cadtable.draw_table(document=doc, x=0, y=0)
+    assert entities["content"]["grid_hz_lines"] == []
+    assert len(entities["labels"]["all_elements"]) == 2 + 4 + 3
+    assert cadtable.draw_pages(document=doc, rows=iter([]), x=0, y=0)["pages"] == []
+
+
+def test_draw_pages_cadtable_writer(tmp_path):
+    from etacad.dxf_writer import DXFStreamWriter
+
+    cadtable = CADTable(data=[[str(i), "12", "0.15"] for i in range(50)], labels=["POSITION", "DB", "SEP"])
+    writer = DXFStreamWriter(stream=str(tmp_path / "pages.dxf"))
+    entities = cadtable.draw_pages(document=writer.document, page_rows=20, direction=Direction.VERTICAL,
+                                   writer=writer, collect=False)
+    writer.close()
+
+    # Every page written to disk once drawn.
+    assert len(writer.document.modelspace()) == 0
+    assert writer.count == entities["count"]
+    assert len(ezdxf.readfile(tmp_path / "pages.dxf").modelspace()) == entities["count"]
@@ -28,6 +28,27 @@ def test_concrete_length_hexagon_attributes(concrete_length_hexagon):
     assert concrete_length_hexagon.box_height == 1.7321
 
 
+def test_concrete_length_hexagon_polygon(concrete_length_hexagon):
+    # Cached polygon.
+    polygon = concrete_length_hexagon.polygon
+    assert concrete_length_hexagon.polygon is polygon
+    assert polygon.vertices is concrete_length_hexagon.vertices
+
+    # New polygon on new vertices.
+    concrete_length_hexagon.vertices = [(0, 0), (2, 0), (2, 1), (0, 1)]
+    assert concrete_length_hexagon.polygon is not polygon
+    assert concrete_length_hexagon.polygon.bounding_box == (0, 0, 2, 1)
+
+
+
+def test_concrete_length_hexagon_get_cover_vertices(concrete_length_hexagon):
+    cover_vertices = concrete_length_hexagon.get_cover_vertices(cover=0.05)
+
+    assert len(cover_vertices) == 6
+    assert cover_vertices[0] == pytest.approx((0.5288688, 1.6821))
+    assert cover_vertices[2] == pytest.approx((1.9422654, 0.8660014))
+    assert concrete_length_hexagon.get_cover_vertices(cover=1) == []
+
 def test_concrete_length_hexagon_draw_longitudinal(concrete_length_hexagon):
     doc = ezdxf.new(dxfversion="R2010", setup=True)
     entities = concrete_length_hexagon.draw_longitudinal(document=doc,
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+
+# Local imports.
+from etacad.bar import Bar
+from etacad.beam import Beam
+from etacad.drawing_utils import (EntityRecorder, array_copies, circles, count_entities, curve, defer_dimensions,
+                                  delete_entities, dim_linear, export_entities, import_entities, line, lines, rect,
+                                  render_dimensions)
+from etacad.globals import Direction, Orientation
+
+# External imports.
+import ezdxf
+import pickle
+import pytest
+
+from ezdxf.math import Vec3
+
+
+@pytest.fixture
+def recorder():
+    return EntityRecorder(doc=ezdxf.new(dxfversion="R2010", setup=True))
+
+
+def test_entity_recorder_buffer(recorder):
+    msp = recorder.doc.modelspace()
+
+    entities = line(doc=recorder, p1=(0, 0), p2=(1, 1))
+    entities += rect(doc=recorder, width=2, height=1, x=0, y=0, fill=True)
+
+    # Nothing is added to the document until flushing.
+    assert len(msp) == 0
+    assert len(recorder.entities) == 6
+    assert all(entitie.dxf.handle is None for entitie in entities)
+
+    assert recorder.flush() == 6
+    assert len(msp) == 6
+    assert recorder.entities == []
+    assert all(entitie.dxf.handle is not None for entitie in entities)
+
+
+def test_entity_recorder_bar_draw_longitudinal(recorder):
+    bar = Bar(reinforcement_length=4,
+              diameter=0.012,
+              left_anchor=0.2,
+              right_anchor=0.2,
+              mandrel_radius=0.012,
+              direction=Direction.VERTICAL,
+              orientation=Orientation.TOP,
+              denomination="@bar")
+
+    doc = ezdxf.new(dxfversion="R2010", setup=True)
+    expected = bar.draw_longitudinal(document=doc, x=1, y=2)
+    recorded = bar.draw_longitudinal(document=recorder, x=1, y=2)
+
+    assert len(recorder.entities) == len(expected["all_elements"])
+    for entitie_expected, entitie_recorded in zip(expected["all_elements"], recorded["all_elements"]):
+        assert entitie_expected.dxftype() == entitie_recorded.dxftype()
+        if entitie_expected.dxftype() == "LINE":
+            assert entitie_expected.dxf.start.isclose(entitie_recorded.dxf.start)
+            assert entitie_expected.dxf.end.isclose(entitie_recorded.dxf.end)
+
+    recorder.flush()
+    assert len(recorder.doc.modelspace()) == len(doc.modelspace())
+
+
+def test_entity_recorder_beam_draw_longitudinal(recorder):
+    beam = Beam(width=0.3,
+                height=0.5,
+                length=4,
+                as_sup={0.012: 2},
+                as_inf={0.016: 2},
+                anchor_sup=0.1,
+                anchor_inf=0.1,
+                stirrups_db=[0.008],
+                stirrups_length=[2],
+                stirrups_sep=[0.15],
+                stirrups_x=[1],
+                cover=0.03,
+                columns=[[0.2, 0.5], [0.3, 0.5]],
+                columns_pos=[0, 3.7])
+
+    elements = beam.draw_longitudinal(document=recorder, x=0, y=0)
+    dimensions = [entitie for entitie in elements["all_elements"] if entitie.dxftype() == "DIMENSION"]
+
+    # Dimensions are added to the document straight away, the rest waits for the flush.
+    assert len(recorder.doc.modelspace()) == len(dimensions)
+    assert recorder.flush() == len(elements["all_elements"]) - len(dimensions)
+    assert elements["concrete"]["concrete_elements"][0].dxf.start == Vec3(0, 0, 0)
+
+
+def test_array_copies(recorder):
+    doc = ezdxf.new(dxfversion="R2010", setup=True)
+    template = line(doc=recorder, p1=(0, 0), p2=(1, 0))
+    template += curve(doc=recorder, center_point=(0, 0), radius=1, start_angle=0, end_angle=90)
+
+    copies = array_copies(doc=doc, entities=template, offsets=[(0, 0), (0, 2), (3, 4)])
+    assert len(copies) == 3
+    assert len(doc.modelspace()) == 6
+    assert copies[1][0].dxf.start == Vec3(0, 2, 0)
+    assert copies[2][0].dxf.end == Vec3(4, 4, 0)
+    assert copies[2][1].dxf.center == Vec3(3, 4, 0)
+    assert copies[2][1].dxf.end_angle == 90
+
+
+def test_circles_lines():
+    doc = ezdxf.new(dxfversion="R2010", setup=True)
+
+    entities = circles(doc=doc, center_points=[(0, 0), (1, 1)], radius=0.5)
+    entities += lines(doc=doc, start_points=[(0, 0), (1, 1)], end_points=[(2, 0), (2, 2)])
+    assert len(doc.modelspace()) == 4
+    assert entities[1].dxf.center == Vec3(1, 1, 0)
+    assert entities[3].dxf.end == Vec3(2, 2, 0)
+
+
+def test_count_entities():
+    doc = ezdxf.new(dxfversion="R2010", setup=True)
+    entities = line(doc=doc, p1=(0, 0), p2=(1, 1))
+    group = {"all_elements": rect(doc=doc, width=2, height=1, x=0, y=0)}
+
+    assert count_entities(entities, group, [group, {"count": 5}], [], {}) == 1 + 4 + 4 + 5
+
+
+def test_delete_entities():
+    doc = ezdxf.new(dxfversion="R2010", setup=True)
+    entities = line(doc=doc, p1=(0, 0), p2=(1, 1))
+    entities += dim_linear(document=doc, p_base=(0, -0.5), p1=(0, 0), p2=(2, 0))
+    block_name = entities[-1].dxf.geometry
+    handles = [entitie.dxf.handle for entitie in entities]
+
+    assert delete_entities(doc=doc, handles=handles) == 2
+    assert delete_entities(doc=doc, handles=handles) == 0
+    assert len(doc.modelspace()) == 0
+    assert block_name not in doc.blocks
+
+
+
+# Function that gets the points of a dimension and of the entities of its geometry block.
+def dimension_points(doc, dimension) -> list:
+    points = [dimension.dxf.get(name) for name in ("defpoint", "defpoint2", "defpoint3", "text_midpoint")]
+    for entitie in doc.blocks.get(dimension.dxf.geometry):
+        if entitie.dxftype() == "LINE":
+            points += [entitie.dxf.start, entitie.dxf.end]
+        else:
+            points.append(entitie.dxf.location if entitie.dxftype() == "POINT" else entitie.dxf.insert)
+    return points
+
+
+def test_render_dimensions():
+    doc = ezdxf.new(dxfversion="R2010", setup=True)
+    doc_immediate = ezdxf.new(dxfversion="R2010", setup=True)
+    defer_dimensions(doc=doc)
+    cases = []
+    for x in (0, 3, 6):
+        cases += [dict(p_base=(x, -0.5), p1=(x, 0), p2=(x + 2, 0)),
+                  dict(p_base=(x + 1, 0.95), p1=(x, 0), p2=(x + 2, 0)),  # Base point at mid-span.
+                  dict(p_base=(x - 0.4, 1.5), p1=(x, 0), p2=(x, 3), rotation=90)]
+    cases.append(dict(p_base=(0, -1), p1=(0, 0), p2=(1, 0)))
+    for case in cases:
+        dim_linear(document=doc, **case)
+        dim_linear(document=doc_immediate, **case)
+    dimensions = list(doc.modelspace())
+
+    # Dimensions without geometry until rendered, equal dimensions copy the geometry of the first one.
+    assert not any(dimension.dxf.hasattr("geometry") for dimension in dimensions)
+    assert render_dimensions(doc=doc) == len(cases)
+    assert len({dimension.dxf.geometry for dimension in dimensions}) == len(cases)
+    for dimension, dimension_immediate in zip(dimensions, doc_immediate.modelspace()):
+        block = doc.blocks.get(dimension.dxf.geometry)
+        block_immediate = doc_immediate.blocks.get(dimension_immediate.dxf.geometry)
+        assert [entitie.dxftype() for entitie in block] == [entitie.dxftype() for entitie in block_immediate]
+        points = dimension_points(doc, dimension)
+        points_immediate = dimension_points(doc_immediate, dimension_immediate)
+        assert all(point.isclose(point_immediate, abs_tol=1e-9)
+                   for point, point_immediate in zip(points, points_immediate))
+    assert not doc.audit().has_errors
+
+    # Deferral ended, dimensions rendered when drawn.
+    assert dim_linear(document=doc, p_base=(0, -2), p1=(0, 0), p2=(1, 0))[0].dxf.hasattr("geometry")
+
+    # Dimensions left for the viewer to render.
+    defer_dimensions(doc=doc)
+    dimension = dim_linear(document=doc, p_base=(0, -3), p1=(0, 0), p2=(1, 0))[0]
+    assert render_dimensions(doc=doc, skip=True) == 0
+    assert not dimension.dxf.hasattr("geometry")
+
+
+def test_export_import_entities():
+    doc = ezdxf.new(dxfversion="R2010", setup=True)
+    line(doc=doc, p1=(0, 0), p2=(1, 1))
+    rect(doc=doc, width=2, height=1, x=0, y=0, fill=True)
+    dim_linear(document=doc, p_base=(0, -0.5), p1=(0, 0), p2=(2, 0))
+
+    batch = pickle.loads(pickle.dumps(export_entities(doc=doc)))
+    assert all(record[1] is not None for record in batch["entities"])
+
+    doc_target = ezdxf.new(dxfversion="R2010", setup=True)
+    entities = import_entities(doc=doc_target, batch=batch)
+    assert [entitie.dxftype() for entitie in entities] == [entitie.dxftype() for entitie in doc.modelspace()]
+    assert entities[0].dxf.end == Vec3(1, 1, 0)
+    assert entities[-1].dxf.geometry in doc_target.blocks
+    assert len(doc_target.blocks.get(entities[-1].dxf.geometry)) == len(doc.blocks.get("*D1"))
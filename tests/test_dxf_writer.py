@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+
+# Local imports.
+from etacad.bar import Bar
+from etacad.dxf_writer import DXFStreamWriter
+
+# External imports.
+import ezdxf
+import io
+
+
+def test_dxf_stream_writer_flush(tmp_path):
+    bar = Bar(reinforcement_length=4, diameter=0.012, left_anchor=0.2, right_anchor=0.2, x=0, y=0)
+
+    with DXFStreamWriter(stream=str(tmp_path / "bars.dxf")) as writer:
+        entities = bar.draw_longitudinal(document=writer.document, x=0, y=0)
+        assert writer.flush() == len(entities["all_elements"])
+        assert len(writer.document.modelspace()) == 0
+        assert not entities["all_elements"][0].is_alive
+
+        bar.draw_longitudinal(document=writer.document, x=0, y=1)
+
+    # Entities of the last drawing flushed on close.
+    assert writer.count == 2 * len(entities["all_elements"])
+    doc = ezdxf.readfile(tmp_path / "bars.dxf")
+    assert len(doc.modelspace()) == writer.count
+    assert not doc.audit().has_errors
+
+
+def test_dxf_stream_writer_text_stream():
+    bar = Bar(reinforcement_length=4, diameter=0.012, left_anchor=0.2, right_anchor=0.2, x=0, y=0)
+    stream = io.StringIO()
+
+    writer = DXFStreamWriter(stream=stream, dxfversion="R2000")
+    bar.draw_longitudinal(document=writer.document, x=0, y=0)
+    writer.close()
+
+    doc = ezdxf.read(io.StringIO(stream.getvalue()))
+    assert doc.dxfversion == "AC1015"
+    assert len(doc.modelspace()) == writer.count
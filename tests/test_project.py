@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+
+# Local imports.
+from etacad.beam import Beam
+from etacad.column import Column
+from etacad.project import Project
+from etacad.slab import Slab
+
+# External imports.
+import ezdxf
+import pytest
+
+
+@pytest.fixture
+def project():
+    beam = Beam(width=.2,
+                height=.35,
+                length=6,
+                as_sup={.01: 3},
+                as_inf={.016: 3},
+                anchor_sup=.15,
+                anchor_inf=.15,
+                cover=.03,
+                stirrups_db=.006,
+                stirrups_sep=.15,
+                stirrups_anchor=.1,
+                columns=[[.2, .35], [.3, .35]],
+                columns_pos=[0, 5.7])
+    column = Column(width=0.2,
+                    depth=0.2,
+                    height=3,
+                    cover=.03,
+                    as_sup={0.016: 2},
+                    as_inf={0.016: 2},
+                    stirrups_db=[.006],
+                    stirrups_anchor=[.1],
+                    stirrups_sep=[0.15],
+                    stirrups_length=[2.8],
+                    stirrups_x=[0.1])
+    slab = Slab(length_x=5,
+                length_y=4,
+                thickness=0.15,
+                as_sup_x_db=0.008,
+                as_sup_y_db=0.008,
+                as_inf_x_db=0.01,
+                as_inf_y_db=0.01,
+                as_sup_x_sp=0.20,
+                as_sup_y_sp=0.20,
+                as_inf_x_sp=0.15,
+                as_inf_y_sp=0.15,
+                cover=0.025)
+
+    project = Project()
+    project.add(beam, x=0, y=0)
+    project.add(beam, x=8, y=0, view="draw_transverse", x_section=2)
+    project.add(beam, x=0, y=-2, view="draw_longitudinal_rebar_detailing")
+    project.add(beam, x=0, y=-8, view="draw_table_rebar_detailing")
+    project.add(column, x=12, y=0)
+    project.add(column, x=14, y=0, view="draw_transverse", y_section=1)
+    project.add(slab, x=20, y=0)
+    project.add(slab, x=20, y=-2, view="draw_transverse", axe_section="y")
+
+    return project
+
+
+def test_project_add(project):
+    assert len(project.placements) == 8
+    assert project.placements[1].options == {"x_section": 2}
+
+    with pytest.raises(AttributeError):
+        project.add(project.placements[0].element, view="draw_elevation")
+
+
+def test_placement_draw_collect(project):
+    for placement in project.placements:
+        doc = ezdxf.new(dxfversion="R2010", setup=True)
+        elements = placement.draw(document=doc)
+        doc_count = ezdxf.new(dxfversion="R2010", setup=True)
+        count = placement.draw(document=doc_count, collect=False)
+
+        # Same entities drawn, only their number returned.
+        assert count == {"count": len(elements["all_elements"])}
+        assert len(doc_count.modelspace()) == len(doc.modelspace())
+
+
+def test_project_draw(project):
+    doc = ezdxf.new(dxfversion="R2010", setup=True)
+    expected = []
+    for placement in project.placements:
+        expected += placement.draw(document=doc)["all_elements"]
+
+    doc_sequential = project.draw()
+    doc_processes = project.draw(processes=2, chunk_size=3)
+
+    # Same entities, in the same order, for the sequential and the multiprocess drawing.
+    for msp in (doc_sequential.modelspace(), doc_processes.modelspace()):
+        assert len(msp) == len(doc.modelspace())
+        assert [entitie.dxftype() for entitie in msp] == [entitie.dxftype() for entitie in doc.modelspace()]
+
+    lines = [entitie for entitie in doc_processes.modelspace() if entitie.dxftype() == "LINE"]
+    lines_expected = [entitie for entitie in doc.modelspace() if entitie.dxftype() == "LINE"]
+    assert all(line.dxf.start.isclose(line_expected.dxf.start) for line, line_expected in zip(lines, lines_expected))
+
+    # Dimension geometry blocks merged.
+    dimensions = [entitie for entitie in doc_processes.modelspace() if entitie.dxftype() == "DIMENSION"]
+    assert dimensions
+    assert all(dimension.dxf.geometry in doc_processes.blocks for dimension in dimensions)
+    assert not doc_processes.audit().has_errors
+
+
+def test_project_draw_dimensions(project):
+    # Elements drawn again elsewhere, their dimensions reuse the geometry blocks of the first ones.
+    project.add(project.placements[0].element, x=0, y=4)
+    project.add(project.placements[6].element, x=30, y=0.5)
+    doc = ezdxf.new(dxfversion="R2010", setup=True)
+    for placement in project.placements:
+        placement.draw(document=doc)
+    doc_deferred = project.draw()
+
+    # Deferred geometry blocks equal to the immediately rendered ones.
+    dimensions = [entitie for entitie in doc_deferred.modelspace() if entitie.dxftype() == "DIMENSION"]
+    dimensions_expected = [entitie for entitie in doc.modelspace() if entitie.dxftype() == "DIMENSION"]
+    assert len(dimensions) == len(dimensions_expected)
+    for dimension, dimension_expected in zip(dimensions, dimensions_expected):
+        assert dimension.dxf.defpoint.isclose(dimension_expected.dxf.defpoint, abs_tol=1e-9)
+        assert dimension.dxf.text_midpoint.isclose(dimension_expected.dxf.text_midpoint, abs_tol=1e-9)
+        block = doc_deferred.blocks.get(dimension.dxf.geometry)
+        block_expected = doc.blocks.get(dimension_expected.dxf.geometry)
+        assert [entitie.dxftype() for entitie in block] == [entitie.dxftype() for entitie in block_expected]
+        for entitie, entitie_expected in zip(block, block_expected):
+            for name in ("start", "end", "insert", "location"):
+                if entitie.dxf.hasattr(name):
+                    assert entitie.dxf.get(name).isclose(entitie_expected.dxf.get(name), abs_tol=1e-9)
+
+
+def test_project_draw_dimension_blocks(project):
+    doc = project.draw(dimension_blocks=False)
+    doc_processes = project.draw(processes=2, chunk_size=3, dimension_blocks=False)
+
+    # Dimensions left without geometry block.
+    for document in (doc, doc_processes):
+        dimensions = [entitie for entitie in document.modelspace() if entitie.dxftype() == "DIMENSION"]
+        assert dimensions
+        assert not any(dimension.dxf.hasattr("geometry") for dimension in dimensions)
+
+
+def test_project_write(project, tmp_path):
+    doc = project.draw()
+    count = project.write(stream=str(tmp_path / "project.dxf"))
+
+    # Same entities written, the file is a valid document.
+    assert count == len(doc.modelspace())
+    doc_streamed = ezdxf.readfile(tmp_path / "project.dxf")
+    assert [entitie.dxftype() for entitie in doc_streamed.modelspace()] == [entitie.dxftype()
+                                                                            for entitie in doc.modelspace()]
+    assert not doc_streamed.audit().has_errors
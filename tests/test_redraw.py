@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+
+# Local imports.
+from etacad.beam import Beam
+from etacad.slab import Slab
+
+# External imports.
+import ezdxf
+import pytest
+
+
+@pytest.fixture
+def beam():
+    return Beam(width=.2,
+                height=.35,
+                length=6,
+                as_sup={.01: 3},
+                as_inf={.016: 3},
+                anchor_sup=.15,
+                anchor_inf=.15,
+                cover=.03,
+                stirrups_db=.006,
+                stirrups_sep=.15,
+                stirrups_anchor=.1,
+                columns=[[.2, .35], [.3, .35]],
+                columns_pos=[0, 5.7])
+
+
+@pytest.fixture
+def slab():
+    return Slab(length_x=5,
+                length_y=4,
+                thickness=0.15,
+                as_sup_x_db=0.008,
+                as_sup_y_db=0.008,
+                as_inf_x_db=0.01,
+                as_inf_y_db=0.01,
+                as_sup_x_sp=0.20,
+                as_sup_y_sp=0.20,
+                as_inf_x_sp=0.15,
+                as_inf_y_sp=0.15,
+                cover=0.025)
+
+
+def test_draw_tracked_beam(beam):
+    doc = ezdxf.new(dxfversion="R2010", setup=True)
+    elements = beam.draw_tracked(document=doc, x=0, y=0)
+
+    # Same entities as the drawing method, split in pieces.
+    assert len(elements["all_elements"]) == len(beam.draw_longitudinal(document=ezdxf.new())["all_elements"])
+    assert len(elements["stirrups"]) == 35
+    assert len(elements["stirrups_dimensions"]) == 1
+    assert len(elements["bars"]) == 24
+    assert len(doc.modelspace()) == len(elements["all_elements"])
+
+    # Stirrup zone dimensions drawn without the stirrups.
+    assert len(beam.draw_longitudinal(document=ezdxf.new(), stirrups=False)["dimensions_elements"]) == 1
+
+    with pytest.raises(AttributeError):
+        beam.draw_tracked(document=doc, view="draw_elevation")
+
+
+def test_update_redraw_beam(beam):
+    doc = ezdxf.new(dxfversion="R2010", setup=True)
+    elements = beam.draw_tracked(document=doc, x=0, y=0)
+    beam.draw_tracked(document=doc, view="draw_longitudinal_rebar_detailing", x=0, y=-2)
+    beam.draw_tracked(document=doc, view="draw_table_rebar_detailing", x=0, y=-8)
+
+    assert beam.update(stirrups_sep=.15) == set()
+    assert beam.redraw(document=doc) == 0
+
+    # Only stirrups and the table depend on the stirrups separation.
+    assert beam.update(stirrups_sep=.1) == {"stirrups"}
+    assert beam.stirrups_sep == [.1]
+    count = beam.redraw(document=doc)
+    assert all(entitie.is_alive for entitie in elements["bars"] + elements["concrete"] + elements["columns"])
+    assert not any(entitie.is_alive for entitie in elements["stirrups"])
+
+    # Same document as drawing the beam changed from scratch.
+    doc_expected = ezdxf.new(dxfversion="R2010", setup=True)
+    longitudinal = beam.draw_longitudinal(document=doc_expected, x=0, y=0)
+    table = beam.draw_table_rebar_detailing(document=doc_expected, x=0, y=-8)
+    beam.draw_longitudinal_rebar_detailing(document=doc_expected, x=0, y=-2)
+    assert count == (sum(len(stirrup["all_elements"]) for stirrup in longitudinal["stirrups"]) +
+                     len(longitudinal["dimensions_elements"]) + len(table["all_elements"]))
+    assert len(doc.modelspace()) == len(doc_expected.modelspace())
+    assert not doc.audit().has_errors
+
+    # Geometry changes affect everything.
+    assert beam.update(height=.4) == {"concrete", "columns", "bars", "stirrups"}
+    assert beam.redraw(document=doc) == len(doc.modelspace())
+
+    with pytest.raises(AttributeError):
+        beam.update(stirrups=[])
+
+
+def test_redraw_other_document(beam):
+    doc = ezdxf.new(dxfversion="R2010", setup=True)
+    elements = beam.draw_tracked(document=doc, x=0, y=0)
+    doc_other = ezdxf.new(dxfversion="R2010", setup=True)
+    beam.draw_longitudinal(document=doc_other, x=0, y=0)
+    count = len(doc_other.modelspace())
+
+    # Views tracked in another document are neither deleted nor drawn.
+    beam.update(stirrups_sep=.1)
+    assert beam.redraw(document=doc_other) == 0
+    assert len(doc_other.modelspace()) == count
+    assert all(entitie.is_alive for entitie in doc_other.modelspace())
+
+    # Changes still pending in the document where the view was drawn.
+    assert beam.redraw(document=doc) > 0
+    assert not any(entitie.is_alive for entitie in elements["stirrups"])
+
+
+def test_update_redraw_slab(slab):
+    doc = ezdxf.new(dxfversion="R2010", setup=True)
+    elements = slab.draw_tracked(document=doc, x=0, y=0)
+    slab.draw_tracked(document=doc, view="draw_transverse", x=0, y=-2, axe_section="y")
+
+    # Inferior bars spacing, superior bars are kept.
+    assert slab.update(as_inf_x_sp=.2) == {"bars_inf"}
+    slab.redraw(document=doc)
+    assert all(entitie.is_alive for entitie in elements["bars_sup"] + elements["concrete"])
+    assert not any(entitie.is_alive for entitie in elements["bars_inf"])
+
+    doc_expected = ezdxf.new(dxfversion="R2010", setup=True)
+    slab.draw_longitudinal(document=doc_expected, x=0, y=0)
+    slab.draw_transverse(document=doc_expected, x=0, y=-2, axe_section="y")
+    assert len(doc.modelspace()) == len(doc_expected.modelspace())
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+# Local imports.
+from etacad.beam import Beam
+from etacad.column import Column
+from etacad.globals import ShapeCodes
+from etacad.project import Project
+from etacad.schedule import BarSchedule, shape_code
+
+# External imports.
+import csv
+import ezdxf
+import io
+import json
+import pytest
+
+
+@pytest.fixture
+def beam():
+    return Beam(width=.2,
+                height=.35,
+                length=6,
+                as_sup={.01: 3},
+                as_inf={.016: 3},
+                anchor_sup=.15,
+                anchor_inf=.15,
+                cover=.03,
+                stirrups_db=.006,
+                stirrups_sep=.15,
+                stirrups_anchor=.1,
+                columns=[[.2, .35], [.3, .35]],
+                columns_pos=[0, 5.7])
+
+
+@pytest.fixture
+def column():
+    return Column(width=0.2,
+                  depth=0.2,
+                  height=3,
+                  cover=.03,
+                  as_sup={0.016: 2},
+                  as_inf={0.016: 2},
+                  stirrups_db=[.006],
+                  stirrups_anchor=[.1],
+                  stirrups_sep=[0.15],
+                  stirrups_length=[2.8],
+                  stirrups_x=[0.1])
+
+
+def test_schedule_records(beam, column):
+    schedule = BarSchedule(elements=[beam, column])
+
+    # A record per position of every element.
+    assert schedule.positions == [*beam.position_registry, *column.position_registry]
+    assert schedule.columns["element"].tolist() == [0] * len(beam.position_registry) + [1] * len(
+        column.position_registry)
+    assert shape_code(beam.stirrups[0]) == ShapeCodes.STIRRUP
+    assert shape_code(beam.bars_as_sup[0]) == ShapeCodes.TWO_ANCHORS
+    assert ShapeCodes.STIRRUP.value in schedule.columns["shape"]
+
+    # Total weight, same than the detailing tables of the elements.
+    weight = sum(float(row[6]) for row in beam.extract_data() + column.extract_data())
+    assert schedule.total_weight() == pytest.approx(weight, abs=0.01)
+
+
+def test_schedule_group(beam, column):
+    schedule = BarSchedule(elements=[beam, column, beam])
+    groups = schedule.group()
+
+    # Groups sorted by diameter, shape and length, totals of every group.
+    assert groups["diameter"].tolist() == sorted(groups["diameter"].tolist())
+    assert groups["weight"].sum() == pytest.approx(schedule.total_weight())
+    assert groups["quantity"].sum() == schedule.columns["quantity"].sum()
+    stirrups = groups["shape"] == ShapeCodes.STIRRUP.value
+    assert groups["quantity"][stirrups].sum() == 2 * sum(stirrup.quantity for stirrup in beam.stirrups) + sum(
+        stirrup.quantity for stirrup in column.stirrups)
+
+    # Grouped by element.
+    assert schedule.group(by=("element",))["weight"].tolist() == pytest.approx(
+        [BarSchedule(elements=[element]).total_weight() for element in (beam, column, beam)])
+
+
+def test_schedule_from_project(beam, column):
+    project = Project()
+    project.add(beam, x=0, y=0)
+    project.add(beam, x=8, y=0, view="draw_transverse", x_section=2)
+    project.add(column, x=12, y=0)
+
+    # Elements placed in several views counted once.
+    assert BarSchedule.from_project(project).elements == [beam, column]
+
+
+def test_schedule_output(beam, column, tmp_path):
+    schedule = BarSchedule(elements=[beam, column])
+    groups = schedule.group()
+
+    # CSV and JSON, a row per group.
+    count = schedule.write_csv(str(tmp_path / "schedule.csv"))
+    with open(tmp_path / "schedule.csv", newline="") as stream:
+        rows = [*csv.DictReader(stream)]
+    assert count == len(rows) == len(groups["weight"])
+    assert rows[0]["shape"] in ShapeCodes.__members__
+    assert sum(float(row["weight"]) for row in rows) == pytest.approx(schedule.total_weight())
+
+    stream = io.StringIO()
+    assert schedule.write_json(stream) == count
+    assert json.loads(stream.getvalue())[0] == {**rows[0], "diameter": float(rows[0]["diameter"]),
+                                                 "length": float(rows[0]["length"]),
+                                                 "quantity": int(rows[0]["quantity"]),
+                                                 "total_length": float(rows[0]["total_length"]),
+                                                 "weight": float(rows[0]["weight"])}
+
+    # Table, in pages.
+    doc = ezdxf.new(dxfversion="R2010", setup=True)
+    entities = schedule.draw_table(document=doc, page_rows=2)
+    assert len(entities["pages"]) == -(-count // 2)
+    assert len(entities["all_elements"]) == len(doc.modelspace())
@@ -162,6 +162,23 @@ def test_draw_transverse_slab_10x5_without_anchor(slab_10x5_whithout_anchor):
     assert len(ex_04["spaced_bars_elements"]) == 4
 
 
+
+def test_draw_transverse_section_slab_10x5_without_anchor(slab_10x5_whithout_anchor):
+    doc = ezdxf.new(setup=True)
+    ex_01 = slab_10x5_whithout_anchor.draw_transverse(document=doc, x=0, y=0, axe_section="x", section=5)
+    ex_02 = slab_10x5_whithout_anchor.draw_transverse(document=doc, x=0, y=-2, axe_section="y", section=2.5)
+    ex_03 = slab_10x5_whithout_anchor.draw_transverse(document=doc, x=0, y=-4, axe_section="x", section=12)
+
+    # Sections crossing every spaced bar.
+    assert len(ex_01["all_elements"]) == 97
+    assert len(ex_01["spaced_bars_elements"]) == 4
+    assert len(ex_02["all_elements"]) == 172
+    assert len(ex_02["spaced_bars_elements"]) == 4
+
+    # Section out of the slab.
+    assert ex_03["all_elements"] == ex_03["concrete_elements"]["all_elements"]
+    assert len(ex_03["spaced_bars_elements"]) == 0
+
 def test_draw_longitudinal_rebar_detailing_slab_10x5_without_anchor(slab_10x5_whithout_anchor):
     doc = ezdxf.new(setup=True)
     ex_01 = slab_10x5_whithout_anchor.draw_longitudinal_rebar_detailing(document=doc, x=0, y=0)
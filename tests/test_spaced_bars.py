@@ -2,7 +2,7 @@
 
 # Local imports.
 from etacad.globals import Direction, Orientation
-from etacad.spaced_bars import SpacedBars
+from etacad.spaced_bars import BarSequence, SpacedBars
 
 # External imports.
 import ezdxf
@@ -62,6 +62,39 @@ def test_attributes_spaced_bar_horizontal(spaced_bar_horizontal):
     assert spaced_bar_horizontal.weight == 125.77366188646737
 
 
+def test_bars_spaced_bar_horizontal(spaced_bar_horizontal):
+    bars = spaced_bar_horizontal.bars
+    assert isinstance(bars, BarSequence)
+    assert len(bars) == 34
+    assert len(list(bars)) == 34
+
+    # Bars built on demand from the prototype.
+    assert bars[0].y == 0
+    assert bars[1].y == 0.12
+    assert bars[-1].y == bars[33].y == 33 * 0.12
+    assert bars[0].reinforcement_length == 6
+    assert bars[0].denomination == "R1"
+    assert [bar.y for bar in bars[1:3]] == [0.12, 0.24]
+    assert bars[5] == bars[5]
+
+    # Bars kept once built, changes persist.
+    assert bars[1] is bars[1] is bars[-33]
+    bars[1].position = "P9"
+    assert bars[1].position == "P9"
+    assert bars[2].position != "P9"
+
+    # Bars reached by iteration are not kept, drawing keeps only the bars drawn alone or dimensioned.
+    kept = len(bars._bars)
+    assert [bar.position for bar in bars][:3] == [None, "P9", None]
+    assert len(bars._bars) == kept
+    spaced_bar_horizontal.draw_longitudinal(document=ezdxf.new(), one_bar=True)
+    spaced_bar_horizontal.draw_transverse(document=ezdxf.new())
+    assert len(bars._bars) <= kept + 2
+
+    with pytest.raises(IndexError):
+        bars[34]
+
+
 def test_draw_longitudinal_spaced_bars_horizontal(spaced_bar_horizontal):
     doc = ezdxf.new(setup=True)
     ex_01 = spaced_bar_horizontal.draw_longitudinal(document=doc, x=2, y=1, unifilar=False, dimensions=True)
@@ -151,6 +184,61 @@ def test_draw_longitudinal_spaced_bars_horizontal(spaced_bar_horizontal):
     assert ex_04["bar_elements"][0]["denomination_elements"][0].dxf.insert == Vec3(12, -3.73, 0)  # Description text.
 
 
+def test_draw_longitudinal_spaced_bars_horizontal_as_blocks(spaced_bar_horizontal):
+    doc = ezdxf.new(setup=True)
+    ex_01 = spaced_bar_horizontal.draw_longitudinal(document=doc, x=2, y=1, unifilar=False, as_blocks=True)
+    ex_02 = spaced_bar_horizontal.draw_longitudinal(document=doc, x=9, y=1, unifilar=False, as_blocks=True)
+
+    # General.
+    assert len(ex_01["all_elements"]) == 37
+    assert len(ex_01["bar_elements"]) == 34
+    assert len(ex_01["dimension_elements"]) == 3
+
+    # Block references, one block for the bars and one for the bar with description.
+    inserts = [bar["block_elements"][0] for bar in ex_01["bar_elements"] + ex_02["bar_elements"]]
+    assert all(insert.dxftype() == "INSERT" for insert in inserts)
+    assert len({insert.dxf.name for insert in inserts}) == 2
+    assert len([block for block in doc.blocks if block.name.startswith("BAR_")]) == 2
+    assert ex_01["bar_elements"][0]["block_elements"][0].dxf.insert == Vec3(2, 1, 0)
+    assert ex_01["bar_elements"][-1]["block_elements"][0].dxf.insert.isclose(Vec3(2, 4.96, 0))
+    assert ex_02["bar_elements"][0]["block_elements"][0].dxf.insert == Vec3(9, 1, 0)
+
+    # Block content.
+    block = doc.blocks.get(ex_01["bar_elements"][0]["block_elements"][0].dxf.name)
+    assert len(block) == 4
+    assert block[0].dxf.start == Vec3(0, 0.01, 0)  # Top side start.
+    assert block[0].dxf.end == Vec3(6, 0.01, 0)  # Top side end.
+
+
+def test_draw_longitudinal_spaced_bars_horizontal_batch(spaced_bar_horizontal):
+    doc = ezdxf.new(setup=True)
+    ex_01 = spaced_bar_horizontal.draw_longitudinal(document=doc, x=2, y=1, unifilar=False, dimensions=True)
+    ex_02 = spaced_bar_horizontal.draw_longitudinal(document=doc, x=2, y=1, unifilar=False, dimensions=True,
+                                                    batch=True)
+    ex_03 = spaced_bar_horizontal.draw_longitudinal(document=doc, x=9, y=-5, unifilar=True, one_bar=True, batch=True)
+
+    # General.
+    assert len(ex_02["all_elements"]) == len(ex_01["all_elements"]) == 140
+    assert len(ex_02["bar_elements"]) == 34
+    assert len(ex_02["dimension_elements"]) == 3
+    assert len(ex_03["bar_elements"]) == 1
+
+    # Same drawing than bar by bar.
+    for entitie_01, entitie_02 in zip(ex_01["all_elements"], ex_02["all_elements"]):
+        assert entitie_01.dxftype() == entitie_02.dxftype()
+        if entitie_01.dxftype() == "LINE":
+            assert entitie_01.dxf.start.isclose(entitie_02.dxf.start)
+            assert entitie_01.dxf.end.isclose(entitie_02.dxf.end)
+
+    # Steel position.
+    assert ex_02["bar_elements"][-1]["steel_elements"][0].dxf.start.isclose(Vec3(2, 4.97, 0))  # Top side start.
+    assert ex_02["bar_elements"][-1]["steel_elements"][0].dxf.end.isclose(Vec3(8, 4.97, 0))  # Top side end.
+    assert ex_03["bar_elements"][0]["steel_elements"][0].dxf.start.isclose(Vec3(9, -3.68, 0))  # Bar start.
+
+    # Description text.
+    assert ex_02["bar_elements"][11]["denomination_elements"][0].dxf.insert.isclose(Vec3(5.0, 2.28, 0))
+
+
 def test_draw_transverse_spaced_bars_horizontal(spaced_bar_horizontal):
     doc = ezdxf.new(setup=True)
     ex_01 = spaced_bar_horizontal.draw_transverse(document=doc, dimensions=True, x=0, y=0)
@@ -168,6 +256,28 @@ def test_draw_transverse_spaced_bars_horizontal(spaced_bar_horizontal):
     assert ex_01["bar_elements"][-1]["steel_elements"][0].dxf.center == Vec3(0.005, 4.165, 0)  # Last.
 
 
+def test_draw_transverse_spaced_bars_horizontal_batch(spaced_bar_horizontal):
+    doc = ezdxf.new(setup=True)
+    ex_01 = spaced_bar_horizontal.draw_transverse(document=doc, dimensions=True, x=0, y=0, batch=True,
+                                                  bar_displacements={1: (0.05, 0)})
+
+    # General.
+    assert len(ex_01["all_elements"]) == 39
+    assert len(ex_01["dimension_elements"]) == 1
+    assert len(ex_01["description_elements"]) == 4
+    assert len(ex_01["bar_elements"]) == 34
+
+    # Steel elements.
+    assert ex_01["bar_elements"][0]["steel_elements"][0].dxf.center.isclose(Vec3(0.005, 0.205, 0))  # First.
+    assert ex_01["bar_elements"][1]["steel_elements"][0].dxf.center.isclose(Vec3(0.055, 0.325, 0))  # Displaced.
+    assert ex_01["bar_elements"][-1]["steel_elements"][0].dxf.center.isclose(Vec3(0.005, 4.165, 0))  # Last.
+
+    # Description leaders.
+    assert ex_01["description_elements"][0].dxf.start.isclose(Vec3(0.005, 1.645, 0))
+    assert all(leader.dxf.end == ex_01["description_elements"][0].dxf.end
+               for leader in ex_01["description_elements"][:3])
+
+
 def test_extract_data_spaced_bars_horizontal(spaced_bar_horizontal):
     data = spaced_bar_horizontal.extract_data(labels=["diameter"])
     assert len(data) == 1